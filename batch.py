@@ -0,0 +1,266 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Headless batch processing of radiometric thermal images. Computes the
+temperature stats shown in the GUI for many images across a process
+pool and streams them out as CSV or JSON Lines, optionally exporting
+each image as well.
+"""
+
+
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from typing import Iterable, Iterator, Sequence, TextIO, Optional
+import itertools
+import argparse
+import glob
+import json
+import csv
+import sys
+import os
+
+from thermal_image import ThermalImage
+from thermal_stats import ThermalStats
+from thermal_export import EXPORT_FORMATS, export_image, unique_stem
+
+
+IMAGE_EXTENSIONS = (".jpeg", ".jpg", ".png", ".tif", ".tiff", ".raw")
+PERCENTILES = tuple(range(101))
+STATS_FIELDS = (
+    "file", "width", "height",
+    "max_c", "min_c", "avg_c",
+    "max_f", "min_f", "avg_f",
+    "max_k", "min_k", "avg_k",
+    "hotspot_x", "hotspot_y", "coldspot_x", "coldspot_y"
+)
+# Files in flight per worker
+QUEUE_DEPTH = 2
+
+
+def find_images(patterns: Iterable[str]) -> list[str]:
+    """
+    Expand directories, glob patterns, and file paths into a sorted
+    list of image files.
+    """
+
+    files = set()
+
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            paths = (os.path.join(pattern, name)
+                for name in os.listdir(pattern))
+        else:
+            paths = glob.glob(pattern, recursive=True)
+
+        files.update(
+            path for path in paths
+            if os.path.isfile(path)
+            and path.lower().endswith(IMAGE_EXTENSIONS)
+        )
+
+    return sorted(files)
+
+
+def image_stats(data: ThermalImage,
+        percentiles: Sequence[float] = PERCENTILES) -> dict:
+    """
+    Compute the max, min, and avg temperatures, the hotspot and
+    coldspot coordinates, and the Celsius percentiles of the image.
+    """
+
+    stats = ThermalStats.from_image(data)
+    result = {"file": data.file_path, "width": data.shape[1],
+        "height": data.shape[0]}
+
+    for unit in ("celsius", "fahrenheit", "kelvin"):
+        result[f"max_{unit[0]}"] = float(stats.max(unit))
+        result[f"min_{unit[0]}"] = float(stats.min(unit))
+        result[f"avg_{unit[0]}"] = float(stats.mean(unit))
+
+    # Frames without valid temperatures have no hotspot or coldspot
+    result["hotspot_x"], result["hotspot_y"] = stats.hotspot or (None, None)
+    result["coldspot_x"], result["coldspot_y"] = (stats.coldspot
+        or (None, None))
+
+    for q, value in zip(percentiles, stats.percentile(percentiles)):
+        result[f"p{q:g}"] = float(value)
+
+    return result
+
+
+def process_file(file_path: str,
+        percentiles: Sequence[float] = PERCENTILES,
+        dtype: str = "float64", export: Optional[str] = None,
+        export_formats: Sequence[str] = ("png",)) -> dict:
+    """
+    Load an image, compute its stats, and export it into the export
+    directory, if given. Errors are reported in the result instead of
+    raised, so one bad file does not stop a batch.
+    """
+
+    try:
+        data = ThermalImage(file_path, dtype)
+        result = image_stats(data, percentiles)
+
+        if export is not None:
+            name = os.path.splitext(os.path.basename(file_path))[0]
+            export_image(data, unique_stem(export, name), export_formats)
+
+        return result
+    except Exception as error:
+        message = f"{type(error).__name__}: {error}"
+        return {"file": file_path, "error": message}
+
+
+def process_files(files: Iterable[str], workers: Optional[int] = None,
+        percentiles: Sequence[float] = PERCENTILES,
+        dtype: str = "float64", export: Optional[str] = None,
+        export_formats: Sequence[str] = ("png",)) -> Iterator[dict]:
+    """
+    Process the files across a process pool, yielding results in
+    completion order. At most QUEUE_DEPTH files per worker are in
+    flight, so memory use does not grow with the number of files.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    capacity = workers * QUEUE_DEPTH
+    files = iter(files)
+    running = set()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while True:
+            for file_path in itertools.islice(files,
+                    capacity - len(running)):
+                running.add(executor.submit(process_file, file_path,
+                    percentiles, dtype, export, export_formats))
+
+            if not running:
+                return
+
+            done, running = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                yield future.result()
+
+
+def write_results(results: Iterable[dict], stream: TextIO, fmt: str,
+        percentiles: Sequence[float] = PERCENTILES) -> int:
+    """
+    Write the results to the stream as CSV or JSON Lines, flushing
+    after each row. Return the number of failed files.
+    """
+
+    failures = 0
+    writer = None
+
+    if fmt == "csv":
+        fieldnames = (*STATS_FIELDS, *(f"p{q:g}" for q in percentiles),
+            "error")
+        writer = csv.DictWriter(stream, fieldnames=fieldnames)
+        writer.writeheader()
+
+    for result in results:
+        failures += "error" in result
+
+        if writer is not None:
+            writer.writerow(result)
+        else:
+            stream.write(json.dumps(result) + "\n")
+
+        stream.flush()
+
+    return failures
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse the command-line arguments."""
+
+    parser = argparse.ArgumentParser(
+        description="Compute temperature stats for radiometric thermal "
+            "images without the GUI."
+    )
+    parser.add_argument(
+        "inputs", nargs="+",
+        help="image files, directories, or glob patterns"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="output file (default: standard output)"
+    )
+    parser.add_argument(
+        "-f", "--format", choices=("csv", "jsonl"), default="jsonl",
+        help="output format (default: jsonl)"
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="number of worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "-p", "--percentiles", type=float, nargs="*", default=PERCENTILES,
+        help="Celsius percentiles to report (default: 0 to 100)"
+    )
+    parser.add_argument(
+        "-c", "--cache", metavar="DIR",
+        help="cache decoded data in this directory"
+    )
+    parser.add_argument(
+        "-d", "--dtype", choices=("float64", "float32", "float16"),
+        default="float64",
+        help="temperature array dtype (default: float64)"
+    )
+    parser.add_argument(
+        "-e", "--export", metavar="DIR",
+        help="also export each image into this directory"
+    )
+    parser.add_argument(
+        "--export-formats", nargs="+", choices=tuple(EXPORT_FORMATS),
+        default=("png",),
+        help="export formats (default: png)"
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+
+    # Worker processes inherit the environment
+    if args.cache:
+        os.environ["THERMIMPRO_CACHE_DIR"] = args.cache
+
+    files = find_images(args.inputs)
+
+    if not files:
+        print("No images found", file=sys.stderr)
+        return 1
+
+    results = process_files(files, args.workers, args.percentiles,
+        args.dtype, args.export, args.export_formats)
+
+    if args.output == "-":
+        failures = write_results(results, sys.stdout, args.format,
+            args.percentiles)
+    else:
+        with open(args.output, "w", newline="", encoding="utf-8") as stream:
+            failures = write_results(results, stream, args.format,
+                args.percentiles)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Benchmarks of the load, convert, analyse, and render pipeline on the
+bundled samples and on synthetic frames up to 4K. Records the run time,
+throughput, and peak memory of each case as JSON, and optionally
+compares them against a report recorded earlier on the same machine.
+"""
+
+
+from dataclasses import dataclass
+from typing import Callable, Iterator, Optional, Sequence
+import statistics
+import tracemalloc
+import platform
+import argparse
+import shutil
+import time
+import json
+import sys
+import os
+
+import matplotlib
+
+# Rendering is measured headless
+matplotlib.use("Agg")
+
+import numpy as np
+import cv2
+
+from thermal_image import ThermalImage, to_kelvin
+from thermal_gui import ThermalGUI
+from exiftool_pool import EXIFTOOL
+
+
+# Sample folders next to this script, wherever it is run from
+SAMPLE_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+RADIOMETRIC_DIRECTORY = os.path.join(SAMPLE_DIRECTORY, "radiometric")
+RAW_16BIT_DIRECTORY = os.path.join(SAMPLE_DIRECTORY, "raw_16bit")
+SYNTHETIC_SIZES = {
+    "vga": (480, 640),
+    "hd": (720, 1280),
+    "fhd": (1080, 1920),
+    "4k": (2160, 3840)
+}
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.25
+
+
+@dataclass
+class Case:
+    """A benchmark case: one pipeline stage on one input."""
+
+    stage: str
+    source: str
+    run: Callable[[], object]
+    pixels: int
+    requires_exiftool: bool = False
+
+    @property
+    def name(self) -> str:
+        return f"{self.stage}/{self.source}"
+
+
+def _extractor(file_path: str, native: bool) -> Callable[[], ThermalImage]:
+    """
+    Return a function that prepares a fresh image for extraction from
+    the file, through the native reader or through ExifTool.
+    """
+
+    def prepare() -> ThermalImage:
+        data = ThermalImage.__new__(ThermalImage)
+        data.file_path = file_path
+        data._exiftool_data = None
+        data._reader = data._open_reader() if native else None
+
+        return data
+
+    return prepare
+
+
+def _extraction_cases(file_path: str) -> Iterator[Case]:
+    """Yield the raw data and metadata extraction cases of a file."""
+
+    source = os.path.basename(file_path)
+    pixels = ThermalImage(file_path).raw.size
+
+    for native in (True, False):
+        prepare = _extractor(file_path, native)
+        suffix = "" if native else "[exiftool]"
+
+        def extract_metadata(prepare=prepare) -> None:
+            prepare()._extract_metadata()
+
+        yield Case(
+            stage="extract_raw_data" + suffix, source=source, pixels=pixels,
+            run=lambda prepare=prepare: prepare()._extract_raw_data(),
+            requires_exiftool=not native
+        )
+        yield Case(
+            stage="extract_metadata" + suffix, source=source, pixels=pixels,
+            run=extract_metadata, requires_exiftool=not native
+        )
+
+
+def _pipeline_cases(source: str, data: ThermalImage,
+        gui: ThermalGUI) -> Iterator[Case]:
+    """
+    Yield the conversion, stats, and display cases of a decoded image.
+    """
+
+    def set_data() -> None:
+        gui._set_data(data)
+
+    def update_display() -> None:
+        gui._set_data(data)
+        gui._update_display()
+
+    yield Case("to_kelvin", source, lambda: to_kelvin(data.raw, data.mdata),
+        data.raw.size)
+    yield Case("set_data", source, set_data, data.raw.size)
+    yield Case("update_display", source, update_display, data.raw.size)
+
+
+def build_cases(sizes: Sequence[str] = tuple(SYNTHETIC_SIZES)) -> list[Case]:
+    """
+    Build the cases for the bundled samples and the synthetic frames.
+    Raw 16-bit samples and synthetic frames use the metadata of the
+    first radiometric sample.
+    """
+
+    gui = ThermalGUI()
+    cases = []
+
+    radiometric = sorted(
+        os.path.join(RADIOMETRIC_DIRECTORY, name)
+        for name in os.listdir(RADIOMETRIC_DIRECTORY)
+    )
+    images = {}
+
+    for file_path in radiometric:
+        cases.extend(_extraction_cases(file_path))
+
+        data = ThermalImage(file_path)
+        images[os.path.splitext(os.path.basename(file_path))[0]] = data
+        cases.extend(_pipeline_cases(os.path.basename(file_path), data, gui))
+
+    reference = next(iter(images.values()))
+
+    for name in sorted(os.listdir(RAW_16BIT_DIRECTORY)):
+        raw = cv2.imread(os.path.join(RAW_16BIT_DIRECTORY, name),
+            cv2.IMREAD_UNCHANGED)
+        metadata = images.get(os.path.splitext(name)[0], reference).metadata
+        data = ThermalImage.from_raw(raw, metadata, name)
+
+        cases.extend(_pipeline_cases(f"raw_16bit/{name}", data, gui))
+
+    generator = np.random.default_rng(seed=0)
+    low, high = int(reference.raw.min()), int(reference.raw.max())
+
+    for size in sizes:
+        raw = generator.integers(low, high, size=SYNTHETIC_SIZES[size],
+            dtype=np.uint16, endpoint=True)
+        data = ThermalImage.from_raw(raw, reference.metadata, size)
+
+        cases.extend(_pipeline_cases(f"synthetic/{size}", data, gui))
+
+    return cases
+
+
+def measure(run: Callable[[], object], repeat: int) -> dict[str, float]:
+    """
+    Return the median and minimum run time over the repeats, after one
+    warm-up run, and the peak memory allocated during a separate run.
+    """
+
+    run()
+    times = []
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"seconds": statistics.median(times), "min_seconds": min(times),
+        "peak_bytes": peak}
+
+
+def run_cases(cases: Sequence[Case], repeat: int = DEFAULT_REPEAT,
+        pattern: Optional[str] = None) -> dict:
+    """
+    Run the cases matching the pattern and return the report. Cases
+    requiring ExifTool are skipped if it is not installed.
+    """
+
+    has_exiftool = shutil.which(EXIFTOOL) is not None
+    report = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "results": {},
+        "skipped": []
+    }
+
+    for case in cases:
+        if pattern is not None and pattern not in case.name:
+            continue
+
+        if case.requires_exiftool and not has_exiftool:
+            report["skipped"].append(case.name)
+            continue
+
+        result = measure(case.run, repeat)
+        result.update(stage=case.stage, source=case.source,
+            pixels=case.pixels,
+            mpixels_per_second=case.pixels / result["seconds"] / 1e6)
+
+        report["results"][case.name] = result
+        print(f"{case.name:<48} {result['seconds']*1e3:10.2f} ms "
+            f"{result['mpixels_per_second']:10.1f} MP/s "
+            f"{result['peak_bytes']/(1<<20):10.1f} MiB", file=sys.stderr)
+
+    return report
+
+
+def compare(report: dict, baseline: dict,
+        tolerance: float = DEFAULT_TOLERANCE) -> list[str]:
+    """
+    Return the regressions of the report against the baseline: cases
+    slower, or peaking at more memory, by more than the tolerance.
+    """
+
+    regressions = []
+
+    for name, result in report["results"].items():
+        if (reference := baseline.get("results", {}).get(name)) is None:
+            continue
+
+        for key, label in (("seconds", "time"), ("peak_bytes", "memory")):
+            ratio = result[key] / max(reference[key], 1e-12)
+
+            if ratio > 1.0 + tolerance:
+                regressions.append(f"{name}: {label} {ratio:.2f}x baseline")
+
+    return regressions
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse the command-line arguments."""
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark the ThermImPro processing pipeline."
+    )
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="JSON report file (default: standard output)"
+    )
+    parser.add_argument(
+        "-b", "--baseline",
+        help="baseline JSON report to compare against"
+    )
+    parser.add_argument(
+        "-t", "--tolerance", type=float, default=DEFAULT_TOLERANCE,
+        help="allowed slowdown or memory growth as a fraction "
+            "(default: 0.25)"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=DEFAULT_REPEAT,
+        help="timed runs per case (default: 5)"
+    )
+    parser.add_argument(
+        "-k", "--filter", metavar="PATTERN",
+        help="only run cases whose name contains the pattern"
+    )
+    parser.add_argument(
+        "-s", "--sizes", nargs="*", choices=tuple(SYNTHETIC_SIZES),
+        default=tuple(SYNTHETIC_SIZES),
+        help="synthetic frame sizes (default: all)"
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+
+    report = run_cases(build_cases(args.sizes), args.repeat, args.filter)
+
+    if args.output == "-":
+        json.dump(report, sys.stdout, indent=4)
+        print()
+    else:
+        with open(args.output, "w", encoding="utf-8") as stream:
+            json.dump(report, stream, indent=4)
+
+    if report["skipped"]:
+        print(f"Skipped {len(report['skipped'])} cases without ExifTool",
+            file=sys.stderr)
+
+    if args.baseline is None:
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as stream:
+        regressions = compare(report, json.load(stream), args.tolerance)
+
+    for regression in regressions:
+        print(f"Regression: {regression}", file=sys.stderr)
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
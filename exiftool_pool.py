@@ -0,0 +1,330 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Pool of persistent ExifTool processes driven through the -stay_open
+argument file interface, so that each request costs a pipe round trip
+instead of a Perl interpreter startup.
+"""
+
+
+from typing import Self, Optional
+import subprocess
+import threading
+import itertools
+import warnings
+import atexit
+import time
+import os
+
+
+EXIFTOOL = "exiftool"
+DEFAULT_POOL_SIZE = 1
+SHUTDOWN_TIMEOUT = 5.0
+# Seconds to wait for the response to a request
+REQUEST_TIMEOUT = 60.0
+READ_SIZE = 65536
+# Bytes at the end of the output searched for the ready marker and the
+# line break after it
+TAIL_SIZE = 16
+
+
+class StreamReader:
+    """
+    Reads a pipe into a buffer on a daemon thread, so that a process
+    never blocks on one full output pipe while the other is awaited.
+    """
+
+    def __init__(self: Self, stream) -> None:
+        """Initialize a StreamReader instance and start its thread."""
+
+        self.buffer = bytearray()
+        self.closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, args=(stream,),
+            name="exiftool-reader", daemon=True)
+        self._thread.start()
+
+    def _run(self: Self, stream) -> None:
+        """Append everything read from the stream to the buffer."""
+
+        fd = stream.fileno()
+
+        while True:
+            try:
+                chunk = os.read(fd, READ_SIZE)
+            except OSError:
+                chunk = b""
+
+            with self._condition:
+                if chunk:
+                    self.buffer += chunk
+                else:
+                    self.closed = True
+
+                self._condition.notify_all()
+
+            if not chunk:
+                return
+
+    def read_until(self: Self, ready: bytes, deadline: float) -> bytes:
+        """
+        Remove and return the buffered output up to and excluding the
+        ready marker. Only the tail of the buffer is searched for the
+        marker, so long outputs are scanned once. Raise EOFError if the
+        stream closes first, or TimeoutError at the monotonic deadline.
+        """
+
+        with self._condition:
+            while True:
+                tail = bytes(self.buffer[-(len(ready) + TAIL_SIZE):])
+                end = tail.rstrip()
+
+                if end.endswith(ready):
+                    size = (len(self.buffer) - (len(tail) - len(end))
+                        - len(ready))
+                    output = bytes(self.buffer[:size])
+                    del self.buffer[:]
+
+                    return output
+
+                if self.closed:
+                    raise EOFError
+
+                remaining = deadline - time.monotonic()
+
+                if remaining <= 0.0:
+                    raise TimeoutError
+
+                self._condition.wait(remaining)
+
+    def join(self: Self) -> None:
+        """Wait for the thread to reach the end of the stream."""
+
+        self._thread.join(timeout=SHUTDOWN_TIMEOUT)
+
+
+class ExifToolWorker:
+    """
+    A single long-lived ExifTool process. Requests are framed with
+    numbered -execute arguments and serialized by a per-worker lock.
+    Both output streams are read on their own threads, and a request
+    without a response within the timeout kills the process.
+    """
+
+    def __init__(self: Self, executable: str = EXIFTOOL,
+            timeout: float = REQUEST_TIMEOUT) -> None:
+        """Initialize an ExifToolWorker instance."""
+
+        self.executable = executable
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self._process: Optional[subprocess.Popen] = None
+        self._readers: tuple[StreamReader, ...] = ()
+        self._counter = itertools.count(1)
+
+    @property
+    def running(self: Self) -> bool:
+        """Whether the ExifTool process is alive."""
+
+        return self._process is not None and self._process.poll() is None
+
+    def start(self: Self) -> None:
+        """Start the ExifTool process."""
+
+        try:
+            self._process = subprocess.Popen(
+                args=[self.executable, "-stay_open", "True", "-@", "-"],
+                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE
+            )
+        except FileNotFoundError:
+            raise RuntimeError("ExifTool not installed or missing from PATH")
+
+        self._readers = (StreamReader(self._process.stdout),
+            StreamReader(self._process.stderr))
+
+    def execute(self: Self, *args: str) -> bytes:
+        """
+        Run ExifTool with the arguments and return its output. A crashed
+        process is restarted and the request retried once. Arguments
+        are sent one per line, so they must not contain line breaks.
+        """
+
+        if any("\n" in arg or "\r" in arg for arg in args):
+            raise ValueError("ExifTool arguments must not contain line "
+                "breaks")
+
+        with self.lock:
+            for attempt in range(2):
+                if not self.running:
+                    self.start()
+
+                try:
+                    return self._request(args)
+                except (BrokenPipeError, EOFError):
+                    self._kill()
+
+                    if attempt:
+                        raise RuntimeError("ExifTool process terminated")
+                except TimeoutError:
+                    self._kill()
+                    raise RuntimeError("ExifTool did not respond in time")
+
+    def _request(self: Self, args: tuple[str, ...]) -> bytes:
+        """Send one framed request and read its framed response."""
+
+        number = next(self._counter)
+        ready = b"{ready%d}" % number
+
+        command = "\n".join((*args, "-echo4", "{ready%d}" % number,
+            "-execute%d" % number, ""))
+        self._process.stdin.write(command.encode())
+        self._process.stdin.flush()
+
+        deadline = time.monotonic() + self.timeout
+        stdout = self._readers[0].read_until(ready, deadline)
+        stderr = self._readers[1].read_until(ready, deadline)
+
+        if b"Error" in stderr:
+            raise RuntimeError("ExifTool failed to process the file")
+
+        return stdout
+
+    def close(self: Self) -> None:
+        """Ask the ExifTool process to exit, killing it on timeout."""
+
+        with self.lock:
+            if not self.running:
+                self._kill()
+                return
+
+            try:
+                self._process.stdin.write(b"-stay_open\nFalse\n")
+                self._process.stdin.flush()
+                self._process.wait(timeout=SHUTDOWN_TIMEOUT)
+            except (BrokenPipeError, subprocess.TimeoutExpired):
+                pass
+
+            self._kill()
+
+    def _kill(self: Self) -> None:
+        """Kill the ExifTool process and release its pipes."""
+
+        if self._process is None:
+            return
+
+        if self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+
+        # The readers stop at the end of the pipes, before they close
+        for reader in self._readers:
+            reader.join()
+
+        for stream in (self._process.stdin, self._process.stdout,
+                self._process.stderr):
+            stream.close()
+
+        self._process = None
+        self._readers = ()
+
+
+class ExifToolPool:
+    """
+    A fixed-size pool of ExifTool workers. Requests go to an idle
+    worker when there is one, or queue on the next worker in turn.
+    """
+
+    def __init__(self: Self, size: int = DEFAULT_POOL_SIZE,
+            executable: str = EXIFTOOL,
+            timeout: float = REQUEST_TIMEOUT) -> None:
+        """Initialize an ExifToolPool instance."""
+
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.workers = [ExifToolWorker(executable, timeout)
+            for _ in range(size)]
+        self._turn = itertools.cycle(self.workers)
+
+    def execute(self: Self, *args: str) -> bytes:
+        """Run ExifTool with the arguments on a pool worker."""
+
+        for worker in self.workers:
+            if not worker.lock.locked():
+                return worker.execute(*args)
+
+        return next(self._turn).execute(*args)
+
+    def close(self: Self) -> None:
+        """Shut down all workers."""
+
+        for worker in self.workers:
+            worker.close()
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *_: object) -> None:
+        self.close()
+
+
+_pool: Optional[ExifToolPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> ExifToolPool:
+    """
+    Return the shared ExifTool pool, creating it on first use. The size
+    is read from the THERMIMPRO_EXIFTOOL_WORKERS environment variable,
+    falling back to the default with a warning if it is not a positive
+    integer.
+    """
+
+    global _pool
+
+    with _pool_lock:
+        if _pool is None:
+            value = os.environ.get("THERMIMPRO_EXIFTOOL_WORKERS", "")
+
+            try:
+                size = int(value) if value.strip() else DEFAULT_POOL_SIZE
+            except ValueError:
+                size = 0
+
+            if size < 1:
+                warnings.warn(f"Invalid THERMIMPRO_EXIFTOOL_WORKERS "
+                    f"{value!r}, defaulting to {DEFAULT_POOL_SIZE}",
+                    RuntimeWarning)
+                size = DEFAULT_POOL_SIZE
+
+            _pool = ExifToolPool(size)
+
+        return _pool
+
+
+@atexit.register
+def close_pool() -> None:
+    """Shut down the shared ExifTool pool."""
+
+    global _pool
+
+    with _pool_lock:
+        if _pool is not None:
+            _pool.close()
+            _pool = None
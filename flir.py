@@ -0,0 +1,291 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Native reader for FLIR FFF records embedded in radiometric JPEG images.
+Extracts the raw thermal image and the camera info parameters without
+ExifTool.
+"""
+
+
+from typing import Self, Optional
+import struct
+
+import numpy as np
+
+from thermal_trace import stage
+
+
+FFF_SIGNATURE = b"FFF\x00"
+FLIR_SIGNATURE = b"FLIR\x00"
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+APP1_MARKER = 0xE1
+SOS_MARKER = 0xDA
+EOI_MARKER = 0xD9
+# Markers without a length field (TEM, RST0-RST7, SOI)
+STANDALONE_MARKERS = {0x01, *range(0xD0, 0xD9)}
+
+RAW_DATA_RECORD = 0x01
+CAMERA_INFO_RECORD = 0x20
+DIRECTORY_ENTRY_SIZE = 32
+RAW_DATA_OFFSET = 32
+
+# Camera info fields: ExifTool tag name, byte offset, and struct format
+CAMERA_INFO_FIELDS = {
+    "Emissivity": (0x20, "f"),
+    "Object Distance": (0x24, "f"),
+    "Reflected Apparent Temperature": (0x28, "f"),
+    "Atmospheric Temperature": (0x2C, "f"),
+    "Relative Humidity": (0x3C, "f"),
+    "Planck R1": (0x58, "f"),
+    "Planck B": (0x5C, "f"),
+    "Planck F": (0x60, "f"),
+    "Atmospheric Trans Alpha 1": (0x70, "f"),
+    "Atmospheric Trans Alpha 2": (0x74, "f"),
+    "Atmospheric Trans Beta 1": (0x78, "f"),
+    "Atmospheric Trans Beta 2": (0x7C, "f"),
+    "Atmospheric Trans X": (0x80, "f"),
+    "Planck O": (0x308, "i"),
+    "Planck R2": (0x30C, "f")
+}
+KELVIN_FIELDS = {"Reflected Apparent Temperature", "Atmospheric Temperature"}
+
+
+class FFFReader:
+    """
+    Reads the records of a FLIR FFF file, either embedded in the APP1
+    segments of a radiometric JPEG or stored standalone.
+    """
+
+    def __init__(self: Self, data: bytes) -> None:
+        """
+        Initialize an FFFReader instance from the FFF data and index
+        its record directory.
+        """
+
+        if data[:4] != FFF_SIGNATURE:
+            raise ValueError("No FLIR FFF data found")
+
+        self.data = data
+        self.size = 0
+        self.records = self._read_directory()
+
+    @classmethod
+    def from_file(cls: type[Self], file_path: str) -> Self:
+        """Create an FFFReader from a radiometric JPEG or FFF file."""
+
+        with open(file_path, "rb") as file:
+            data = file.read()
+
+        if data[:4] == FFF_SIGNATURE:
+            return cls(data)
+
+        return cls(extract_fff(data))
+
+    def _read_directory(self: Self) -> dict[int, tuple[int, int]]:
+        """
+        Read the record directory into a mapping of record type to
+        record offset and length.
+        """
+
+        if len(self.data) < 0x20:
+            raise ValueError("Truncated FLIR FFF header")
+
+        # Versions 100-199 are big-endian, anything else is swapped
+        byte_order = ">"
+        version = struct.unpack_from(">I", self.data, 0x14)[0]
+
+        if not 100 <= version < 200:
+            byte_order = "<"
+
+        offset, count = struct.unpack_from(byte_order + "II", self.data, 0x18)
+        records = {}
+        # End of the FFF data, which may be followed by further frames
+        self.size = offset + count*DIRECTORY_ENTRY_SIZE
+
+        for index in range(count):
+            position = offset + index*DIRECTORY_ENTRY_SIZE
+
+            if position + DIRECTORY_ENTRY_SIZE > len(self.data):
+                raise ValueError("Truncated FLIR FFF record directory")
+
+            record_type = struct.unpack_from(byte_order + "H", self.data,
+                position)[0]
+            record_offset, record_length = struct.unpack_from(
+                byte_order + "II", self.data, position + 0x0C
+            )
+
+            if record_type == 0:
+                continue
+            if record_offset + record_length > len(self.data):
+                raise ValueError("Truncated FLIR FFF record")
+
+            self.size = max(self.size, record_offset + record_length)
+
+            if record_type in records:
+                continue
+
+            records[record_type] = record_offset, record_length
+
+        return records
+
+    def _record(self: Self, record_type: int) -> tuple[memoryview, str]:
+        """Return the data and byte order of the record."""
+
+        if record_type not in self.records:
+            raise ValueError(f"FLIR record 0x{record_type:02x} not found")
+
+        offset, length = self.records[record_type]
+        record = memoryview(self.data)[offset:offset+length]
+
+        # Records are big-endian unless the leading word says otherwise
+        byte_order = ">"
+
+        if struct.unpack_from(">H", record)[0] >= 0x100:
+            byte_order = "<"
+
+        return record, byte_order
+
+    def raw_thermal_image(self: Self) -> np.ndarray:
+        """
+        Read the raw thermal image as a 16-bit unsigned array. Byte
+        order is carried by the dtype.
+        """
+
+        record, byte_order = self._record(RAW_DATA_RECORD)
+        width, height = struct.unpack_from(byte_order + "HH", record, 2)
+        blob = record[RAW_DATA_OFFSET:]
+
+        if blob[:len(PNG_SIGNATURE)] == PNG_SIGNATURE:
+            raw_image = imdecode(blob)
+
+            if raw_image is None:
+                raise ValueError("No data decoded")
+            if raw_image.dtype != np.uint16:
+                raise ValueError("Invalid raw thermal image format")
+
+            # FLIR stores PNG samples in little-endian byte order
+            return raw_image.view(raw_image.dtype.newbyteorder())
+
+        if len(blob) < width*height*2:
+            # Compressed frames (e.g. JPEG-LS in CSQ files) are decoded
+            # only if the OpenCV build supports the codec
+            raw_image = imdecode(blob)
+
+            if raw_image is None or raw_image.dtype != np.uint16:
+                raise ValueError("Unsupported raw thermal image encoding")
+
+            return raw_image
+
+        raw_image = np.frombuffer(
+            buffer=blob, dtype=np.dtype(np.uint16).newbyteorder(byte_order),
+            count=width*height
+        )
+
+        return raw_image.reshape(height, width).astype(np.uint16)
+
+    def camera_info(self: Self) -> dict[str, float]:
+        """
+        Read the external and calibration parameters from the camera
+        info record, in the units used by ExifTool numeric output.
+        """
+
+        record, byte_order = self._record(CAMERA_INFO_RECORD)
+        metadata = {}
+
+        for key, (offset, fmt) in CAMERA_INFO_FIELDS.items():
+            if offset + 4 > len(record):
+                raise ValueError("Truncated FLIR camera info record")
+
+            value = struct.unpack_from(byte_order + fmt, record, offset)[0]
+            # Shortest representation of the 32-bit value
+            value = float(str(np.float32(value)))
+
+            if key in KELVIN_FIELDS:
+                value = round(value - 273.15, 6)
+            elif key == "Relative Humidity":
+                value = humidity_fraction(value)
+
+            metadata[key] = value
+
+        return metadata
+
+
+def humidity_fraction(value: float) -> float:
+    """
+    Return a relative humidity as a fraction, reading values above 2 as
+    percentages, as ExifTool does.
+    """
+
+    return value / 100.0 if value > 2.0 else value
+
+
+def imdecode(buffer: bytes | memoryview) -> Optional[np.ndarray]:
+    """
+    Decode an encoded image (PNG, TIFF, JPEG-LS, ...) with OpenCV,
+    keeping its bit depth. Return None if it cannot be decoded.
+    """
+
+    # OpenCV is imported on first use to keep the module light
+    import cv2
+
+    with stage("imdecode", size=len(buffer)):
+        return cv2.imdecode(
+            buf=np.frombuffer(buffer=buffer, dtype=np.uint8),
+            flags=cv2.IMREAD_UNCHANGED
+        )
+
+
+def extract_fff(data: bytes) -> bytes:
+    """
+    Reassemble the FFF data from the FLIR APP1 segments of a JPEG.
+    """
+
+    if data[:2] != b"\xff\xd8":
+        raise ValueError("Not a JPEG file")
+
+    segments = {}
+    position = 2
+
+    while position + 4 <= len(data):
+        if data[position] != 0xFF:
+            raise ValueError("Invalid JPEG marker")
+
+        marker = data[position+1]
+
+        if marker == 0xFF:
+            position += 1
+            continue
+        if marker in STANDALONE_MARKERS:
+            position += 2
+            continue
+        if marker in (SOS_MARKER, EOI_MARKER):
+            break
+
+        length = struct.unpack_from(">H", data, position + 2)[0]
+        payload = data[position+4:position+2+length]
+
+        # FLIR segment header: signature, version, index, last index
+        if marker == APP1_MARKER and payload[:5] == FLIR_SIGNATURE:
+            segments[payload[6]] = payload[8:]
+
+        position += 2 + length
+
+    if not segments:
+        raise ValueError("No FLIR APP1 segments found")
+
+    return b"".join(segments[index] for index in sorted(segments))
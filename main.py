@@ -18,13 +18,27 @@
 """ThermImPro (Thermal Image Processing) main script."""
 
 
-import matplotlib.pyplot as plt
+import importlib
+import threading
 
-from thermal_gui import ThermalGUI
+from thermal_dialog import ask_file_path
 
 
 def main() -> None:
-    ThermalGUI.open_file()
+    # The GUI modules are imported while the file dialog is open
+    threading.Thread(
+        target=importlib.import_module, args=("thermal_gui",), daemon=True
+    ).start()
+
+    file_path = ask_file_path()
+
+    if not file_path:
+        return
+
+    import matplotlib.pyplot as plt
+    from thermal_gui import ThermalGUI
+
+    ThermalGUI.open_file(file_path=file_path)
     plt.show()
 
 
@@ -0,0 +1,272 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Reader for raw 16-bit thermal frames exported by other tools (PNG,
+TIFF, headerless .raw, or .npy) with their metadata in a JSON sidecar.
+Uncompressed files are memory-mapped, and byte order is handled by the
+array dtype instead of swapping bytes.
+"""
+
+
+from typing import Optional
+import struct
+import json
+import os
+
+import numpy as np
+
+from flir import imdecode
+
+
+RAW_EXTENSIONS = (".png", ".tif", ".tiff", ".raw", ".npy")
+SIDECAR_SUFFIX = ".json"
+# Sidecar shared by all frames in a folder
+SIDECAR_NAME = "metadata.json"
+# Suffix of raw data written by the export module
+EXPORT_SUFFIX = "_raw"
+
+# Byte order marks as used by TIFF, and the matching dtype prefixes
+BYTE_ORDERS = {"II": "<", "MM": ">"}
+
+TIFF_WIDTH = 256
+TIFF_HEIGHT = 257
+TIFF_BITS_PER_SAMPLE = 258
+TIFF_COMPRESSION = 259
+TIFF_STRIP_OFFSETS = 273
+TIFF_SAMPLES_PER_PIXEL = 277
+TIFF_STRIP_BYTE_COUNTS = 279
+# TIFF field types and their struct formats
+TIFF_TYPES = {3: "H", 4: "I"}
+
+
+def find_sidecar(file_path: str) -> Optional[str]:
+    """
+    Return the JSON sidecar of a raw frame: a file with the same name,
+    the sidecar of an export (for "name_raw.*" files), or a shared
+    metadata.json in the same folder. Return None if there is none or
+    the file is not a raw frame. Rendered images of an export share
+    their name with the export sidecar and are not raw frames.
+    """
+
+    stem, extension = os.path.splitext(file_path)
+
+    if extension.lower() not in RAW_EXTENSIONS:
+        return None
+    if _is_export_sidecar(stem + SIDECAR_SUFFIX):
+        return None
+
+    candidates = [stem + SIDECAR_SUFFIX]
+
+    if stem.endswith(EXPORT_SUFFIX):
+        candidates.append(stem[:-len(EXPORT_SUFFIX)] + SIDECAR_SUFFIX)
+
+    candidates.append(os.path.join(os.path.dirname(file_path), SIDECAR_NAME))
+
+    return next((path for path in candidates if os.path.isfile(path)), None)
+
+
+def _is_export_sidecar(path: str) -> bool:
+    """
+    Whether the file is a sidecar written by the export module, which
+    lists the exported files.
+    """
+
+    if not os.path.isfile(path):
+        return False
+
+    try:
+        with open(path, encoding="utf-8") as file:
+            sidecar = json.load(file)
+    except (OSError, ValueError):
+        return False
+
+    return isinstance(sidecar, dict) and "files" in sidecar
+
+
+def rendered_exports(directory: str) -> set[str]:
+    """
+    Return the paths of the files in the directory that exports wrote
+    without raw data (rendered images and temperature arrays), as
+    listed by their sidecars. They cannot be opened as thermal images.
+    """
+
+    exports = set()
+
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return exports
+
+    for name in names:
+        if not name.endswith(SIDECAR_SUFFIX):
+            continue
+
+        try:
+            with open(os.path.join(directory, name), encoding="utf-8") as file:
+                sidecar = json.load(file)
+        except (OSError, ValueError):
+            continue
+
+        if not isinstance(sidecar, dict) or "files" not in sidecar:
+            continue
+
+        exports.update(
+            os.path.join(directory, export) for export in sidecar["files"]
+            if not os.path.splitext(export)[0].endswith(EXPORT_SUFFIX)
+        )
+
+    return exports
+
+
+def read_sidecar(path: str) -> dict[str, object]:
+    """
+    Read a JSON sidecar into a flat dict keyed by tag names without
+    spaces (e.g. "PlanckR1"). Metadata nested under "metadata", as
+    written by the export module, is merged in.
+    """
+
+    with open(path, encoding="utf-8") as file:
+        sidecar = json.load(file)
+
+    if not isinstance(sidecar, dict):
+        raise ValueError("Invalid sidecar file")
+
+    values = dict(sidecar)
+    values.update(sidecar.get("metadata") or {})
+
+    return {key.replace(" ", ""): value for key, value in values.items()}
+
+
+def read_raw16(file_path: str, width: Optional[int] = None,
+        height: Optional[int] = None, byte_order: str = "II",
+        swap: bool = False) -> np.ndarray:
+    """
+    Read a raw 16-bit frame. Headerless .raw files need the width and
+    height, and are stored in the byte order ("II" little-endian, "MM"
+    big-endian). With swap set, the samples of other formats are read
+    in the opposite byte order, e.g. for PNGs extracted from FLIR files
+    with little-endian samples. Byte order is applied as a dtype view,
+    without copying.
+    """
+
+    extension = os.path.splitext(file_path)[1].lower()
+
+    if extension == ".raw":
+        if width is None or height is None:
+            raise ValueError("Headerless raw frames require width and height")
+        if byte_order not in BYTE_ORDERS:
+            raise ValueError(f"Unknown byte order: {byte_order}")
+
+        raw = np.memmap(file_path, dtype=BYTE_ORDERS[byte_order] + "u2",
+            mode="r", shape=(int(height), int(width)))
+    elif extension == ".npy":
+        raw = np.load(file_path, mmap_mode="r")
+    else:
+        raw = _map_tiff(file_path) if extension != ".png" else None
+
+        # Compressed images are decoded into memory
+        if raw is None:
+            with open(file_path, "rb") as file:
+                raw = imdecode(file.read())
+
+    if (raw is None or raw.ndim != 2 or raw.dtype.kind != "u"
+            or raw.dtype.itemsize != 2):
+        raise ValueError("Invalid raw thermal image format")
+
+    if swap and extension != ".raw":
+        raw = raw.view(raw.dtype.newbyteorder())
+
+    return raw.view(np.ndarray)
+
+
+def _map_tiff(file_path: str) -> Optional[np.ndarray]:
+    """
+    Memory-map an uncompressed single-channel 16-bit TIFF with its
+    strips stored contiguously. Return None for any other TIFF.
+    """
+
+    try:
+        tags, order = _read_tiff_tags(file_path)
+    except (struct.error, ValueError):
+        return None
+
+    try:
+        width, = tags[TIFF_WIDTH]
+        height, = tags[TIFF_HEIGHT]
+        offsets = tags[TIFF_STRIP_OFFSETS]
+        counts = tags[TIFF_STRIP_BYTE_COUNTS]
+    except (KeyError, ValueError):
+        return None
+
+    if (tags.get(TIFF_BITS_PER_SAMPLE, (1,)) != (16,)
+            or tags.get(TIFF_COMPRESSION, (1,)) != (1,)
+            or tags.get(TIFF_SAMPLES_PER_PIXEL, (1,)) != (1,)):
+        return None
+
+    contiguous = all(start + length == end for start, length, end
+        in zip(offsets, counts, offsets[1:]))
+
+    if not contiguous or sum(counts) < width*height*2:
+        return None
+
+    return np.memmap(file_path, dtype=order + "u2", mode="r",
+        offset=offsets[0], shape=(height, width))
+
+
+def _read_tiff_tags(
+        file_path: str) -> tuple[dict[int, tuple[int, ...]], str]:
+    """
+    Read the short and long tags of the first TIFF directory, and the
+    dtype prefix of the file byte order.
+    """
+
+    with open(file_path, "rb") as file:
+        header = file.read(8)
+        mark = header[:2].decode("latin-1")
+
+        if mark not in BYTE_ORDERS:
+            raise ValueError("Not a TIFF file")
+
+        order = BYTE_ORDERS[mark]
+        offset = struct.unpack_from(order + "I", header, 4)[0]
+
+        file.seek(offset)
+        count = struct.unpack(order + "H", file.read(2))[0]
+        entries = file.read(12*count)
+        tags = {}
+
+        for index in range(count):
+            tag, kind, number, _ = struct.unpack_from(order + "HHII",
+                entries, 12*index)
+
+            if kind not in TIFF_TYPES:
+                continue
+
+            fmt = order + str(number) + TIFF_TYPES[kind]
+            size = struct.calcsize(fmt)
+
+            # Values of up to four bytes are stored in the entry itself
+            if size <= 4:
+                tags[tag] = struct.unpack_from(fmt, entries, 12*index + 8)
+            else:
+                value_offset = struct.unpack_from(order + "I", entries,
+                    12*index + 8)[0]
+                file.seek(value_offset)
+                tags[tag] = struct.unpack(fmt, file.read(size))
+
+    return tags, order
@@ -0,0 +1,139 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Round trips and eviction of the decoded-data cache."""
+
+
+import shutil
+import os
+
+import numpy as np
+import pytest
+
+import thermal_cache
+from thermal_cache import ThermalCache, RAW_SUFFIX
+from thermal_image import ThermalImage
+
+
+def write(path, data):
+    with open(path, "wb") as file:
+        file.write(data)
+
+    return path
+
+
+def test_round_trip(tmp_path):
+    cache = ThermalCache(str(tmp_path / "cache"))
+    source = write(tmp_path / "a.bin", b"first")
+    raw = np.arange(12, dtype=np.uint16).reshape(3, 4)
+
+    assert cache.load(source) is None
+
+    cache.store(source, raw, {"Emissivity": 0.95})
+    loaded, metadata = cache.load(source)
+
+    np.testing.assert_array_equal(loaded, raw)
+    assert loaded.dtype == np.uint16
+    assert metadata == {"Emissivity": 0.95}
+
+
+def test_hit_does_not_read_the_file(tmp_path, monkeypatch):
+    cache = ThermalCache(str(tmp_path / "cache"))
+    source = str(write(tmp_path / "a.bin", b"first"))
+    cache.store(source, np.zeros((2, 2), dtype=np.uint16), {})
+
+    opened = []
+
+    def spy(path, *args, **kwargs):
+        opened.append(os.fspath(path))
+        return open(path, *args, **kwargs)
+
+    monkeypatch.setattr(thermal_cache, "open", spy, raising=False)
+
+    assert cache.load(source) is not None
+    assert opened and source not in opened
+
+
+def test_changed_and_copied_files(tmp_path):
+    cache = ThermalCache(str(tmp_path / "cache"))
+    source = write(tmp_path / "a.bin", b"first")
+    cache.store(source, np.zeros((2, 2), dtype=np.uint16), {})
+
+    # Same content under another name hits the same entry
+    copy = tmp_path / "b.bin"
+    shutil.copy(source, copy)
+    assert cache.load(copy) is not None
+
+    write(source, b"second")
+    os.utime(source, ns=(1, 1))
+    assert cache.load(source) is None
+
+
+def test_eviction_removes_least_recently_used(tmp_path):
+    cache = ThermalCache(str(tmp_path / "cache"))
+    raw = np.zeros((64, 64), dtype=np.uint16)
+    sources = [write(tmp_path / f"{index}.bin", bytes([index]))
+        for index in range(3)]
+
+    cache.store(sources[0], raw, {})
+    cache.store(sources[1], raw, {})
+    entry = os.path.getsize(os.path.join(cache.directory,
+        cache.digest(sources[0]) + RAW_SUFFIX))
+
+    # Make the first entry the most recently used, then overflow
+    older = os.path.join(cache.directory,
+        cache.digest(sources[1]) + RAW_SUFFIX)
+    os.utime(older, (0, 0))
+    cache.max_bytes = 2*entry + 100
+    cache.store(sources[2], raw, {})
+
+    assert cache.load(sources[0]) is not None
+    assert cache.load(sources[1]) is None
+    assert cache.load(sources[2]) is not None
+
+
+def test_clear(tmp_path):
+    cache = ThermalCache(str(tmp_path / "cache"))
+    source = write(tmp_path / "a.bin", b"first")
+    cache.store(source, np.zeros((2, 2), dtype=np.uint16), {})
+    cache.clear()
+
+    assert os.listdir(cache.directory) == []
+
+
+def test_shared_instance_and_invalid_limit(tmp_path, monkeypatch):
+    monkeypatch.setenv("THERMIMPRO_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("THERMIMPRO_CACHE_MAX_BYTES", "1GB")
+
+    with pytest.warns(RuntimeWarning):
+        cache = thermal_cache.get_cache()
+        again = thermal_cache.get_cache()
+
+    assert cache.max_bytes == thermal_cache.DEFAULT_MAX_BYTES
+    assert again is cache
+
+
+def test_image_round_trip(tmp_path, sample_path):
+    cache = ThermalCache(str(tmp_path / "cache"))
+    path = sample_path("radiometric", "koala.jpg")
+    first = ThermalImage(path, cache=cache)
+    second = ThermalImage(path, cache=cache)
+
+    assert isinstance(second.raw, np.memmap)
+    np.testing.assert_array_equal(second.raw, first.raw)
+    assert second.metadata == first.metadata
+    np.testing.assert_array_equal(second.celsius, first.celsius)
@@ -0,0 +1,99 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Exports, their sidecars, and the cleanup of failed exports."""
+
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+import thermal_export
+from thermal_export import export_image, unique_stem
+from thermal_image import ThermalImage
+
+
+@pytest.fixture
+def koala(sample_path):
+    return ThermalImage(sample_path("radiometric", "koala.jpg"))
+
+
+def test_export_and_reload(tmp_path, koala):
+    paths = export_image(koala, unique_stem(str(tmp_path), "koala"),
+        ("png", "raw_tiff", "temperature_npy"))
+
+    assert sorted(os.listdir(tmp_path)) == ["koala.json", "koala.png",
+        "koala_celsius.npy", "koala_raw.tiff"]
+    assert set(paths) == {str(tmp_path / name)
+        for name in os.listdir(tmp_path)}
+
+    with open(tmp_path / "koala.json", encoding="utf-8") as file:
+        sidecar = json.load(file)
+
+    assert sidecar["files"] == ["koala.png", "koala_raw.tiff",
+        "koala_celsius.npy"]
+
+    reloaded = ThermalImage(str(tmp_path / "koala_raw.tiff"))
+    np.testing.assert_array_equal(reloaded.celsius, koala.celsius)
+    np.testing.assert_array_equal(
+        np.load(tmp_path / "koala_celsius.npy"),
+        koala.celsius.astype(np.float32)
+    )
+
+
+def test_unique_stems(tmp_path):
+    first = unique_stem(str(tmp_path), "image")
+    second = unique_stem(str(tmp_path), "image")
+
+    assert first != second
+    assert os.path.getsize(first + ".json") == 0
+
+
+def test_failed_export_is_removed(tmp_path, koala, monkeypatch):
+    def fail(path, _):
+        with open(path, "wb") as file:
+            file.write(b"partial")
+
+        raise RuntimeError("Disk full")
+
+    monkeypatch.setattr(thermal_export, "write_image", fail)
+
+    with pytest.raises(RuntimeError):
+        export_image(koala, unique_stem(str(tmp_path), "koala"),
+            ("raw_npy", "png"))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_unknown_format_removes_the_reservation(tmp_path, koala):
+    with pytest.raises(ValueError):
+        export_image(koala, unique_stem(str(tmp_path), "koala"), ("gif",))
+
+    assert os.listdir(tmp_path) == []
+
+
+def test_failure_keeps_an_earlier_sidecar(tmp_path, koala, monkeypatch):
+    stem = unique_stem(str(tmp_path), "koala")
+    export_image(koala, stem, ("raw_npy",))
+    monkeypatch.setattr(np, "save", lambda *_: 1/0)
+
+    with pytest.raises(ZeroDivisionError):
+        export_image(koala, stem, ("raw_npy",))
+
+    assert os.listdir(tmp_path) == ["koala.json"]
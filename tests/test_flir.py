@@ -0,0 +1,74 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Native FLIR FFF reading against the raw data exported by ExifTool."""
+
+
+import cv2
+import numpy as np
+import pytest
+
+from conftest import SAMPLES
+from flir import FFFReader, extract_fff
+from thermal_image import ThermalImage, METADATA_KEYS
+
+
+RAW_FILES = {
+    "gray_brocket": "gray_brocket.tiff",
+    "green_iguana": "green_iguana.png",
+    "koala": "koala.png"
+}
+
+
+@pytest.mark.parametrize("name", SAMPLES)
+def test_raw_matches_exported(sample_path, name):
+    reader = FFFReader.from_file(sample_path("radiometric", f"{name}.jpg"))
+    expected = cv2.imread(sample_path("raw_16bit", RAW_FILES[name]),
+        cv2.IMREAD_UNCHANGED)
+    raw = reader.raw_thermal_image()
+
+    assert raw.shape == expected.shape
+    np.testing.assert_array_equal(raw, expected)
+
+
+@pytest.mark.parametrize("name", SAMPLES)
+def test_camera_info_is_complete(sample_path, name):
+    info = FFFReader.from_file(
+        sample_path("radiometric", f"{name}.jpg")
+    ).camera_info()
+
+    assert set(METADATA_KEYS) <= set(info)
+    assert 0.0 < info["Emissivity"] <= 1.0
+    assert 0.0 <= info["Relative Humidity"] <= 1.0
+
+
+def test_image_uses_native_reader(sample_path):
+    path = sample_path("radiometric", "koala.jpg")
+    data = ThermalImage(path)
+
+    np.testing.assert_array_equal(data.raw,
+        cv2.imread(sample_path("raw_16bit", "koala.png"),
+            cv2.IMREAD_UNCHANGED))
+
+
+def test_rejects_non_flir_data(sample_path):
+    with pytest.raises(ValueError):
+        FFFReader(b"JUNK" + bytes(64))
+
+    with open(sample_path("raw_16bit", "koala.png"), "rb") as file:
+        with pytest.raises(ValueError):
+            extract_fff(file.read())
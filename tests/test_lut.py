@@ -0,0 +1,65 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Lookup-table conversion against the direct Planck formula."""
+
+
+import numpy as np
+import pytest
+
+from conftest import SAMPLES
+from thermal_image import (ThermalImage, RANGE_16BIT, temperature_lut,
+    to_kelvin, from_kelvin, _build_lut, calibration_key)
+
+
+@pytest.mark.parametrize("name", SAMPLES)
+def test_kelvin_lut_matches_planck(sample_path, name):
+    m = ThermalImage(sample_path("radiometric", f"{name}.jpg")).mdata
+    direct = to_kelvin(np.arange(RANGE_16BIT), m)
+
+    np.testing.assert_array_equal(temperature_lut(m), direct)
+
+
+@pytest.mark.parametrize("unit", ["celsius", "fahrenheit"])
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_unit_lut_matches_conversion(sample_path, unit, dtype):
+    m = ThermalImage(sample_path("radiometric", "koala.jpg")).mdata
+    direct = from_kelvin(to_kelvin(np.arange(RANGE_16BIT), m), unit)
+    lut = temperature_lut(m, unit, dtype)
+
+    assert lut.dtype == dtype
+    np.testing.assert_array_equal(lut, direct.astype(dtype))
+
+
+def test_image_temperatures_match_planck(sample_path):
+    data = ThermalImage(sample_path("radiometric", "koala.jpg"))
+
+    np.testing.assert_array_equal(data.kelvin, to_kelvin(data.raw,
+        data.mdata))
+
+
+def test_tables_are_cached_once(sample_path):
+    m = ThermalImage(sample_path("radiometric", "koala.jpg")).mdata
+    _build_lut.cache_clear()
+
+    temperature_lut(m, "celsius")
+    temperature_lut(m, "kelvin")
+
+    assert _build_lut.cache_info().currsize == 2
+    assert not temperature_lut(m).flags.writeable
+    assert _build_lut(calibration_key(m), "kelvin",
+        "float64") is temperature_lut(m)
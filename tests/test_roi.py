@@ -0,0 +1,118 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Region statistics against direct slicing and masking."""
+
+
+import cv2
+import numpy as np
+import pytest
+
+from thermal_image import ThermalImage
+from thermal_roi import IntegralImage
+
+
+@pytest.fixture
+def image():
+    rng = np.random.default_rng(1)
+    image = rng.normal(30.0, 5.0, (90, 120))
+    image[rng.random(image.shape) < 0.1] = np.nan
+
+    return image
+
+
+RECTANGLES = [
+    (0, 0, 120, 90),
+    (10, 20, 50, 60),
+    (50, 60, 10, 20),
+    (-10, -10, 5, 5),
+    (100, 80, 200, 200),
+    (30, 30, 30, 40),
+    (200, 200, 300, 300)
+]
+POLYGONS = [
+    [(3, 3), (40, 5), (20, 30)],
+    [(10, 10), (100, 10), (100, 70), (10, 70)],
+    [(60, 5), (110, 40), (80, 85), (40, 50)],
+    [(-20, -20), (-5, -5), (-10, -2)],
+    [(0, 0), (119, 0), (119, 89)]
+]
+
+
+def reference(values):
+    values = values[~np.isnan(values)]
+
+    if not values.size:
+        return {"count": 0, "mean": np.nan, "std": np.nan, "min": np.nan,
+            "max": np.nan}
+
+    return {"count": values.size, "mean": values.mean(),
+        "std": values.std(), "min": values.min(), "max": values.max()}
+
+
+def check(stats, index, expected):
+    for key, values in stats.items():
+        np.testing.assert_allclose(values[index], expected[key],
+            rtol=1e-9, atol=1e-9, err_msg=key)
+
+
+@pytest.mark.parametrize("extrema", [False, True])
+def test_rectangles_match_slicing(image, extrema):
+    stats = IntegralImage(image).rectangle_stats(RECTANGLES, extrema)
+
+    assert ("min" in stats) == extrema and ("max" in stats) == extrema
+
+    for index, (x0, y0, x1, y1) in enumerate(RECTANGLES):
+        x0, x1 = sorted(np.clip((x0, x1), 0, image.shape[1]))
+        y0, y1 = sorted(np.clip((y0, y1), 0, image.shape[0]))
+        check(stats, index, reference(image[y0:y1, x0:x1]))
+
+
+def test_inverted_rectangles_are_normalized(image):
+    stats = IntegralImage(image).rectangle_stats(
+        [(5, 5, 1, 1), (1, 1, 5, 5)], extrema=True
+    )
+
+    for key in stats:
+        np.testing.assert_array_equal(stats[key][0], stats[key][1])
+
+
+def test_polygons_match_masking(image):
+    stats = IntegralImage(image).polygon_stats(POLYGONS)
+
+    for index, polygon in enumerate(POLYGONS):
+        mask = np.zeros(image.shape, dtype=np.uint8)
+        vertices = np.round(np.asarray(polygon, dtype=np.float64))
+        cv2.fillPoly(mask, [vertices.astype(np.int32)], 1)
+        check(stats, index, reference(image[mask.astype(bool)]))
+
+
+def test_no_polygons(image):
+    stats = IntegralImage(image).polygon_stats([])
+
+    assert all(len(values) == 0 for values in stats.values())
+
+
+def test_image_stats_in_unit(sample_path):
+    data = ThermalImage(sample_path("radiometric", "koala.jpg"))
+    stats = data.rectangle_stats([(10, 10, 60, 50)], "fahrenheit",
+        extrema=True)
+    region = data.fahrenheit[10:50, 10:60]
+
+    assert stats["max"][0] == pytest.approx(np.nanmax(region))
+    assert stats["mean"][0] == pytest.approx(np.nanmean(region))
+    assert stats["std"][0] == pytest.approx(np.nanstd(region))
@@ -0,0 +1,118 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Frame indexing of FLIR sequences, built from the sample FFF data."""
+
+
+import struct
+
+import numpy as np
+import pytest
+
+from flir import FFFReader, CAMERA_INFO_RECORD, DIRECTORY_ENTRY_SIZE
+from thermal_sequence import ThermalSequence
+from thermal_image import METADATA_KEYS
+
+
+def fff_data(sample_path, name):
+    return FFFReader.from_file(sample_path("radiometric", f"{name}.jpg")).data
+
+
+def without_camera_info(data):
+    """Return FFF data whose camera info record is marked unused."""
+
+    data = bytearray(data)
+    version = struct.unpack_from(">I", data, 0x14)[0]
+    byte_order = ">" if 100 <= version < 200 else "<"
+    offset, count = struct.unpack_from(byte_order + "II", data, 0x18)
+
+    for index in range(count):
+        position = offset + index*DIRECTORY_ENTRY_SIZE
+
+        if struct.unpack_from(byte_order + "H", data,
+                position)[0] == CAMERA_INFO_RECORD:
+            struct.pack_into(byte_order + "H", data, position, 0)
+
+    return bytes(data)
+
+
+@pytest.fixture
+def frames(sample_path):
+    koala = fff_data(sample_path, "koala")
+    brocket = fff_data(sample_path, "gray_brocket")
+
+    # The third frame inherits the metadata of the second
+    return [koala, brocket, without_camera_info(koala), koala]
+
+
+@pytest.fixture
+def sequence(tmp_path, frames):
+    path = tmp_path / "recording.seq"
+    # Frames are preceded by a header and separated by padding
+    path.write_bytes(b"SEQ header" + b"\0".join(frames))
+
+    with ThermalSequence(str(path)) as sequence:
+        yield sequence
+
+
+def test_frames_are_indexed(sequence, frames):
+    assert len(sequence) == len(frames)
+
+    for index, data in enumerate(frames):
+        np.testing.assert_array_equal(sequence.raw(index),
+            FFFReader(data).raw_thermal_image())
+
+
+def test_negative_and_out_of_range_indices(sequence, frames):
+    np.testing.assert_array_equal(sequence[-1].raw,
+        FFFReader(frames[-1]).raw_thermal_image())
+
+    with pytest.raises(IndexError):
+        sequence[len(frames)]
+
+
+def test_metadata_is_inherited(sequence, frames):
+    expected = [FFFReader(data).camera_info() for data in frames[:2]]
+    expected = [{key: info[key] for key in METADATA_KEYS}
+        for info in expected]
+    assert expected[0] != expected[1]
+
+    # Out of order access must not reuse a stale run
+    assert sequence.metadata(3) == expected[0]
+    assert sequence.metadata(2) == expected[1]
+    assert sequence.metadata(0) == expected[0]
+    assert sequence.metadata(1) == expected[1]
+    assert sequence.metadata(2) == expected[1]
+
+
+def test_images_and_stats(sequence):
+    images = list(sequence)
+    stats = dict(sequence.iter_stats())
+
+    assert [image.shape for image in images] == [(120, 160), (180, 240),
+        (120, 160), (120, 160)]
+    assert stats[1].max() == np.nanmax(images[1].celsius)
+    np.testing.assert_array_equal(images[2].celsius,
+        sequence.image(2).celsius)
+
+
+def test_no_frames(tmp_path):
+    path = tmp_path / "empty.seq"
+    path.write_bytes(b"no frames here")
+
+    with pytest.raises(ValueError):
+        ThermalSequence(str(path))
@@ -0,0 +1,85 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Histogram-based statistics against NumPy on the full arrays."""
+
+
+import numpy as np
+import pytest
+
+from conftest import SAMPLES
+from thermal_image import ThermalImage
+from thermal_stats import ThermalStats
+
+
+PERCENTILES = [0, 1, 5, 25, 50, 62.5, 75, 95, 99, 100]
+
+
+@pytest.fixture(params=SAMPLES)
+def image(request, sample_path):
+    return ThermalImage(sample_path("radiometric", f"{request.param}.jpg"))
+
+
+def check_stats(stats, celsius):
+    assert stats.count == np.count_nonzero(~np.isnan(celsius))
+    assert stats.max() == np.nanmax(celsius)
+    assert stats.min() == np.nanmin(celsius)
+    assert stats.mean() == pytest.approx(np.nanmean(celsius), rel=1e-12)
+    np.testing.assert_allclose(stats.percentile(PERCENTILES),
+        np.nanpercentile(celsius, PERCENTILES), rtol=1e-12)
+
+    x, y = stats.hotspot
+    assert celsius[y, x] == np.nanmax(celsius)
+    x, y = stats.coldspot
+    assert celsius[y, x] == np.nanmin(celsius)
+
+
+def test_raw_stats_match_numpy(image):
+    check_stats(ThermalStats.from_image(image), image.celsius)
+
+
+def test_units_match_numpy(image):
+    stats = ThermalStats.from_image(image)
+
+    assert stats.max("kelvin") == pytest.approx(np.nanmax(image.kelvin))
+    assert stats.mean("fahrenheit") == pytest.approx(
+        np.nanmean(image.fahrenheit)
+    )
+
+
+def test_per_pixel_stats_match_numpy(image):
+    height, width = image.shape
+    image.set_parameters(e=np.linspace(0.6, 1.0, width)[None, :]
+        .repeat(height, axis=0))
+
+    check_stats(ThermalStats.from_image(image), image.celsius)
+
+
+def test_invalid_pixels_are_ignored(image):
+    celsius = image.celsius.copy()
+    celsius[::3] = np.nan
+
+    check_stats(ThermalStats.from_temperatures(celsius), celsius)
+
+
+def test_no_valid_pixels():
+    stats = ThermalStats.from_temperatures(np.full((4, 5), np.nan))
+
+    assert stats.count == 0
+    assert np.isnan(stats.max()) and np.isnan(stats.mean())
+    assert np.isnan(stats.percentile(50))
+    assert stats.hotspot is None and stats.coldspot is None
@@ -0,0 +1,81 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Tiled Kelvin conversion against the untiled one."""
+
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import thermal_image
+from thermal_image import ThermalImage, to_kelvin, to_kelvin_tiled
+
+
+@pytest.fixture
+def koala(sample_path):
+    return ThermalImage(sample_path("radiometric", "koala.jpg"))
+
+
+@pytest.fixture(params=[False, True], ids=["serial", "threads"])
+def converter(request, monkeypatch):
+    if not request.param:
+        monkeypatch.setattr(thermal_image, "get_converter", lambda: None)
+        yield
+        return
+
+    with ThreadPoolExecutor(4) as executor:
+        monkeypatch.setattr(thermal_image, "get_converter",
+            lambda: executor)
+        yield
+
+
+@pytest.mark.parametrize("tile_pixels", [1, 1000, 4099, 1 << 16])
+def test_tiled_is_bit_identical(koala, converter, tile_pixels):
+    expected = to_kelvin(koala.raw, koala.mdata)
+    tiled = to_kelvin_tiled(koala.raw, koala.mdata,
+        tile_pixels=tile_pixels)
+
+    np.testing.assert_array_equal(tiled, expected)
+    assert np.isnan(tiled).sum() == np.isnan(expected).sum()
+
+
+@pytest.mark.parametrize("shape", ["full", "row", "column"])
+def test_tiled_parameter_maps(koala, converter, shape):
+    height, width = koala.shape
+    rng = np.random.default_rng(0)
+    size = {"full": (height, width), "row": (1, width),
+        "column": (height, 1)}[shape]
+    m = koala.mdata.replace(e=rng.uniform(0.5, 1.0, size),
+        od=rng.uniform(0.5, 20.0, size))
+
+    np.testing.assert_array_equal(
+        to_kelvin_tiled(koala.raw, m, tile_pixels=999),
+        to_kelvin(koala.raw, m)
+    )
+
+
+def test_tiled_output_array(koala, converter):
+    out = np.empty(koala.shape)
+
+    assert to_kelvin_tiled(koala.raw, koala.mdata, out, 1000) is out
+    np.testing.assert_array_equal(out, to_kelvin(koala.raw, koala.mdata))
+
+    with pytest.raises(ValueError):
+        to_kelvin_tiled(koala.raw, koala.mdata, np.empty(koala.shape,
+            dtype=np.float32))
@@ -0,0 +1,131 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""Ledger records and watcher resumption."""
+
+
+import os
+
+import pytest
+
+import thermal_watch
+from thermal_watch import Ledger, FolderWatcher, watch
+
+
+def fake_process(file_path, *_):
+    return {"file": file_path}
+
+
+@pytest.fixture
+def folder(tmp_path):
+    folder = tmp_path / "in"
+    folder.mkdir()
+
+    for name in ("a.jpg", "b.jpg", "notes.txt"):
+        (folder / name).write_bytes(name.encode())
+
+    return folder
+
+
+@pytest.fixture(autouse=True)
+def serial(monkeypatch):
+    """Run the watcher without worker processes."""
+
+    class Executor:
+        def __init__(self, max_workers):
+            pass
+
+        def submit(self, fn, *args):
+            future = thermal_watch.Future()
+            future.set_result(fn(*args))
+            return future
+
+        def shutdown(self, **_):
+            pass
+
+    monkeypatch.setattr(thermal_watch, "ProcessPoolExecutor", Executor)
+    monkeypatch.setattr(thermal_watch, "process_file", fake_process)
+
+
+def run(folder, ledger_path):
+    with Ledger(str(ledger_path)) as ledger:
+        watcher = FolderWatcher([str(folder)], ledger, settle=0.0)
+
+        return sorted(os.path.basename(result["file"]) for result in
+            watch(watcher, workers=1, interval=0.0, once=True))
+
+
+def test_resume_skips_processed_files(tmp_path, folder):
+    ledger = tmp_path / "ledger.jsonl"
+
+    assert run(folder, ledger) == ["a.jpg", "b.jpg"]
+    assert run(folder, ledger) == []
+
+    (folder / "c.jpg").write_bytes(b"new")
+    assert run(folder, ledger) == ["c.jpg"]
+
+
+def test_changed_files_are_processed_again(tmp_path, folder):
+    ledger = tmp_path / "ledger.jsonl"
+    run(folder, ledger)
+
+    (folder / "a.jpg").write_bytes(b"changed")
+    assert run(folder, ledger) == ["a.jpg"]
+
+
+def test_truncated_record_is_ignored(tmp_path, folder):
+    ledger = tmp_path / "ledger.jsonl"
+    run(folder, ledger)
+
+    with open(ledger, "a", encoding="utf-8") as file:
+        file.write('{"file": "cut sh')
+
+    with Ledger(str(ledger)) as records:
+        assert len(records.entries) == 2
+
+    assert run(folder, ledger) == []
+
+
+def test_errors_are_recorded(tmp_path):
+    path = str(tmp_path / "ledger.jsonl")
+
+    with Ledger(path) as ledger:
+        ledger.record("x.jpg", (1, 2), "ValueError: bad")
+
+    with Ledger(path) as ledger:
+        assert ("x.jpg", (1, 2)) in ledger
+        assert ("x.jpg", (1, 3)) not in ledger
+
+
+def test_export_directory_is_not_scanned(tmp_path, folder):
+    exports = folder / "exports"
+    exports.mkdir()
+    (exports / "a.png").write_bytes(b"export")
+
+    with Ledger(str(tmp_path / "ledger.jsonl")) as ledger:
+        watcher = FolderWatcher([str(folder)], ledger, settle=0.0,
+            recursive=True, exclude=[str(exports)])
+        files = dict(watcher._files())
+
+    assert sorted(map(os.path.basename, files)) == ["a.jpg", "b.jpg"]
+
+
+def test_watched_export_directory_is_rejected(tmp_path, folder):
+    argv = [str(folder), "--once", "--export", str(folder),
+        "--ledger", str(tmp_path / "ledger.jsonl")]
+
+    assert thermal_watch.main(argv) == 1
@@ -0,0 +1,271 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Content-addressed on-disk cache of decoded raw thermal data and
+metadata, so that reopening a file skips extraction entirely.
+"""
+
+
+from typing import Self, Optional
+import threading
+import warnings
+import hashlib
+import json
+import os
+
+import numpy as np
+
+
+DEFAULT_MAX_BYTES = 1 << 30
+HASH_CHUNK_SIZE = 1 << 20
+RAW_SUFFIX = ".npy"
+METADATA_SUFFIX = ".json"
+LINK_SUFFIX = ".link"
+
+
+class ThermalCache:
+    """
+    Stores the raw uint16 array of each file as a memory-mappable .npy
+    file next to its metadata as JSON. Entries are named by the file
+    content hash and evicted least recently used first once the cache
+    outgrows its size limit. Files are looked up by path, size and
+    modification time through small link files, so the content is only
+    hashed the first time a file version is seen.
+    """
+
+    def __init__(self: Self, directory: str,
+            max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        """Initialize a ThermalCache instance."""
+
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        os.makedirs(name=directory, exist_ok=True)
+
+    def key(self: Self, file_path: str) -> str:
+        """
+        Return the lookup key of the file, from its path, size and
+        modification time, without reading it.
+        """
+
+        stat = os.stat(file_path)
+        signature = (f"{os.path.abspath(file_path)}\0{stat.st_size}\0"
+            f"{stat.st_mtime_ns}")
+
+        return hashlib.sha256(signature.encode()).hexdigest()
+
+    def digest(self: Self, file_path: str) -> str:
+        """
+        Return the content hash of the file. It is hashed only if no
+        link of its current version exists, which is then written.
+        """
+
+        link_path = self._path(self.key(file_path), LINK_SUFFIX)
+
+        try:
+            with open(link_path, encoding="ascii") as file:
+                return file.read()
+        except OSError:
+            pass
+
+        content_hash = hashlib.sha256()
+
+        with open(file_path, "rb") as file:
+            while chunk := file.read(HASH_CHUNK_SIZE):
+                content_hash.update(chunk)
+
+        digest = content_hash.hexdigest()
+        self._write(link_path, digest.encode())
+
+        return digest
+
+    def _path(self: Self, name: str, suffix: str) -> str:
+        """Return the path of a cache file."""
+
+        return os.path.join(self.directory, name + suffix)
+
+    def _write(self: Self, path: str, data: bytes) -> None:
+        """
+        Write a file through a temporary file, so readers never see
+        partial contents.
+        """
+
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+        with open(temp_path, "wb") as file:
+            file.write(data)
+
+        os.replace(temp_path, path)
+
+    def load(self: Self,
+            file_path: str) -> Optional[tuple[np.ndarray, dict]]:
+        """
+        Return the memory-mapped raw data and the metadata of the file,
+        or None on a miss.
+        """
+
+        digest = self.digest(file_path)
+        raw_path = self._path(digest, RAW_SUFFIX)
+        metadata_path = self._path(digest, METADATA_SUFFIX)
+
+        try:
+            with open(metadata_path, encoding="utf-8") as file:
+                metadata = json.load(file)
+
+            raw = np.load(raw_path, mmap_mode="r")
+            # Mark the entry as recently used
+            os.utime(raw_path)
+        except (OSError, ValueError):
+            return None
+
+        return raw, metadata
+
+    def store(self: Self, file_path: str, raw: np.ndarray,
+            metadata: dict) -> None:
+        """
+        Store the entry of a file and evict old entries over the size
+        limit.
+        """
+
+        digest = self.digest(file_path)
+        suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+        raw_path = self._path(digest, RAW_SUFFIX)
+
+        # Concurrent writers of the same entry write the same data, and
+        # the metadata goes last since it marks a complete entry
+        with open(raw_path + suffix, "wb") as file:
+            np.save(file, np.ascontiguousarray(raw, dtype=np.uint16))
+
+        os.replace(raw_path + suffix, raw_path)
+        self._write(self._path(digest, METADATA_SUFFIX),
+            json.dumps(metadata).encode())
+
+        self._evict()
+
+    def _evict(self: Self) -> None:
+        """
+        Remove least recently used entries over the size limit, and
+        then the links to removed entries.
+        """
+
+        with self._lock:
+            entries = []
+            links = []
+            total = 0
+
+            with os.scandir(self.directory) as scan:
+                for item in scan:
+                    if item.name.endswith(LINK_SUFFIX):
+                        links.append(item.path)
+                        continue
+                    if not item.name.endswith(RAW_SUFFIX):
+                        continue
+
+                    digest = item.name[:-len(RAW_SUFFIX)]
+                    stat = item.stat()
+                    size = stat.st_size
+
+                    try:
+                        size += os.path.getsize(
+                            self._path(digest, METADATA_SUFFIX)
+                        )
+                    except OSError:
+                        pass
+
+                    entries.append((stat.st_mtime, size, digest))
+                    total += size
+
+            if total <= self.max_bytes:
+                return
+
+            kept = {digest for _, _, digest in entries}
+
+            for _, size, digest in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+
+                self.remove(digest)
+                kept.discard(digest)
+                total -= size
+
+            for link_path in links:
+                try:
+                    with open(link_path, encoding="ascii") as file:
+                        if file.read() not in kept:
+                            os.remove(link_path)
+                except OSError:
+                    pass
+
+    def remove(self: Self, digest: str) -> None:
+        """Remove an entry."""
+
+        for suffix in (METADATA_SUFFIX, RAW_SUFFIX):
+            try:
+                os.remove(self._path(digest, suffix))
+            except OSError:
+                pass
+
+    def clear(self: Self) -> None:
+        """Remove all entries and links."""
+
+        for name in os.listdir(self.directory):
+            if name.endswith(RAW_SUFFIX):
+                self.remove(name[:-len(RAW_SUFFIX)])
+            elif name.endswith(LINK_SUFFIX):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+
+# Caches by directory and size limit, shared by the threads of a process
+_caches: dict[tuple[str, int], ThermalCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_cache() -> Optional[ThermalCache]:
+    """
+    Return the cache configured by the THERMIMPRO_CACHE_DIR (and
+    optional THERMIMPRO_CACHE_MAX_BYTES) environment variables, or None
+    if caching is not enabled. An invalid size limit falls back to the
+    default with a warning. The same instance is returned for the same
+    configuration.
+    """
+
+    directory = os.environ.get("THERMIMPRO_CACHE_DIR")
+
+    if not directory:
+        return None
+
+    value = os.environ.get("THERMIMPRO_CACHE_MAX_BYTES", "")
+
+    try:
+        max_bytes = int(value) if value.strip() else DEFAULT_MAX_BYTES
+    except ValueError:
+        warnings.warn(f"Invalid THERMIMPRO_CACHE_MAX_BYTES {value!r}, "
+            f"defaulting to {DEFAULT_MAX_BYTES}", RuntimeWarning)
+        max_bytes = DEFAULT_MAX_BYTES
+
+    config = (os.path.abspath(directory), max_bytes)
+
+    with _caches_lock:
+        if config not in _caches:
+            _caches[config] = ThermalCache(*config)
+
+        return _caches[config]
@@ -0,0 +1,51 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Tk dialogs shared by the main script and the GUI. Only tkinter is
+imported, so the first dialog opens before the GUI modules are loaded.
+"""
+
+
+from tkinter import filedialog, messagebox
+import os
+
+
+FILE_TYPES = [
+    ("Image Files", "*.jpeg *.jpg *.png *.tif *.tiff *.raw"),
+    ("Sequence Files", "*.seq *.csq"),
+    ("Mosaic Files", "mosaic.json")
+]
+
+
+def ask_file_path() -> str:
+    """
+    Ask for an image or sequence file and return its absolute path, or
+    an empty string if the dialog was cancelled.
+    """
+
+    file_path = filedialog.askopenfilename(filetypes=FILE_TYPES)
+
+    return os.path.abspath(file_path) if file_path else ""
+
+
+def show_error(error: Exception) -> None:
+    """Show an error message box."""
+
+    messagebox.showerror(
+        title="ThermImPro", message=f"{type(error).__name__}: {error}."
+    )
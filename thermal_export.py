@@ -0,0 +1,227 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Export of rendered palette images and radiometric data (raw 16-bit
+values or float32 temperatures) with JSON metadata sidecars, either
+directly or through a background writer thread.
+"""
+
+
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Self, Optional, Sequence, TYPE_CHECKING
+from datetime import datetime
+import json
+import os
+
+import numpy as np
+
+from thermal_image import ThermalImage
+from thermal_stats import ThermalStats
+from thermal_trace import traced
+
+if TYPE_CHECKING:
+    from matplotlib.colors import Colormap
+
+
+# Export formats and their file name suffixes
+EXPORT_FORMATS = {
+    "png": ".png",
+    "raw_tiff": "_raw.tiff",
+    "raw_npy": "_raw.npy",
+    "temperature_tiff": "_{unit}.tiff",
+    "temperature_npy": "_{unit}.npy"
+}
+SIDECAR_SUFFIX = ".json"
+DEFAULT_CMAP = "inferno"
+DEFAULT_LIMITS = (1, 99)
+
+
+def unique_stem(directory: str, stem: Optional[str] = None) -> str:
+    """
+    Reserve and return a unique path stem in the directory by creating
+    its sidecar file empty. export_image fills it in, or removes it if
+    the export fails. The stem defaults to the current time with
+    microsecond resolution; a counter is appended on collisions.
+    """
+
+    os.makedirs(name=directory, exist_ok=True)
+
+    if stem is None:
+        stem = datetime.now().strftime("%Y%m%d%H%M%S%f")
+
+    path = os.path.join(directory, stem)
+    candidate = path
+    counter = 0
+
+    while True:
+        try:
+            with open(candidate + SIDECAR_SUFFIX, "x", encoding="utf-8"):
+                return candidate
+        except FileExistsError:
+            counter += 1
+            candidate = f"{path}_{counter}"
+
+
+def write_image(path: str, image: np.ndarray) -> None:
+    """
+    Write an image through OpenCV's encoders, chosen by the file
+    extension. RGB(A) images are converted to OpenCV's channel order.
+    """
+
+    # OpenCV is imported on first use to keep the module light
+    import cv2
+
+    if image.ndim == 3:
+        code = (cv2.COLOR_RGBA2BGRA if image.shape[2] == 4
+            else cv2.COLOR_RGB2BGR)
+        image = cv2.cvtColor(image, code)
+
+    if not cv2.imwrite(path, image):
+        raise RuntimeError(f"Failed to write {path}")
+
+
+def _remove_partial(paths: Sequence[str], sidecar_path: str) -> None:
+    """
+    Remove the files of a failed export, and its sidecar if it is still
+    the empty reservation made by unique_stem.
+    """
+
+    for path in (*paths, sidecar_path + ".tmp"):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    try:
+        if os.path.getsize(sidecar_path) == 0:
+            os.remove(sidecar_path)
+    except OSError:
+        pass
+
+
+@traced("export")
+def export_image(data: ThermalImage, stem: str,
+        formats: Sequence[str] = ("png",),
+        cmap: "str | Colormap" = DEFAULT_CMAP,
+        limits: Optional[tuple[float, float]] = None,
+        unit: str = "celsius") -> list[str]:
+    """
+    Export the thermal image in the formats to files sharing the path
+    stem, followed by a JSON sidecar with the metadata and the list of
+    files. Rendered images use the colormap and the color limits in
+    Celsius, by default the 1st and 99th percentiles. Return the paths
+    of the written files.
+    """
+
+    paths = []
+    sidecar_path = stem + SIDECAR_SUFFIX
+
+    try:
+        for fmt in formats:
+            if fmt not in EXPORT_FORMATS:
+                raise ValueError(f"Unknown export format: {fmt}")
+
+        if "png" in formats:
+            # Rendering pulls in matplotlib, so it is imported only if needed
+            from thermal_render import render
+
+            if limits is None:
+                limits = tuple(ThermalStats.from_image(data).percentile(
+                    DEFAULT_LIMITS
+                ))
+
+        for fmt in formats:
+            path = stem + EXPORT_FORMATS[fmt].format(unit=unit)
+            # Listed before writing, so a partial file is removed too
+            paths.append(path)
+
+            if fmt == "png":
+                write_image(path, render(data, cmap, *limits))
+            elif fmt == "raw_tiff":
+                write_image(path, np.ascontiguousarray(data.raw,
+                    dtype=np.uint16))
+            elif fmt == "raw_npy":
+                np.save(path, data.raw)
+            elif fmt == "temperature_tiff":
+                write_image(path, data.temperature(unit, np.float32))
+            else:
+                np.save(path, data.temperature(unit, np.float32))
+
+        sidecar = {
+            "source": data.file_path,
+            "width": data.shape[1],
+            "height": data.shape[0],
+            "unit": unit,
+            "files": [os.path.basename(path) for path in paths],
+            "metadata": data.metadata
+        }
+
+        if "png" in formats:
+            cmap_name = cmap if isinstance(cmap, str) else cmap.name
+            sidecar.update(cmap=cmap_name,
+                limits=[float(v) for v in limits])
+
+        # The sidecar lists the files, so it replaces the reservation
+        # only once they are all written
+        with open(sidecar_path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump(sidecar, file, indent=4)
+
+        os.replace(sidecar_path + ".tmp", sidecar_path)
+    except BaseException:
+        _remove_partial(paths, sidecar_path)
+        raise
+
+    return [*paths, sidecar_path]
+
+
+class ExportQueue:
+    """
+    Writes exports on a background thread, one at a time, so that
+    callers never block on encoding or disk I/O. Each export works on
+    a snapshot of the image taken at submission.
+    """
+
+    def __init__(self: Self) -> None:
+        """Initialize an ExportQueue instance."""
+
+        self._executor = ThreadPoolExecutor(max_workers=1,
+            thread_name_prefix="export")
+
+    def submit(self: Self, data: ThermalImage, directory: str,
+            formats: Sequence[str] = ("png",), **options: object
+            ) -> Future:
+        """
+        Queue an export of the image into the directory under a unique
+        name. Return a future of the written paths.
+        """
+
+        stem = unique_stem(directory)
+
+        return self._executor.submit(export_image, data.snapshot(), stem,
+            tuple(formats), **options)
+
+    def close(self: Self, wait: bool = True) -> None:
+        """Stop the writer thread, by default after pending exports."""
+
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *_: object) -> None:
+        self.close()
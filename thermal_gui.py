@@ -22,25 +22,40 @@ images.
 
 
 from typing import Self, Optional
-from tkinter import filedialog
-import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor, Future
+from collections import OrderedDict
+import bisect
+import sys
 import os
-from datetime import datetime
 
 import matplotlib.pyplot as plt
 from mpl_toolkits.axes_grid1.inset_locator import inset_axes
-from matplotlib.widgets import Button, RadioButtons, Slider
+from matplotlib.widgets import (Button, RadioButtons, Slider,
+    RectangleSelector, TextBox)
 import numpy as np
 from matplotlib.colorbar import Colorbar
-from matplotlib.backend_bases import DrawEvent, ResizeEvent, MouseEvent
+from matplotlib.backend_bases import (DrawEvent, ResizeEvent, MouseEvent,
+    KeyEvent)
 from matplotlib.text import Text
 from matplotlib.lines import Line2D
+from matplotlib.transforms import Bbox
 
-from thermal_image import ThermalImage
+from thermal_image import ThermalImage, from_celsius
+from thermal_stats import ThermalStats
+from thermal_sequence import ThermalSequence, SEQUENCE_EXTENSIONS
+from thermal_render import render, palette_lut, colorize
+from thermal_mosaic import ThermalMosaic, MosaicStats, is_mosaic
+from thermal_pyramid import DisplayPyramid, MODES, level_for, max_level
+from thermal_export import ExportQueue
+from batch import find_images
+from raw_frame import rendered_exports
+from thermal_trace import traced
+from thermal_dialog import ask_file_path, show_error
 
 
 DEFAULT_VMAX = 99
 DEFAULT_VMIN = 1
+DEFAULT_PALETTE = "Ironbow"
 DEFAULT_HEIGHT = 480
 DEFAULT_WIDTH = 640
 CMAPS = {
@@ -50,6 +65,33 @@ CMAPS = {
     "Glowbow": "hot"
 }
 PERCENTILE_RANGE = 101
+# Delta images use a diverging colormap centred on no change, scaled to
+# the percentile of the absolute differences
+DELTA_CMAP = "coolwarm"
+DELTA_PERCENTILE = 99
+SAVE_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+    "saves")
+# Rendered image and raw data, each with a metadata sidecar
+SAVE_FORMATS = ("png", "raw_tiff")
+# Interval between checks for a finished load in milliseconds
+LOAD_INTERVAL = 50
+LOAD_WORKERS = 2
+# Files preloaded behind and ahead of the current one, and the number
+# of loaded images kept
+PREFETCH_OFFSETS = (-1, 1, 2)
+PREFETCH_SIZE = 6
+# Minimum interval between hover updates in milliseconds (one frame)
+HOVER_INTERVAL = 16
+# View redraws after pan, zoom, and resize are coalesced the same way
+VIEW_INTERVAL = 16
+# External parameters editable in the GUI and their labels
+PARAMETERS = {
+    "e": "E",
+    "od": "OD",
+    "rat": "RAT",
+    "at": "AT",
+    "rh": "RH"
+}
 
 
 class ThermalGUI:
@@ -60,44 +102,91 @@ class ThermalGUI:
     def __init__(self: Self) -> None:
         """Initialize a ThermalGUI instance."""
 
+        self.data = None
+        self.sequence = None
+        self.roi_selected = False
+        self.hover_event = None
+        self.hover_pixel = None
+        self.rgba = np.empty((0, 0, 4), dtype=np.uint8)
+        self.exports = ExportQueue()
+        self.pending_exports = []
+
+        # Zoomed-out views are drawn from a pyramid of the displayed
+        # temperatures, in one of its modes
+        self.pyramid = None
+        self.display_mode = "mean"
+        self.rendered_view = None
+        self.view_shape = None
+
+        # Image compared against in the delta view
+        self.baseline = None
+        self.show_delta = False
+        self.delta = None
+
+        self.file_path = None
+        self.directory = None
+        self.files = []
+        self.loader = ThreadPoolExecutor(max_workers=LOAD_WORKERS,
+            thread_name_prefix="loader")
+        self.loads = OrderedDict()
+        self.pending_load = None
+
+        # Widgets are built after the first paint, see _build_widgets
+        self.widgets_ready = False
+
         self._create_window()
-        self._create_layout()
-        self._create_widgets()
         self._init_thermal_image_panel()
         self._init_calibration_panel()
         self._create_texts()
         self._bind_events()
 
     @staticmethod
-    def open_file(window: Optional["ThermalGUI"] = None) -> None:
-        """Open an image file and update the display."""
+    def open_file(window: Optional["ThermalGUI"] = None,
+            file_path: Optional[str] = None) -> None:
+        """
+        Open an image file, asking for one if no path is given, and
+        update the display. Files opened from a window are loaded in
+        the background.
+        """
 
-        file_path = filedialog.askopenfilename(
-            filetypes=[("Image Files", "*.jpeg *.jpg *.png *.tif *.tiff")]
-        )
+        file_path = file_path or ask_file_path()
 
         if not file_path:
             return
 
+        if is_mosaic(file_path):
+            try:
+                MosaicGUI(ThermalMosaic(os.path.dirname(file_path)))
+            except Exception as error:
+                show_error(error)
+                return
+
+            # A running event loop shows new windows only when asked
+            if window is not None:
+                plt.show(block=False)
+            return
+
+        if window is not None:
+            window._load_file(file_path)
+            return
+
+        # No window is shown yet, so there is nothing to keep responsive
         try:
-            data = ThermalImage(file_path)
+            sequence, data = load_file(file_path)
         except Exception as error:
-            tk.messagebox.showerror(
-                title="ThermImPro", message=f"{type(error).__name__}: {error}."
-            )
+            show_error(error)
             return
 
-        if window is None:
-            window = ThermalGUI()
-        
-        window._set_data(data)
-        window._update_display()
+        window = ThermalGUI()
+        window._show_file(file_path, sequence, data)
 
     def _create_window(self: Self) -> None:
         """Create the main application window."""
 
         plt.style.use("dark_background")
         self.window = plt.figure(num="ThermImPro", figsize=(14.0, 7.0))
+        # Record matplotlib drawing while tracing is enabled
+        self.window.draw = traced("draw")(self.window.draw)
 
         gridspec = self.window.add_gridspec(nrows=3, ncols=3)
 
@@ -150,6 +239,22 @@ class ThermalGUI:
             bbox_transform=self.thermal_image_panel.transAxes
         )
 
+        self.parameter_box_containers = {
+            name: inset_axes(
+                parent_axes=self.info_panel, width="11%", height="5%",
+                loc="lower left", bbox_to_anchor=(0.08 + 0.2*index, -0.04,
+                    1.0, 1.0),
+                bbox_transform=self.info_panel.transAxes
+            )
+            for index, name in enumerate(PARAMETERS)
+        }
+        self.frame_slider_container = inset_axes(
+            parent_axes=self.thermal_image_panel, width="45%", height="3%",
+            loc="lower left", bbox_to_anchor=(0.06, -0.085, 1.0, 1.0),
+            bbox_transform=self.thermal_image_panel.transAxes
+        )
+        self.frame_slider_container.set_visible(False)
+
     def _create_widgets(self: Self) -> None:
         """Create widgets."""
 
@@ -162,9 +267,8 @@ class ThermalGUI:
             color="dimgray", hovercolor="dimgray"
         )
         self.palette_radio = RadioButtons(
-            ax=self.palette_radio_container,
-            labels=("Grayscale", "Ironbow", "Rainbow", "Glowbow"),
-            active=1, activecolor="green"
+            ax=self.palette_radio_container, labels=tuple(CMAPS),
+            active=list(CMAPS).index(DEFAULT_PALETTE), activecolor="green"
         )
         self.vmax_slider = Slider(
             ax=self.vmax_slider_container, label="",
@@ -187,6 +291,22 @@ class ThermalGUI:
             color="blue", hovercolor="blue"
         )
 
+        self.frame_slider = Slider(
+            ax=self.frame_slider_container, label="Frame",
+            valmin=0.0, valmax=1.0, valinit=0.0,
+            valfmt="%d", valstep=1.0, initcolor="none",
+            handle_style={"edgecolor": "dimgray"}, fc="orchid"
+        )
+
+        self.parameter_boxes = {
+            name: TextBox(
+                ax=container, label=label, color="dimgray",
+                hovercolor="gray", textalignment="center"
+            )
+            for (name, label), container in zip(PARAMETERS.items(),
+                self.parameter_box_containers.values())
+        }
+
         self.vmax_slider.slidermin = self.vmin_slider
         self.vmin_slider.slidermax = self.vmax_slider
 
@@ -195,7 +315,7 @@ class ThermalGUI:
 
         self.image = self.thermal_image_panel.imshow(
             X=np.zeros((DEFAULT_HEIGHT, DEFAULT_WIDTH)),
-            cmap="inferno", aspect="auto"
+            cmap=CMAPS[DEFAULT_PALETTE], aspect="auto"
         )
 
         self.crosshair_cursor_bg, = self.thermal_image_panel.plot(
@@ -212,6 +332,13 @@ class ThermalGUI:
             [], [], c="blue", marker="+", mew=2.5, ms=13.5
         )
 
+        # Regions of interest are drawn by dragging with the right button
+        self.roi_selector = RectangleSelector(
+            ax=self.thermal_image_panel, onselect=self._on_select_roi,
+            button=3, interactive=True, minspanx=1.0, minspany=1.0,
+            props={"ec": "white", "fc": "none", "ls": "--", "lw": 1.5}
+        )
+
         colorbar_container = inset_axes(
             parent_axes=self.thermal_image_panel, width="3%", height="100%",
             loc="right", bbox_to_anchor=(0.05, 0.0, 1.0, 1.0),
@@ -261,6 +388,15 @@ class ThermalGUI:
             x=1.0, y=-0.05, s="", animated=True, ha="right",
             transform=self.thermal_image_panel.transAxes
         )
+        self.roi_text = self.thermal_image_panel.text(
+            x=0.0, y=0.0, s="", family="monospace", va="bottom",
+            visible=False, bbox={"fc": "black", "alpha": 0.6, "lw": 0.0}
+        )
+        self.status_text = self.thermal_image_panel.text(
+            x=0.5, y=0.5, s="", ha="center", va="center", visible=False,
+            transform=self.thermal_image_panel.transAxes,
+            bbox={"fc": "black", "alpha": 0.6, "lw": 0.0}
+        )
         self.footer_text = self.window.text(
             x=0.992, y=0.03,
             s="ThermImPro v1.1\nCopyright ©2026 Mykola Melnyk",
@@ -275,6 +411,45 @@ class ThermalGUI:
         self.window.canvas.mpl_connect(
             s="motion_notify_event", func=self._on_move
         )
+        self.window.canvas.mpl_connect(
+            s="key_press_event", func=self._on_key
+        )
+        self.window.canvas.mpl_connect(s="close_event", func=self._on_close)
+
+        # Motion events are coalesced into one hover update per frame
+        self.hover_timer = self.window.canvas.new_timer(
+            interval=HOVER_INTERVAL
+        )
+        self.hover_timer.single_shot = True
+        self.hover_timer.add_callback(self._update_hover)
+
+        # Pan and zoom change both limits, but the view is drawn once
+        self.view_timer = self.window.canvas.new_timer(
+            interval=VIEW_INTERVAL
+        )
+        self.view_timer.single_shot = True
+        self.view_timer.add_callback(self._render_view)
+        self.thermal_image_panel.callbacks.connect(
+            "xlim_changed", lambda _: self.view_timer.start()
+        )
+        self.thermal_image_panel.callbacks.connect(
+            "ylim_changed", lambda _: self.view_timer.start()
+        )
+
+        # Background loads are handed back to the event loop by polling
+        self.load_timer = self.window.canvas.new_timer(
+            interval=LOAD_INTERVAL
+        )
+        self.load_timer.add_callback(self._poll_load)
+
+        # Failed exports are reported from the event loop the same way
+        self.export_timer = self.window.canvas.new_timer(
+            interval=LOAD_INTERVAL
+        )
+        self.export_timer.add_callback(self._poll_exports)
+
+    def _bind_widget_events(self: Self) -> None:
+        """Bind widget events to handlers."""
 
         self.open_button.on_clicked(lambda _: self.open_file(self))
         self.save_button.on_clicked(self._save_file)
@@ -285,6 +460,14 @@ class ThermalGUI:
         self.vmin_slider.on_changed(
             lambda value: self._set_clim(clim="vmin", val=value)
         )
+        for name, box in self.parameter_boxes.items():
+            box.on_submit(
+                lambda text, name=name: self._set_parameter(name, text)
+            )
+
+        self.frame_slider.on_changed(
+            lambda value: self._set_frame(int(value))
+        )
         self.hotspot_button.on_clicked(
             lambda _: self._toggle_marker(self.hotspot_marker)
         )
@@ -293,12 +476,53 @@ class ThermalGUI:
         )
 
     def _on_draw(self: Self, _: DrawEvent) -> None:
-        """Cache the window background on draw events."""
+        """
+        Cache the background of the image panel and the temperature
+        readout below it on draw events.
+        """
+
+        self.hover_bbox = Bbox(self.thermal_image_panel.transAxes.transform(
+            [(0.0, -0.1), (1.0, 1.0)]
+        ))
+        self.bg = self.window.canvas.copy_from_bbox(self.hover_bbox)
+        # The animated artists have to be blitted again
+        self.hover_pixel = None
 
-        self.bg = self.window.canvas.copy_from_bbox(self.window.bbox)
+        if not self.widgets_ready:
+            self._build_widgets()
+
+    def _build_widgets(self: Self) -> None:
+        """
+        Create the widgets once the image has been painted, in sync
+        with the displayed data, and draw them on the next paint.
+        """
+
+        self._create_layout()
+        self._create_widgets()
+        self._bind_widget_events()
+        self.widgets_ready = True
+
+        self._scale_texts()
+        self._update_frame_slider()
+
+        if self.data is not None:
+            self._update_parameter_boxes()
+
+        self.window.canvas.draw_idle()
 
     def _on_resize(self: Self, _: ResizeEvent) -> None:
-        """Scale text elements on resize events."""
+        """
+        Scale text elements on resize events and draw the image at the
+        resolution of the new panel size.
+        """
+
+        self._scale_texts()
+        self.view_timer.start()
+
+        self.window.canvas.draw_idle()
+
+    def _scale_texts(self: Self) -> None:
+        """Scale text elements with the window width."""
 
         width = self.window.get_figwidth() * self.window.dpi
         scale = np.clip(a=width/1920.0, a_min=0.5, a_max=2.0)
@@ -307,26 +531,97 @@ class ThermalGUI:
             size = 10.0 if text is self.footer_text else 12.0
             text.set_fontsize(scale*size)
 
+    def _on_key(self: Self, event: KeyEvent) -> None:
+        """
+        Cancel a pending load, or hide the region of interest stats when
+        it is cleared, on Escape. Page Down and Page Up open the next
+        and previous image in the folder. B makes the current image the
+        baseline and D toggles the difference from it. M cycles through
+        the mean, minimum, and maximum of the pixels merged in
+        zoomed-out views.
+        """
+
+        if event.key == "escape":
+            if self.pending_load is not None:
+                self._cancel_load()
+                return
+
+            self.roi_selected = False
+            self.roi_text.set_visible(False)
+            self.window.canvas.draw_idle()
+        elif event.key == "pagedown":
+            self._step_file(1)
+        elif event.key == "pageup":
+            self._step_file(-1)
+        elif event.key == "b":
+            self._set_baseline()
+        elif event.key == "d":
+            self._toggle_delta()
+        elif event.key == "m":
+            self._cycle_display_mode()
+
+    def _on_close(self: Self, _: object) -> None:
+        """
+        Stop background loading and finish pending exports when the
+        window is closed.
+        """
+
+        self.load_timer.stop()
+        self.view_timer.stop()
+        self.loader.shutdown(wait=False, cancel_futures=True)
+        self.exports.close()
+
+    def _on_select_roi(self: Self, *_: MouseEvent) -> None:
+        """Update the region of interest stats on selection changes."""
+
+        self.roi_selected = True
+        self._update_roi_text()
         self.window.canvas.draw_idle()
 
     def _on_move(self: Self, event: MouseEvent) -> None:
         """
-        Update the crosshair cursor position and temperature text on
-        mouse movement.
+        Queue a crosshair cursor and temperature text update on mouse
+        movement. Only the latest event of a burst is processed.
         """
-        
-        is_in_image_panel = event.inaxes is self.thermal_image_panel
 
-        if is_in_image_panel:
-            xdata = np.clip(
-                a=event.xdata, a_min=0.0, a_max=self.data.shape[1]-1.0
-            )
-            ydata = np.clip(
-                a=event.ydata, a_min=0.0, a_max=self.data.shape[0]-1.0
+        if self.hover_event is None:
+            self.hover_timer.start()
+
+        self.hover_event = event
+
+    @traced("hover")
+    def _update_hover(self: Self) -> None:
+        """
+        Update the crosshair cursor position and temperature text for
+        the latest mouse movement, if the pixel under the cursor
+        changed, and blit the image panel.
+        """
+
+        event, self.hover_event = self.hover_event, None
+
+        if event is None:
+            return
+
+        pixel = None
+
+        if event.inaxes is self.thermal_image_panel:
+            # Pixel centres lie on integer coordinates
+            pixel = (
+                int(np.clip(np.floor(event.xdata + 0.5), 0,
+                    self.data.shape[1]-1)),
+                int(np.clip(np.floor(event.ydata + 0.5), 0,
+                    self.data.shape[0]-1))
             )
 
-            self._update_cursor_position(x=xdata, y=ydata)
-            self._update_temperature_hover_text(x=int(xdata), y=int(ydata))
+        if pixel == self.hover_pixel:
+            return
+
+        self.hover_pixel = pixel
+        is_in_image_panel = pixel is not None
+
+        if is_in_image_panel:
+            self._update_cursor_position(*pixel)
+            self._update_temperature_hover_text(*pixel)
         
         self.window.canvas.restore_region(self.bg)
 
@@ -337,7 +632,7 @@ class ThermalGUI:
             if is_in_image_panel:
                 self.thermal_image_panel.draw_artist(artist)
         
-        self.window.canvas.blit(self.window.bbox)
+        self.window.canvas.blit(self.hover_bbox)
 
     def _update_cursor_position(self: Self, x: float, y: float) -> None:
         """Update the crosshair cursor position."""
@@ -348,38 +643,92 @@ class ThermalGUI:
     def _update_temperature_hover_text(self: Self, x: int, y: int) -> None:
         """
         Update the temperature hover text with the value in (x, y).
+        Texts are formatted once per raw value and then looked up.
         """
 
-        temp_c = self.data.celsius[y, x]
-        temp_f = self.data.fahrenheit[y, x]
-        temp_k = self.data.kelvin[y, x]
+        if self.readout_lut is None:
+            text = self._format_readout(self.data.celsius[y, x])
+
+            if self.delta is not None:
+                text += f"  Δ {self.delta[y, x]:+.2f} °C"
+
+            self.temperature_text.set_text(text)
+            return
+
+        value = int(self.data.raw[y, x])
+        text = self.readouts.get(value)
+
+        if text is None:
+            text = self._format_readout(self.readout_lut[value])
+            self.readouts[value] = text
 
-        self.temperature_text.set_text(
+        if self.delta is not None:
+            text += f"  Δ {self.delta[y, x]:+.2f} °C"
+
+        self.temperature_text.set_text(text)
+
+    @staticmethod
+    def _format_readout(temp_c: float) -> str:
+        """Format a temperature in Celsius for the hover text."""
+
+        temp_f = from_celsius(temp_c, "fahrenheit")
+        temp_k = from_celsius(temp_c, "kelvin")
+
+        return (
             f"Temperature: {temp_c:.2f} °C / {temp_f:.2f} °F / {temp_k:.2f} K"
         )
     
     def _save_file(self: Self, _: MouseEvent) -> None:
-        """Export the thermal image as a PNG file."""
+        """
+        Export the rendered thermal image and its raw data in the
+        background.
+        """
 
-        os.makedirs(name="saves", exist_ok=True)
+        vmin, vmax = self._clim_indices()
 
-        filename = datetime.now().strftime("%Y%m%d%H%M%S")
-        vmin, vmax = int(self.vmin_slider.val), int(self.vmax_slider.val)
+        try:
+            future = self.exports.submit(
+                data=self.data, directory=SAVE_DIRECTORY,
+                formats=SAVE_FORMATS, cmap=CMAPS[self._palette()],
+                limits=(self.limits[vmin], self.limits[vmax])
+            )
+        except OSError as error:
+            show_error(error)
+            return
+
+        self.pending_exports.append(future)
+        self.export_timer.start()
+
+    def _poll_exports(self: Self) -> None:
+        """Report the pending exports that failed once they finish."""
+
+        for future in [future for future in self.pending_exports
+                if future.done()]:
+            self.pending_exports.remove(future)
+
+            if (error := future.exception()) is not None:
+                show_error(error)
+
+        if not self.pending_exports:
+            self.export_timer.stop()
 
-        plt.imsave(
-            fname=f"saves/{filename}.png", arr=self.data.celsius,
-            vmin=self.limits[vmin], vmax=self.limits[vmax],
-            cmap=self.image.get_cmap()
-        )
-    
     def _set_palette(self: Self, palette: str) -> None:
         """Set the colormap and reset the image color limits."""
 
         self.image.set_cmap(CMAPS[palette])
         self._reset_clim()
+        self._render_image()
 
         self.window.canvas.draw_idle()
 
+    def _palette(self: Self) -> str:
+        """Return the name of the selected palette."""
+
+        if not self.widgets_ready:
+            return DEFAULT_PALETTE
+
+        return self.palette_radio.value_selected
+
     def _reset_clim(self: Self) -> None:
         """Reset the image color limits and sliders."""
 
@@ -387,8 +736,17 @@ class ThermalGUI:
             vmin=self.limits[DEFAULT_VMIN], vmax=self.limits[DEFAULT_VMAX]
         )
 
-        self.vmax_slider.reset()
-        self.vmin_slider.reset()
+        if self.widgets_ready:
+            self.vmax_slider.reset()
+            self.vmin_slider.reset()
+
+    def _clim_indices(self: Self) -> tuple[int, int]:
+        """Return the percentiles of the image color limits."""
+
+        if not self.widgets_ready:
+            return DEFAULT_VMIN, DEFAULT_VMAX
+
+        return int(self.vmin_slider.val), int(self.vmax_slider.val)
 
     def _set_clim(self: Self, clim: str, val: float) -> None:
         """Set the image color limits."""
@@ -397,9 +755,178 @@ class ThermalGUI:
             self.image.set_clim(vmax=self.limits[int(val)])
         else:
             self.image.set_clim(vmin=self.limits[int(val)])
+
+        self._render_image()
         
         self.window.canvas.draw_idle()
 
+    @traced("render")
+    def _render_image(self: Self) -> None:
+        """
+        Render the visible part of the image with the current colormap
+        and color limits, at the pyramid level matching the panel
+        resolution. Full-resolution views go through the palette
+        lookup table; the colorbar follows the limits of the image.
+        """
+
+        x0, y0, x1, y1, level = self.rendered_view = self._view()
+
+        if self.delta is not None:
+            # The palette and limits are kept for the temperature view
+            self.image.set_cmap(DELTA_CMAP)
+            self.image.set_clim(vmin=-self.delta_limit, vmax=self.delta_limit)
+
+        cmap, (vmin, vmax) = self.image.get_cmap(), self.image.get_clim()
+
+        if level == 0 and self.delta is None:
+            shape = (y1 - y0, x1 - x0)
+            self.rgba = render(self.data, cmap, vmin, vmax,
+                out=self.rgba if self.rgba.shape[:2] == shape else None,
+                window=np.s_[y0:y1, x0:x1])
+            extent = (x0-0.5, x1-0.5, y1-0.5, y0-0.5)
+        else:
+            values, extent = self._pyramid().region(level, x0, y0, x1, y1,
+                self.display_mode)
+            self.rgba = colorize(values, cmap, vmin, vmax)
+
+        self.image.set_data(self.rgba)
+        self.image.set_extent(extent)
+
+    def _view(self: Self) -> tuple[int, int, int, int, int]:
+        """
+        Return the region of the image visible in the panel, as
+        (x0, y0, x1, y1) with exclusive ends, and the pyramid level
+        with at least one pixel per screen pixel.
+        """
+
+        (left, right), (bottom, top) = (self.thermal_image_panel.get_xlim(),
+            self.thermal_image_panel.get_ylim())
+        height, width = self.data.shape
+
+        # Pixel centres lie on integer coordinates; at least one pixel
+        # is drawn even if the view lies outside the image
+        x0 = int(np.clip(np.floor(min(left, right) + 0.5), 0, width-1))
+        y0 = int(np.clip(np.floor(min(bottom, top) + 0.5), 0, height-1))
+        x1 = int(np.clip(np.ceil(max(left, right) + 0.5), x0+1, width))
+        y1 = int(np.clip(np.ceil(max(bottom, top) + 0.5), y0+1, height))
+
+        extent = self.thermal_image_panel.get_window_extent()
+        scale = min((x1 - x0) / max(extent.width, 1.0),
+            (y1 - y0) / max(extent.height, 1.0))
+
+        return x0, y0, x1, y1, level_for(scale, max_level(self.data.shape))
+
+    def _pyramid(self: Self) -> DisplayPyramid:
+        """
+        Return the pyramid of the displayed temperatures or
+        differences, creating it on first use.
+        """
+
+        if self.pyramid is None:
+            if self.delta is not None:
+                self.pyramid = DisplayPyramid(self.delta)
+            elif self.data.mdata.per_pixel:
+                self.pyramid = DisplayPyramid(self.data.celsius)
+            else:
+                self.pyramid = DisplayPyramid(self.data.raw,
+                    self.data.calibration_data)
+
+        return self.pyramid
+
+    def _render_view(self: Self) -> None:
+        """Draw the image again if the visible region or level changed."""
+
+        if self.data is None or self._view() == self.rendered_view:
+            return
+
+        self._render_image()
+
+        self.window.canvas.draw_idle()
+
+    def _reset_view(self: Self) -> None:
+        """Show the whole image."""
+
+        self.thermal_image_panel.set_xlim(-0.5, self.data.shape[1]-0.5)
+        self.thermal_image_panel.set_ylim(self.data.shape[0]-0.5, -0.5)
+        self.view_shape = self.data.shape
+
+        # The home button of the toolbar returns to the whole image
+        if (toolbar := self.window.canvas.toolbar) is not None:
+            toolbar.update()
+
+    def _cycle_display_mode(self: Self) -> None:
+        """Switch to the next mode of the zoomed-out views."""
+
+        modes = list(MODES)
+        self.display_mode = modes[
+            (modes.index(self.display_mode) + 1) % len(modes)
+        ]
+
+        if self.data is not None:
+            self._render_image()
+
+            self.window.canvas.draw_idle()
+
+    def _set_baseline(self: Self) -> None:
+        """Make the current image the baseline of the delta view."""
+
+        if self.data is None:
+            return
+
+        # Parameter changes of the image must not reach the baseline
+        self.baseline = self.data.snapshot()
+
+        if self.show_delta:
+            self._update_delta()
+            self._render_image()
+
+            self.window.canvas.draw_idle()
+
+    def _toggle_delta(self: Self) -> None:
+        """
+        Toggle between the temperatures and their difference from the
+        baseline image, which must have the same size.
+        """
+
+        if not self.show_delta and (self.baseline is None
+                or self.baseline.shape != self.data.shape):
+            show_error(ValueError(
+                "Press B on an image of the same size to set the baseline"
+            ))
+            return
+
+        self.show_delta = not self.show_delta
+        self._update_delta()
+        self._render_image()
+
+        self.window.canvas.draw_idle()
+
+    def _update_delta(self: Self) -> None:
+        """
+        Compute the difference of the image from the baseline in the
+        delta view, and leave the view for images of another size.
+        """
+
+        self.delta = None
+
+        self.pyramid = None
+
+        if self.show_delta and self.baseline.shape == self.data.shape:
+            self.delta = self.data.celsius - self.baseline.celsius
+            self.delta_limit = max(float(np.nan_to_num(np.nanpercentile(
+                np.abs(self.delta), DELTA_PERCENTILE))), 0.1)
+            self.colorbar.set_label("Temperature difference, °C")
+            self.hover_pixel = None
+            return
+
+        self.show_delta = False
+        vmin, vmax = self._clim_indices()
+
+        self.image.set_cmap(CMAPS[self._palette()])
+        self.image.set_clim(vmin=self.limits[vmin], vmax=self.limits[vmax])
+        self.colorbar.set_label("Temperature, °C")
+        self.hover_pixel = None
+
     def _toggle_marker(self: Self, marker: Line2D) -> None:
         """Toggle the visibility of the marker."""
 
@@ -407,43 +934,288 @@ class ThermalGUI:
         
         self.window.canvas.draw_idle()
     
+    def _fetch(self: Self, file_path: str) -> Future:
+        """
+        Return the future of a background load of the file. Images are
+        kept in a bounded cache, least recently used first out.
+        """
+
+        if file_path in self.loads:
+            self.loads.move_to_end(file_path)
+            return self.loads[file_path]
+
+        future = self.loader.submit(load_file, file_path)
+
+        # Sequences hold their file open and are not shared
+        if file_path.lower().endswith(SEQUENCE_EXTENSIONS):
+            return future
+
+        self.loads[file_path] = future
+
+        while len(self.loads) > PREFETCH_SIZE:
+            _, evicted = self.loads.popitem(last=False)
+            evicted.cancel()
+
+        return future
+
+    def _load_file(self: Self, file_path: str) -> None:
+        """
+        Load a file in the background and show a busy indicator until
+        it is displayed.
+        """
+
+        self._cancel_load()
+
+        self.pending_load = (file_path, self._fetch(file_path))
+        self.status_text.set_text(
+            f"Loading {os.path.basename(file_path)}... (Esc to cancel)"
+        )
+        self.status_text.set_visible(True)
+        self.window.canvas.draw_idle()
+
+        self.load_timer.start()
+        # Loads of cached images are finished already
+        self._poll_load()
+
+    def _cancel_load(self: Self) -> None:
+        """Discard the pending load, if any."""
+
+        if self.pending_load is None:
+            return
+
+        file_path, future = self.pending_load
+        self.pending_load = None
+        self.load_timer.stop()
+
+        # Cached images keep loading for later use
+        if file_path not in self.loads and not future.cancel():
+            future.add_done_callback(_close_sequence)
+
+        self.status_text.set_visible(False)
+        self.window.canvas.draw_idle()
+
+    def _poll_load(self: Self) -> None:
+        """Display the pending load once it has finished."""
+
+        if self.pending_load is None:
+            self.load_timer.stop()
+            return
+
+        file_path, future = self.pending_load
+
+        if not future.done():
+            return
+
+        self.pending_load = None
+        self.load_timer.stop()
+        self.status_text.set_visible(False)
+
+        try:
+            sequence, data = future.result()
+        except Exception as error:
+            self.loads.pop(file_path, None)
+            self.window.canvas.draw_idle()
+
+            show_error(error)
+            return
+
+        self._show_file(file_path, sequence, data)
+
+    def _show_file(self: Self, file_path: str,
+            sequence: Optional[ThermalSequence], data: ThermalImage) -> None:
+        """
+        Display a loaded file and preload the neighbouring images in
+        its folder. Rendered exports in the folder are skipped.
+        """
+
+        self.file_path = file_path
+        directory = os.path.dirname(file_path)
+
+        # Folders are listed once, not on every step through them
+        if directory != self.directory:
+            exports = rendered_exports(directory)
+            self.files = [path for path in find_images([directory])
+                if path not in exports]
+            self.directory = directory
+
+        self._set_sequence(sequence)
+        self._set_data(data)
+        self._update_display()
+
+        for offset in PREFETCH_OFFSETS:
+            if (neighbour := self._neighbour(offset)) is not None:
+                self._fetch(neighbour)
+
+    def _neighbour(self: Self, offset: int) -> Optional[str]:
+        """
+        Return the image at the offset from the current file in its
+        folder, or None past either end.
+        """
+
+        if self.file_path is None:
+            return None
+
+        index = bisect.bisect_left(self.files, self.file_path)
+        found = index < len(self.files) and self.files[index] == self.file_path
+
+        # Files not in the list lie between index - 1 and index
+        if offset > 0 and not found:
+            offset -= 1
+
+        index += offset
+
+        if 0 <= index < len(self.files):
+            return self.files[index]
+
+        return None
+
+    def _step_file(self: Self, offset: int) -> None:
+        """Open the image at the offset from the current file."""
+
+        if (file_path := self._neighbour(offset)) is not None:
+            self._load_file(file_path)
+
+    def _set_sequence(self: Self, sequence: Optional[ThermalSequence]) -> None:
+        """
+        Set the sequence to browse and show the frame slider for
+        multi-frame sequences.
+        """
+
+        if self.sequence is not None:
+            self.sequence.close()
+
+        self.sequence = sequence
+        self._update_frame_slider()
+
+    def _update_frame_slider(self: Self) -> None:
+        """Show the frame slider for multi-frame sequences."""
+
+        if not self.widgets_ready:
+            return
+
+        frames = len(self.sequence) if self.sequence is not None else 1
+
+        self.frame_slider.eventson = False
+        self.frame_slider.valmax = max(frames - 1, 1)
+        self.frame_slider_container.set_xlim(0.0, self.frame_slider.valmax)
+        self.frame_slider.set_val(0)
+        self.frame_slider.eventson = True
+
+        self.frame_slider_container.set_visible(frames > 1)
+
+    def _set_frame(self: Self, index: int) -> None:
+        """
+        Show a frame of the sequence, keeping the palette, threshold,
+        and marker settings.
+        """
+
+        if self.sequence is None or index >= len(self.sequence):
+            return
+
+        self._set_data(self.sequence.image(index))
+        self._refresh_display()
+
+    def _set_parameter(self: Self, name: str, text: str) -> None:
+        """
+        Set an external parameter of the image and convert it again
+        from the raw data.
+        """
+
+        try:
+            value = float(text)
+            self.data.set_parameters(**{name: value})
+        except ValueError:
+            self._update_parameter_boxes()
+            return
+
+        self._set_data(self.data)
+        self._refresh_display()
+
+    @traced("refresh_display")
+    def _refresh_display(self: Self) -> None:
+        """
+        Update the display for new data, keeping the palette,
+        threshold, and marker settings.
+        """
+
+        # The view is kept unless the image size changed
+        if self.data.shape != self.view_shape:
+            self._reset_view()
+
+        vmin, vmax = self._clim_indices()
+        self.image.set_clim(vmin=self.limits[vmin], vmax=self.limits[vmax])
+        self._render_image()
+
+        visible = (self.hotspot_marker.get_visible(),
+            self.coldspot_marker.get_visible())
+
+        self._update_temperature_stats_texts()
+        self._update_marker_positions()
+        self._update_roi_text()
+        self._update_calibration_curve()
+        self._update_metadata_text()
+        self._update_parameter_boxes()
+
+        self.hotspot_marker.set_visible(visible[0])
+        self.coldspot_marker.set_visible(visible[1])
+
+        self.window.canvas.draw_idle()
+
+    @traced("set_data")
     def _set_data(self: Self, data: ThermalImage) -> None:
         """
         Set the image data and compute the image color limits.
         """
 
         self.data = data
-        self.limits = np.percentile(
-            a=self.data.celsius, q=np.arange(PERCENTILE_RANGE)
-        )
+        self.stats = ThermalStats.from_image(data)
+
+        # Hover texts per raw value, unless the parameters vary per pixel
+        self.readouts = {}
+        self.readout_lut = (None if data.mdata.per_pixel
+            else data.calibration_data)
+        self.hover_pixel = None
+        self.limits = self.stats.percentile(np.arange(PERCENTILE_RANGE))
+        self.pyramid = None
+
+        if self.show_delta:
+            self._update_delta()
     
+    @traced("update_display")
     def _update_display(self: Self) -> None:
         """Update the display."""
 
-        self.image.set_data(self.data.celsius)
-        self.image.set_extent(
-            (-0.5, self.data.shape[1]-0.5, self.data.shape[0]-0.5, -0.5)
-        )
+        self._reset_view()
+
+        self.image.set_cmap(CMAPS[DEFAULT_PALETTE])
+
+        if self.widgets_ready:
+            # The radio buttons only follow the palette set above
+            self.palette_radio.eventson = False
+            self.palette_radio.set_active(list(CMAPS).index(DEFAULT_PALETTE))
+            self.palette_radio.eventson = True
 
-        self.palette_radio.set_active(1)
         self._reset_clim()
+        self._render_image()
         self._update_temperature_stats_texts()
         self._update_marker_positions()
 
         self._update_calibration_curve()
         self._update_metadata_text()
+        self._update_parameter_boxes()
+        self._update_roi_text()
 
         self.window.canvas.draw_idle()
 
     def _update_temperature_stats_texts(self: Self) -> None:
         """Update the temperature stats texts (max, min, and avg)."""
 
-        max_c, min_c, avg_c = (np.max(self.data.celsius),
-            np.min(self.data.celsius), np.mean(self.data.celsius))
-        max_f, min_f, avg_f = (np.max(self.data.fahrenheit),
-            np.min(self.data.fahrenheit), np.mean(self.data.fahrenheit))
-        max_k, min_k, avg_k = (np.max(self.data.kelvin),
-            np.min(self.data.kelvin), np.mean(self.data.kelvin))
+        max_c, min_c, avg_c = (self.stats.max("celsius"),
+            self.stats.min("celsius"), self.stats.mean("celsius"))
+        max_f, min_f, avg_f = (self.stats.max("fahrenheit"),
+            self.stats.min("fahrenheit"), self.stats.mean("fahrenheit"))
+        max_k, min_k, avg_k = (self.stats.max("kelvin"),
+            self.stats.min("kelvin"), self.stats.mean("kelvin"))
 
         self.max_temperature_text.set_text(
             f"{'MAX':^9}\n{max_c:<6.2f} °C\n{max_f:<6.2f} °F\n{max_k:<7.2f} K"
@@ -458,15 +1230,51 @@ class ThermalGUI:
     def _update_marker_positions(self: Self) -> None:
         """Update the positions of the hotspot and coldspot markers."""
 
-        indices = np.argmax(self.data.celsius), np.argmin(self.data.celsius)
-        y, x = np.unravel_index(indices=indices, shape=self.data.shape)
-
-        self.hotspot_marker.set_data([x[0]], [y[0]])
-        self.coldspot_marker.set_data([x[1]], [y[1]])
+        self.hotspot_marker.set_data(*_marker_data(self.stats.hotspot))
+        self.coldspot_marker.set_data(*_marker_data(self.stats.coldspot))
 
         self.hotspot_marker.set_visible(False)
         self.coldspot_marker.set_visible(False)
     
+    def _update_roi_text(self: Self) -> None:
+        """
+        Update the region of interest stats text (max, min, avg, and
+        std in °C) for the selected rectangle.
+        """
+
+        if not self.roi_selected:
+            self.roi_text.set_visible(False)
+            return
+
+        xmin, xmax, ymin, ymax = self.roi_selector.extents
+        # Pixel centres lie on integer coordinates
+        x0, x1, y0, y1 = (int(np.floor(value + 0.5))
+            for value in (xmin, xmax, ymin, ymax))
+
+        # A single rectangle, so reading its pixels for min/max is cheap
+        stats = self.data.rectangle_stats([(x0, y0, x1, y1)], extrema=True)
+
+        self.roi_text.set_position((xmin, ymin))
+        self.roi_text.set_text(
+            f"MAX {stats['max'][0]:.2f} °C  MIN {stats['min'][0]:.2f} °C\n"
+            f"AVG {stats['mean'][0]:.2f} °C  STD {stats['std'][0]:.2f} °C"
+        )
+        self.roi_text.set_visible(True)
+
+    def _update_parameter_boxes(self: Self) -> None:
+        """Update the external parameter boxes with the image values."""
+
+        if not self.widgets_ready:
+            return
+
+        for name, box in self.parameter_boxes.items():
+            value = getattr(self.data.mdata, name)
+
+            # Set the text directly to avoid submit events and redraws
+            box.text_disp.set_text(
+                f"{value:g}" if not np.ndim(value) else "map"
+            )
+
     def _update_calibration_curve(self: Self) -> None:
         """Update the calibration curve with new data."""
 
@@ -487,3 +1295,326 @@ class ThermalGUI:
                 for key, value in self.data.metadata.items()
             )
         )
+
+
+class MosaicGUI:
+    """
+    Viewer for tiled thermal mosaics. Whenever the view is panned,
+    zoomed, or resized, only the visible part of the mosaic is read at
+    about one pixel per screen pixel: from the display pyramid when
+    zoomed out, and from the intersecting tiles otherwise.
+    """
+
+    def __init__(self: Self, mosaic: ThermalMosaic) -> None:
+        """Initialize a MosaicGUI instance and show the whole mosaic."""
+
+        self.mosaic = mosaic
+        self.stats = MosaicStats(mosaic)
+        self.limits = self.stats.percentile(np.arange(PERCENTILE_RANGE))
+        self.hover_event = None
+        self.hover_pixel = None
+        self.palettes = {}
+        self.display_mode = "mean"
+
+        self._create_window()
+        self._create_texts()
+        self._bind_events()
+
+        self._set_palette(DEFAULT_PALETTE)
+
+    def _create_window(self: Self) -> None:
+        """Create the mosaic window, its image panel, and its widgets."""
+
+        plt.style.use("dark_background")
+        self.window = plt.figure(
+            num=f"ThermImPro - {self.mosaic.directory}", figsize=(14.0, 7.0)
+        )
+        self.window.draw = traced("draw")(self.window.draw)
+        self.window.subplots_adjust(left=0.2, right=0.9)
+
+        self.panel = self.window.add_subplot()
+        self.panel.set_axis_off()
+
+        self.image = self.panel.imshow(
+            X=np.zeros((1, 1, 4), dtype=np.uint8), cmap=CMAPS[DEFAULT_PALETTE]
+        )
+        self.panel.set_xlim(-0.5, self.mosaic.width-0.5)
+        self.panel.set_ylim(self.mosaic.height-0.5, -0.5)
+        # The image extent follows the view, not the other way round
+        self.panel.set_autoscale_on(False)
+
+        self.hotspot_marker, = self.panel.plot(
+            *_marker_data(self.stats.hotspot), c="red", marker="+", mew=2.5,
+            ms=13.5
+        )
+        self.coldspot_marker, = self.panel.plot(
+            *_marker_data(self.stats.coldspot), c="blue", marker="+",
+            mew=2.5, ms=13.5
+        )
+
+        colorbar_container = inset_axes(
+            parent_axes=self.panel, width="3%", height="100%",
+            loc="right", bbox_to_anchor=(0.05, 0.0, 1.0, 1.0),
+            bbox_transform=self.panel.transAxes
+        )
+        self.colorbar = Colorbar(
+            ax=colorbar_container, mappable=self.image,
+            format="%d", label="Temperature, °C"
+        )
+
+        palette_radio_container = inset_axes(
+            parent_axes=self.panel, width="20%", height="27%",
+            loc="upper left", bbox_to_anchor=(-0.23, 0.0, 1.0, 1.0),
+            bbox_transform=self.panel.transAxes,
+            axes_kwargs={"fc": "dimgray"}
+        )
+        self.palette_radio = RadioButtons(
+            ax=palette_radio_container, labels=tuple(CMAPS),
+            active=list(CMAPS).index(DEFAULT_PALETTE), activecolor="green"
+        )
+
+    def _create_texts(self: Self) -> None:
+        """Create the stats and temperature hover texts."""
+
+        self.panel.set_title(
+            f"MAX {self.stats.max():.2f} °C  MIN {self.stats.min():.2f} °C"
+            f"  AVG {self.stats.mean():.2f} °C  "
+            f"({self.mosaic.width}x{self.mosaic.height})",
+            family="monospace"
+        )
+        self.temperature_text = self.panel.text(
+            x=1.0, y=-0.05, s="", animated=True, ha="right",
+            transform=self.panel.transAxes
+        )
+
+    def _bind_events(self: Self) -> None:
+        """Bind events to handlers."""
+
+        self.window.canvas.mpl_connect(s="draw_event", func=self._on_draw)
+        self.window.canvas.mpl_connect(
+            s="motion_notify_event", func=self._on_move
+        )
+        self.window.canvas.mpl_connect(
+            s="resize_event", func=lambda _: self.view_timer.start()
+        )
+        self.window.canvas.mpl_connect(s="close_event", func=self._on_close)
+        self.window.canvas.mpl_connect(
+            s="key_press_event", func=self._on_key
+        )
+        self.panel.callbacks.connect(
+            "xlim_changed", lambda _: self.view_timer.start()
+        )
+        self.panel.callbacks.connect(
+            "ylim_changed", lambda _: self.view_timer.start()
+        )
+        self.palette_radio.on_clicked(self._set_palette)
+
+        # Both limits change on pan and zoom, but the view is read once
+        self.view_timer = self.window.canvas.new_timer(
+            interval=VIEW_INTERVAL
+        )
+        self.view_timer.single_shot = True
+        self.view_timer.add_callback(self._render_view)
+
+        self.hover_timer = self.window.canvas.new_timer(
+            interval=HOVER_INTERVAL
+        )
+        self.hover_timer.single_shot = True
+        self.hover_timer.add_callback(self._update_hover)
+
+    def _on_draw(self: Self, _: DrawEvent) -> None:
+        """
+        Cache the background of the temperature readout below the image
+        panel on draw events.
+        """
+
+        self.hover_bbox = Bbox(self.panel.transAxes.transform(
+            [(0.0, -0.1), (1.0, 0.0)]
+        ))
+        self.bg = self.window.canvas.copy_from_bbox(self.hover_bbox)
+        # The animated readout has to be blitted again
+        self.hover_pixel = None
+
+    def _on_close(self: Self, _: object) -> None:
+        """Stop the timers and release the mosaic."""
+
+        self.view_timer.stop()
+        self.hover_timer.stop()
+        self.mosaic.close()
+
+    def _on_key(self: Self, event: KeyEvent) -> None:
+        """
+        Cycle through the mean, minimum, and maximum of the pixels
+        merged in zoomed-out views on M.
+        """
+
+        if event.key == "m":
+            modes = list(MODES)
+            self.display_mode = modes[
+                (modes.index(self.display_mode) + 1) % len(modes)
+            ]
+
+            self._render_view()
+
+    def _on_move(self: Self, event: MouseEvent) -> None:
+        """Queue a temperature text update on mouse movement."""
+
+        if self.hover_event is None:
+            self.hover_timer.start()
+
+        self.hover_event = event
+
+    @traced("hover")
+    def _update_hover(self: Self) -> None:
+        """
+        Show the temperature of the pixel under the cursor, read from
+        its tile alone, and blit the readout.
+        """
+
+        event, self.hover_event = self.hover_event, None
+
+        if event is None:
+            return
+
+        pixel = None
+
+        if event.inaxes is self.panel:
+            pixel = (int(np.floor(event.xdata + 0.5)),
+                int(np.floor(event.ydata + 0.5)))
+
+            if not (0 <= pixel[0] < self.mosaic.width
+                    and 0 <= pixel[1] < self.mosaic.height):
+                pixel = None
+
+        if pixel == self.hover_pixel:
+            return
+
+        self.hover_pixel = pixel
+
+        if pixel is not None:
+            x, y = pixel
+            temp_c = self.mosaic.temperature((x, y, x+1, y+1),
+                dtype=np.float64)[0, 0]
+
+            self.temperature_text.set_text(
+                f"({x}, {y})  {ThermalGUI._format_readout(temp_c)}"
+            )
+
+        self.window.canvas.restore_region(self.bg)
+        self.temperature_text.set_visible(pixel is not None)
+
+        if pixel is not None:
+            self.panel.draw_artist(self.temperature_text)
+
+        self.window.canvas.blit(self.hover_bbox)
+
+    def _set_palette(self: Self, palette: str) -> None:
+        """
+        Set the colormap, rebuild the palette table of each metadata,
+        and render the view again.
+        """
+
+        cmap = CMAPS[palette]
+        vmin, vmax = self.limits[DEFAULT_VMIN], self.limits[DEFAULT_VMAX]
+
+        self.image.set_cmap(cmap)
+        self.image.set_clim(vmin=vmin, vmax=vmax)
+        self.palettes = {
+            index: palette_lut(self.mosaic.lut(index), self.image.get_cmap(),
+                vmin, vmax)
+            for index in range(len(self.mosaic.metadata))
+        }
+
+        self._render_view()
+
+    @traced("render")
+    def _render_view(self: Self) -> None:
+        """
+        Render the part of the mosaic visible in the image panel, with
+        one sample per screen pixel or more.
+        """
+
+        (left, right), (bottom, top) = (self.panel.get_xlim(),
+            self.panel.get_ylim())
+        # Pixel centres lie on integer coordinates
+        x0, y0 = (int(np.floor(min(left, right) + 0.5)),
+            int(np.floor(min(bottom, top) + 0.5)))
+        x1, y1 = (int(np.ceil(max(left, right) + 0.5)),
+            int(np.ceil(max(bottom, top) + 0.5)))
+        x0, x1 = np.clip((x0, x1), 0, self.mosaic.width)
+        y0, y1 = np.clip((y0, y1), 0, self.mosaic.height)
+
+        if x1 <= x0 or y1 <= y0:
+            self.image.set_visible(False)
+            self.window.canvas.draw_idle()
+            return
+
+        extent = self.panel.get_window_extent()
+        scale = min((x1 - x0) / max(extent.width, 1.0),
+            (y1 - y0) / max(extent.height, 1.0))
+        step = max(1, int(scale))
+        level = level_for(scale, len(self.mosaic.pyramid))
+
+        if level > 0:
+            values, image_extent = self.mosaic.overview(level,
+                (x0, y0, x1, y1), step >> level, self.display_mode)
+            rgba = colorize(values, self.image.get_cmap(),
+                *self.image.get_clim())
+        else:
+            rgba = self.mosaic.render(self.palettes, (x0, y0, x1, y1), step)
+            rows, cols = rgba.shape[:2]
+            image_extent = (x0-0.5, x0+cols*step-0.5, y0+rows*step-0.5,
+                y0-0.5)
+
+        self.image.set_data(rgba)
+        self.image.set_extent(image_extent)
+        self.image.set_visible(True)
+
+        self.window.canvas.draw_idle()
+
+
+@traced("load_file")
+def load_file(file_path: str) -> tuple[Optional[ThermalSequence],
+        ThermalImage]:
+    """
+    Load an image, or the first frame of a sequence along with the
+    sequence.
+    """
+
+    sequence = None
+
+    try:
+        if file_path.lower().endswith(SEQUENCE_EXTENSIONS):
+            sequence = ThermalSequence(file_path)
+            data = sequence.image(0)
+        else:
+            data = ThermalImage(file_path)
+    except Exception:
+        if sequence is not None:
+            sequence.close()
+
+        raise
+
+    return sequence, data
+
+
+def _close_sequence(future: Future) -> None:
+    """Close the sequence of a discarded load."""
+
+    if not future.cancelled() and future.exception() is None:
+        sequence, _ = future.result()
+
+        if sequence is not None:
+            sequence.close()
+
+
+def _marker_data(spot: Optional[tuple[int, int]]) -> tuple[list, list]:
+    """
+    Return the marker coordinates of a hotspot or coldspot, or no
+    coordinates for frames without valid temperatures.
+    """
+
+    if spot is None:
+        return [], []
+
+    return [spot[0]], [spot[1]]
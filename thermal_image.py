@@ -21,15 +21,30 @@ Includes ThermalImage class and temperature conversion functions.
 """
 
 
-from dataclasses import dataclass, field
-from typing import Self
-import subprocess
+from dataclasses import dataclass, field, fields
+from functools import lru_cache, cached_property
+from concurrent.futures import ThreadPoolExecutor
+from typing import Self, Optional, Sequence
+import threading
+import warnings
+import struct
+import base64
+import copy
+import json
+import os
 
 import numpy as np
-import cv2
+import numpy.typing
 
+from flir import FFFReader, imdecode, humidity_fraction
+from raw_frame import find_sidecar, read_sidecar, read_raw16
+from exiftool_pool import get_pool
+from thermal_cache import ThermalCache, get_cache
+from thermal_roi import IntegralImage
+from thermal_trace import stage, traced
 
-METADATA_KEYS = {
+
+METADATA_KEYS = (
     "Emissivity",
     "Object Distance",
     "Reflected Apparent Temperature",
@@ -45,8 +60,29 @@ METADATA_KEYS = {
     "Planck F",
     "Planck O",
     "Planck R2"
-}
+)
 RANGE_16BIT = 65536
+# Raw data is 16-bit unsigned, in either byte order
+RAW_DTYPES = (np.dtype("<u2"), np.dtype(">u2"))
+LUT_CACHE_SIZE = 32
+# Conversion tile size: 64K float64 pixels (512 KiB) stay in the L2
+# cache through the whole formula
+TILE_PIXELS = 1 << 16
+# Frames from one megapixel up are converted in tiles
+TILED_MIN_PIXELS = 1 << 20
+TEMPERATURE_UNITS = ("kelvin", "celsius", "fahrenheit")
+# External parameters that can be changed after loading
+EXTERNAL_PARAMETERS = {
+    "e": "Emissivity",
+    "od": "Object Distance",
+    "rat": "Reflected Apparent Temperature",
+    "at": "Atmospheric Temperature",
+    "rh": "Relative Humidity"
+}
+# Parameters each derived term of Metadata depends on
+TAU_PARAMETERS = {"od", "rh", "at", "ata1", "ata2", "atb1", "atb2", "atx"}
+RA_PARAMETERS = {"at", "pr1", "pb", "pf", "po", "pr2"}
+RR_PARAMETERS = {"rat", "pr1", "pb", "pf", "po", "pr2"}
 
 
 @dataclass
@@ -55,6 +91,10 @@ class Metadata:
     External parameters, calibration parameters, and coefficients for
     raw-to-temperature conversion.
 
+    Any parameter may also be an array broadcastable to the image
+    shape (e.g. an emissivity or distance map), in which case the
+    derived coefficients are arrays as well.
+
     Attributes
     ----------
     e : float
@@ -122,16 +162,62 @@ class Metadata:
         radiance), and rr (reflected radiance).
         """
 
+        self._compute_tau()
+        self._compute_ra()
+        self._compute_rr()
+
+    def _compute_tau(self: Self) -> None:
+        """Compute tau (atmospheric transmission)."""
+
         h2o = self.rh * np.exp(1.5587+0.06939*self.at-0.00027816*self.at**2
             +0.00000068455*self.at**3)
         self.tau = self.atx*np.exp(-np.sqrt(self.od)*(self.ata1+self.atb1
             *np.sqrt(h2o))) + (1.0-self.atx)*np.exp(-np.sqrt(self.od)
             *(self.ata2+self.atb2*np.sqrt(h2o)))
+
+    def _compute_ra(self: Self) -> None:
+        """Compute ra (atmospheric radiance)."""
+
         self.ra = self.pr1/(self.pr2*(np.exp(self.pb/(self.at+273.15))
             -self.pf)) - self.po
+
+    def _compute_rr(self: Self) -> None:
+        """Compute rr (reflected radiance)."""
+
         self.rr = self.pr1/(self.pr2*(np.exp(self.pb/(self.rat+273.15))
             -self.pf)) - self.po
 
+    @property
+    def per_pixel(self: Self) -> bool:
+        """Whether any parameter is an array (a per-pixel map)."""
+
+        return any(np.ndim(getattr(self, f.name)) for f in fields(self))
+
+    def replace(self: Self, **changes: float | np.ndarray) -> Self:
+        """
+        Return a copy with the parameters changed, recomputing only the
+        derived terms (tau, ra, rr) that depend on them.
+        """
+
+        unknown = set(changes) - {f.name for f in fields(self) if f.init}
+
+        if unknown:
+            raise ValueError(f"Unknown parameters: {', '.join(unknown)}")
+
+        m = copy.copy(self)
+
+        for name, value in changes.items():
+            setattr(m, name, value)
+
+        if TAU_PARAMETERS & changes.keys():
+            m._compute_tau()
+        if RA_PARAMETERS & changes.keys():
+            m._compute_ra()
+        if RR_PARAMETERS & changes.keys():
+            m._compute_rr()
+
+        return m
+
 
 class ThermalImage:
     """
@@ -139,54 +225,282 @@ class ThermalImage:
     image.
 
     Extracts raw thermal data, and converts it to Kelvin, Celsius, and
-    Fahrenheit.
+    Fahrenheit. FLIR records are read natively, with ExifTool as a
+    fallback for files the native reader does not understand.
+
+    Temperature arrays are converted on first access, in the selected
+    floating-point dtype, and cached until dropped.
     """
     
-    def __init__(self: Self, file_path: str) -> None:
+    def __init__(self: Self, file_path: str,
+            dtype: np.typing.DTypeLike = np.float64,
+            cache: Optional[ThermalCache] = None) -> None:
         """
         Initialize a ThermalImage instance from the radiometric input.
+
+        Decoded data is read from and written to the cache, or to the
+        cache configured by the environment if none is given.
+        """
+
+        with stage("load", file=file_path):
+            self._set_dtype(dtype)
+
+            self.file_path = file_path
+            self._reader = None
+            self._exiftool_data = None
+
+            cache = cache or get_cache()
+            entry = None
+            sidecar = find_sidecar(file_path)
+
+            if sidecar is not None:
+                # Raw frames are read at disk speed and need no cache
+                entry = self._read_raw_frame(sidecar)
+            elif cache is not None:
+                with stage("cache_load"):
+                    entry = cache.load(file_path)
+
+            if entry is not None:
+                self.raw, self.metadata = entry
+            else:
+                self._reader = self._open_reader()
+                self.raw = self._extract_raw_data()
+                self.metadata = {}
+                self._extract_metadata()
+
+                if cache is not None and sidecar is None:
+                    with stage("cache_store"):
+                        cache.store(file_path, self.raw, self.metadata)
+
+            self._set_calibration()
+
+    @classmethod
+    def from_raw(cls: type[Self], raw: np.ndarray, metadata: dict[str, float],
+            file_path: str = "",
+            dtype: np.typing.DTypeLike = np.float64) -> Self:
+        """
+        Create a ThermalImage instance from raw uint16 data and its
+        metadata (values of METADATA_KEYS) without reading a file.
         """
 
-        self.file_path = file_path
+        if raw.dtype not in RAW_DTYPES:
+            raise ValueError("Invalid raw thermal image format")
 
-        data = self._extract_raw_data()
-        self.shape = data.shape
+        data = cls.__new__(cls)
+        data._set_dtype(dtype)
 
-        self.metadata = {}
-        self._extract_metadata()
-        mdata = self._parse_metadata()
-        
-        self.kelvin = to_kelvin(raw=data, m=mdata)
-        self.celsius = to_celsius(self.kelvin)
-        self.fahrenheit = to_fahrenheit(self.celsius)
+        data.file_path = file_path
+        data.raw = raw
+        data.metadata = {key: float(metadata[key]) for key in METADATA_KEYS}
+
+        data._set_calibration()
+
+        return data
+
+    def _set_dtype(self: Self, dtype: np.typing.DTypeLike) -> None:
+        """Set the floating-point dtype of the temperature arrays."""
+
+        self.dtype = np.dtype(dtype)
+
+        if not np.issubdtype(self.dtype, np.floating):
+            raise ValueError("Temperature dtype must be floating-point")
+
+    @traced("calibration")
+    def _set_calibration(self: Self) -> None:
+        """Parse the metadata and set up the calibration curve."""
+
+        self.shape = self.raw.shape
+        self.mdata = parse_metadata(self.metadata)
+
+        # Release the file buffers once everything is decoded
+        self._reader = self._exiftool_data = None
+
+        self.calibration_data = self._calibration_curve()
+
+    @cached_property
+    def kelvin(self: Self) -> np.ndarray:
+        """Temperatures in Kelvin."""
+
+        return self.temperature("kelvin", self.dtype)
+
+    @cached_property
+    def celsius(self: Self) -> np.ndarray:
+        """Temperatures in Celsius."""
+
+        return self.temperature("celsius", self.dtype)
+
+    @cached_property
+    def fahrenheit(self: Self) -> np.ndarray:
+        """Temperatures in Fahrenheit."""
+
+        return self.temperature("fahrenheit", self.dtype)
+
+    @cached_property
+    def integral(self: Self) -> IntegralImage:
+        """Summed-area tables of the Celsius temperatures."""
 
-        self.calibration_data = to_celsius(
-            to_kelvin(raw=np.arange(RANGE_16BIT), m=mdata)
+        return IntegralImage(self.temperature("celsius"))
+
+    def temperature(self: Self, unit: str = "celsius",
+            dtype: np.typing.DTypeLike = np.float64) -> np.ndarray:
+        """
+        Convert the raw data to temperatures in the unit and dtype,
+        without caching. Scalar parameters go through the lookup table,
+        per-pixel parameter maps through the conversion formula.
+        """
+
+        with stage("convert", unit=unit):
+            if not self.mdata.per_pixel:
+                return temperature_lut(self.mdata, unit, dtype)[self.raw]
+
+            kelvin = to_kelvin(raw=self.raw, m=self.mdata)
+
+            return from_kelvin(kelvin, unit).astype(dtype, copy=False)
+
+    def snapshot(self: Self) -> Self:
+        """
+        Return a copy of the image that later parameter changes leave
+        untouched. Parameter changes replace the parsed metadata and the
+        temperature arrays rather than modifying them, so a shallow copy
+        with its own metadata dict suffices.
+        """
+
+        snapshot = copy.copy(self)
+        snapshot.metadata = dict(self.metadata)
+
+        return snapshot
+
+    def set_parameters(self: Self, **parameters: float | np.ndarray) -> None:
+        """
+        Change external parameters (e, od, rat, at, rh) without
+        reloading the file. Values are scalars or per-pixel maps of the
+        image shape. Only the affected atmospheric terms are recomputed
+        and the temperature arrays are converted again on next access.
+        """
+
+        for name, value in parameters.items():
+            if name not in EXTERNAL_PARAMETERS:
+                raise ValueError(f"Unknown external parameter: {name}")
+            if np.ndim(value) and np.shape(value) != self.shape:
+                raise ValueError("Parameter maps must match the image shape")
+
+        self.mdata = self.mdata.replace(**{
+            name: np.asarray(value, dtype=np.float64) if np.ndim(value)
+                else float(value)
+            for name, value in parameters.items()
+        })
+
+        for name, value in parameters.items():
+            if not np.ndim(value):
+                self.metadata[EXTERNAL_PARAMETERS[name]] = float(value)
+
+        self.calibration_data = self._calibration_curve()
+        self.drop_temperatures()
+
+    def _calibration_curve(self: Self) -> np.ndarray:
+        """
+        Return the Celsius calibration curve, using the mean of any
+        per-pixel parameter map.
+        """
+
+        nominal = self.mdata.replace(**{
+            name: float(np.nanmean(getattr(self.mdata, name)))
+            for name in EXTERNAL_PARAMETERS
+            if np.ndim(getattr(self.mdata, name))
+        })
+
+        return temperature_lut(m=nominal, unit="celsius")
+
+    def rectangle_stats(self: Self, rectangles: np.typing.ArrayLike,
+            unit: str = "celsius",
+            extrema: bool = False) -> dict[str, np.ndarray]:
+        """
+        Return the count, mean, and std temperatures of each rectangle,
+        given as rows of (x0, y0, x1, y1) with exclusive ends, plus the
+        min and max with extrema. Mean and std take constant time per
+        rectangle; min and max read the pixels of each rectangle.
+        """
+
+        return _convert_roi_stats(
+            self.integral.rectangle_stats(rectangles, extrema), unit
         )
 
-    def _extract_raw_data(self: Self) -> np.ndarray:
+    def polygon_stats(self: Self, polygons: Sequence[np.typing.ArrayLike],
+            unit: str = "celsius") -> dict[str, np.ndarray]:
         """
-        Extract raw thermal data from the radiometric input using
-        ExifTool.
+        Return the count, mean, std, min, and max temperatures of each
+        polygon, given as an array of (x, y) vertices.
         """
-        
+
+        return _convert_roi_stats(self.integral.polygon_stats(polygons), unit)
+
+    def drop_temperatures(self: Self) -> None:
+        """
+        Release the cached temperature arrays and integral images. They
+        are computed again on next access.
+        """
+
+        for unit in TEMPERATURE_UNITS:
+            self.__dict__.pop(unit, None)
+
+        self.__dict__.pop("integral", None)
+
+    @traced("read_raw_frame")
+    def _read_raw_frame(self: Self,
+            sidecar: str) -> tuple[np.ndarray, dict[str, float]]:
+        """
+        Read a raw 16-bit frame (PNG, TIFF, .raw, or .npy) and its
+        metadata from the JSON sidecar. The sidecar holds the values of
+        METADATA_KEYS and, for headerless .raw files, the raw thermal
+        image width and height and optionally the byte order.
+        """
+
+        values = read_sidecar(sidecar)
+        metadata = read_metadata(values, "sidecar")
+
+        raw = read_raw16(
+            file_path=self.file_path,
+            width=values.get("RawThermalImageWidth", values.get("width")),
+            height=values.get("RawThermalImageHeight", values.get("height")),
+            byte_order=values.get("ByteOrder", "II"),
+            swap=bool(values.get("SwapBytes", False))
+        )
+
+        return raw, metadata
+
+    @traced("open_reader")
+    def _open_reader(self: Self) -> Optional[FFFReader]:
+        """
+        Open the native FLIR reader, or return None if the input holds
+        no readable FFF data.
+        """
+
         try:
-            process = subprocess.run(
-                args=["exiftool", "-rawthermalimage", "-b", self.file_path],
-                capture_output=True, check=True
-            )
-        except FileNotFoundError:
-            raise RuntimeError("ExifTool not installed or missing from PATH")
-        except subprocess.CalledProcessError:
-            raise RuntimeError("ExifTool failed to process the file")
+            return FFFReader.from_file(self.file_path)
+        except (ValueError, struct.error):
+            return None
 
-        if not process.stdout:
+    @traced("extract_raw_data")
+    def _extract_raw_data(self: Self) -> np.ndarray:
+        """
+        Extract raw thermal data from the radiometric input, natively
+        if possible and using ExifTool otherwise.
+        """
+
+        if self._reader is not None:
+            try:
+                return self._reader.raw_thermal_image()
+            except (ValueError, struct.error):
+                pass
+
+        value = self._read_exiftool().get("RawThermalImage")
+
+        if not isinstance(value, str) or not value.startswith("base64:"):
             raise ValueError("No data extracted from the file")
 
-        raw_image = cv2.imdecode(
-            buf=np.frombuffer(buffer=process.stdout, dtype=np.uint8),
-            flags=cv2.IMREAD_UNCHANGED
-        )
+        output = base64.b64decode(value[len("base64:"):])
+
+        raw_image = imdecode(output)
 
         if raw_image is None:
             raise ValueError("No data decoded")
@@ -195,56 +509,108 @@ class ThermalImage:
 
         # Endianness check (must be little-endian for converting)
         # Swap byte order in case of MM (big-endian) or formats 
-        # other than TIFF
-        if process.stdout[:2] != b"II":
-            raw_image = raw_image.byteswap()
+        # other than TIFF, as a view instead of a copy
+        if output[:2] != b"II":
+            raw_image = raw_image.view(raw_image.dtype.newbyteorder())
         
-        return raw_image.astype(np.float32)
+        return raw_image
     
+    @traced("extract_metadata")
     def _extract_metadata(self: Self) -> None:
         """
-        Extract metadata from the radiometric input using ExifTool.
+        Extract metadata from the radiometric input, natively if
+        possible and using ExifTool otherwise.
         """
 
-        process = subprocess.run(
-            args=["exiftool", self.file_path], capture_output=True, text=True
-        )
+        if self._reader is not None:
+            try:
+                info = self._reader.camera_info()
+                self.metadata = {key: info[key] for key in METADATA_KEYS}
+                return
+            except (ValueError, struct.error):
+                pass
 
-        for line in process.stdout.splitlines():
-            if len(self.metadata) >= len(METADATA_KEYS):
-                break
-
-            parts = line.split(":")
-            key = parts[0].strip()
-
-            if key in METADATA_KEYS:
-                value = float(parts[1].split()[0])
-                self.metadata[key] = value
-
-    def _parse_metadata(self: Self) -> Metadata:
-        """Parse metadata into a Metadata instance."""
-
-        return Metadata(
-            e=self.metadata["Emissivity"],
-            od=self.metadata["Object Distance"],
-            rat=self.metadata["Reflected Apparent Temperature"],
-            at=self.metadata["Atmospheric Temperature"],
-            rh=self.metadata["Relative Humidity"],
-            ata1=self.metadata["Atmospheric Trans Alpha 1"],
-            ata2=self.metadata["Atmospheric Trans Alpha 2"],
-            atb1=self.metadata["Atmospheric Trans Beta 1"],
-            atb2=self.metadata["Atmospheric Trans Beta 2"],
-            atx=self.metadata["Atmospheric Trans X"],
-            pr1=self.metadata["Planck R1"],
-            pb=self.metadata["Planck B"],
-            pf=self.metadata["Planck F"],
-            po=self.metadata["Planck O"],
-            pr2=self.metadata["Planck R2"]
-        )
+        self.metadata = read_metadata(self._read_exiftool(), "file")
+
+    def _read_exiftool(self: Self) -> dict:
+        """
+        Extract the raw thermal image and the numeric values of the
+        metadata tags in a single ExifTool pass, as JSON.
+        """
+
+        if self._exiftool_data is not None:
+            return self._exiftool_data
+
+        with stage("exiftool"):
+            output = get_pool().execute(
+                "-json", "-n", "-b", "-RawThermalImage",
+                *(f"-{key.replace(' ', '')}" for key in METADATA_KEYS),
+                self.file_path
+            )
+
+        try:
+            self._exiftool_data = json.loads(output)[0]
+        except (ValueError, IndexError, KeyError):
+            raise ValueError("No data extracted from the file")
+
+        return self._exiftool_data
 
 
-def to_kelvin(raw: np.ndarray, m: Metadata) -> np.ndarray:
-    """Convert the raw thermal data to Kelvin."""
+def read_metadata(values: dict[str, object],
+        source: str = "file") -> dict[str, float]:
+    """
+    Read the values of METADATA_KEYS from tags keyed without spaces
+    (e.g. "PlanckR1"), as in ExifTool output and sidecars. Relative
+    humidity given in percent is converted to a fraction.
+    """
+
+    try:
+        metadata = {
+            key: float(values[key.replace(" ", "")])
+            for key in METADATA_KEYS
+        }
+    except (KeyError, TypeError, ValueError):
+        raise ValueError(f"Incomplete metadata in the {source}")
+
+    metadata["Relative Humidity"] = humidity_fraction(
+        metadata["Relative Humidity"]
+    )
+
+    return metadata
+
+
+def parse_metadata(metadata: dict[str, float]) -> Metadata:
+    """Parse metadata into a Metadata instance."""
+
+    return Metadata(
+        e=metadata["Emissivity"],
+        od=metadata["Object Distance"],
+        rat=metadata["Reflected Apparent Temperature"],
+        at=metadata["Atmospheric Temperature"],
+        rh=metadata["Relative Humidity"],
+        ata1=metadata["Atmospheric Trans Alpha 1"],
+        ata2=metadata["Atmospheric Trans Alpha 2"],
+        atb1=metadata["Atmospheric Trans Beta 1"],
+        atb2=metadata["Atmospheric Trans Beta 2"],
+        atx=metadata["Atmospheric Trans X"],
+        pr1=metadata["Planck R1"],
+        pb=metadata["Planck B"],
+        pf=metadata["Planck F"],
+        po=metadata["Planck O"],
+        pr2=metadata["Planck R2"]
+    )
+
+
+def to_kelvin(raw: np.ndarray, m: Metadata,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert the raw thermal data to Kelvin. Frames of TILED_MIN_PIXELS
+    or more, and conversions into a preallocated float64 output, run in
+    tiles on the conversion threads with identical results.
+    """
+
+    if out is not None or raw.size >= TILED_MIN_PIXELS:
+        return to_kelvin_tiled(raw, m, out)
 
     obj_signal = (raw-m.ra*(1.0-m.tau)-(m.rr*m.tau*(1.0-m.e))) / (m.e*m.tau)
 
@@ -256,6 +622,172 @@ def to_kelvin(raw: np.ndarray, m: Metadata) -> np.ndarray:
         )
 
 
+def to_kelvin_tiled(raw: np.ndarray, m: Metadata,
+        out: Optional[np.ndarray] = None,
+        tile_pixels: int = TILE_PIXELS) -> np.ndarray:
+    """
+    Convert the raw thermal data to Kelvin in tiles of tile_pixels,
+    computed in place in the float64 output by the conversion threads.
+    Temporaries are tile-sized, and per-pixel parameter maps are sliced
+    along with the raw data.
+    """
+
+    if out is None:
+        out = np.empty(raw.shape, dtype=np.float64)
+    elif out.shape != raw.shape or out.dtype != np.float64:
+        raise ValueError("Output must be a float64 array of the raw shape")
+    if not out.flags.c_contiguous:
+        raise ValueError("Output must be C-contiguous")
+
+    flat_raw = raw.reshape(-1)
+    flat_out = out.reshape(-1)
+    # Per-pixel maps, which may only be broadcastable to the frame, are
+    # expanded and flattened once; scalars are passed as they are
+    params = {
+        name: np.broadcast_to(value, raw.shape).reshape(-1)
+            if np.ndim(value) else value
+        for name, value in ((name, getattr(m, name)) for name in
+            ("e", "tau", "ra", "rr", "pr1", "pr2", "pb", "pf", "po"))
+    }
+    bounds = [(start, min(start + tile_pixels, flat_raw.size))
+        for start in range(0, flat_raw.size, tile_pixels)]
+
+    def convert(start: int, stop: int) -> None:
+        _kelvin_tile(flat_raw[start:stop], flat_out[start:stop], {
+            name: value[start:stop] if np.ndim(value) else value
+            for name, value in params.items()
+        })
+
+    executor = get_converter() if len(bounds) > 1 else None
+
+    if executor is None:
+        for start, stop in bounds:
+            convert(start, stop)
+    else:
+        # Results are consumed to propagate exceptions from the threads
+        for _ in executor.map(convert, *zip(*bounds)):
+            pass
+
+    return out
+
+
+def _kelvin_tile(raw: np.ndarray, out: np.ndarray,
+        p: dict[str, float | np.ndarray]) -> None:
+    """
+    Convert one tile in place, in the operation order of to_kelvin so
+    that the results are bit-identical.
+    """
+
+    np.subtract(raw, p["ra"]*(1.0-p["tau"]), out=out)
+    np.subtract(out, p["rr"]*p["tau"]*(1.0-p["e"]), out=out)
+    np.divide(out, p["e"]*p["tau"], out=out)
+    # NaN signals are invalid as well, as in the comparison of to_kelvin
+    invalid = np.greater(out, 0.0)
+    np.logical_not(invalid, out=invalid)
+
+    # The error state is per thread, so it is set in each tile
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.add(out, p["po"], out=out)
+        np.multiply(p["pr2"], out, out=out)
+        np.divide(p["pr1"], out, out=out)
+        np.add(out, p["pf"], out=out)
+        np.log(out, out=out)
+        np.divide(p["pb"], out, out=out)
+
+    out[invalid] = np.nan
+
+
+_converter: Optional[ThreadPoolExecutor] = None
+_converter_lock = threading.Lock()
+
+
+def get_converter() -> Optional[ThreadPoolExecutor]:
+    """
+    Return the shared conversion thread pool, creating it on first use,
+    or None for a single thread. The size is read from the
+    THERMIMPRO_THREADS environment variable and defaults to the number
+    of CPUs, also with a warning if the variable is not an integer.
+    """
+
+    global _converter
+
+    with _converter_lock:
+        if _converter is None:
+            default = os.cpu_count() or 1
+            value = os.environ.get("THERMIMPRO_THREADS", "")
+
+            try:
+                threads = int(value) if value.strip() else default
+            except ValueError:
+                warnings.warn(f"Invalid THERMIMPRO_THREADS {value!r}, "
+                    f"defaulting to {default}", RuntimeWarning)
+                threads = default
+
+            if threads <= 1:
+                return None
+
+            _converter = ThreadPoolExecutor(threads,
+                thread_name_prefix="thermimpro-convert")
+
+        return _converter
+
+
+def calibration_key(m: Metadata) -> tuple[float, ...]:
+    """
+    Return the conversion inputs of the metadata (external and
+    calibration parameters) as a hashable key.
+    """
+
+    return tuple(float(getattr(m, f.name)) for f in fields(m) if f.init)
+
+
+@lru_cache(maxsize=LUT_CACHE_SIZE)
+def _build_lut(key: tuple[float, ...], unit: str = "kelvin",
+        dtype: str = "float64") -> np.ndarray:
+    """
+    Build a read-only lookup table of temperatures in the unit for all
+    16-bit values.
+    """
+
+    if unit == "kelvin":
+        lut = to_kelvin(raw=np.arange(RANGE_16BIT), m=Metadata(*key))
+    else:
+        # Same arguments as temperature_lut, so the Kelvin table is
+        # cached once under a single key
+        lut = from_kelvin(_build_lut(key, "kelvin", "float64"), unit)
+
+    # Tables are computed in float64 and rounded once to the dtype
+    lut = lut.astype(dtype, copy=False)
+    lut.flags.writeable = False
+
+    return lut
+
+
+def temperature_lut(m: Metadata, unit: str = "kelvin",
+        dtype: np.typing.DTypeLike = np.float64) -> np.ndarray:
+    """
+    Return the cached lookup table of temperatures in the unit
+    ("kelvin", "celsius", or "fahrenheit") and dtype for the metadata.
+    Images taken with the same camera and settings share one table.
+    """
+
+    return _build_lut(calibration_key(m), unit, np.dtype(dtype).name)
+
+
+def _convert_roi_stats(stats: dict[str, np.ndarray],
+        unit: str) -> dict[str, np.ndarray]:
+    """Convert region statistics in Celsius to the unit."""
+
+    for key in ("mean", "min", "max"):
+        if key in stats:
+            stats[key] = from_celsius(stats[key], unit)
+
+    if unit == "fahrenheit":
+        stats["std"] = stats["std"] * 9.0/5.0
+
+    return stats
+
+
 def to_celsius(kelvin: np.ndarray) -> np.ndarray:
     """Convert the thermal data in Kelvin to Celsius."""
 
@@ -266,3 +798,36 @@ def to_fahrenheit(celsius: np.ndarray) -> np.ndarray:
     """Convert the thermal data in Celsius to Fahrenheit."""
 
     return celsius*9.0/5.0 + 32.0
+
+
+def from_celsius(celsius: float | np.ndarray,
+        unit: str = "celsius") -> float | np.ndarray:
+    """
+    Convert the thermal data in Celsius to the unit ("kelvin",
+    "celsius", or "fahrenheit").
+    """
+
+    if unit == "celsius":
+        return celsius
+    if unit == "kelvin":
+        return celsius + 273.15
+    if unit == "fahrenheit":
+        return to_fahrenheit(celsius)
+
+    raise ValueError(f"Unknown temperature unit: {unit}")
+
+
+def from_kelvin(kelvin: np.ndarray, unit: str = "kelvin") -> np.ndarray:
+    """
+    Convert the thermal data in Kelvin to the unit ("kelvin",
+    "celsius", or "fahrenheit").
+    """
+
+    if unit == "kelvin":
+        return kelvin
+    if unit == "celsius":
+        return to_celsius(kelvin)
+    if unit == "fahrenheit":
+        return to_fahrenheit(to_celsius(kelvin))
+
+    raise ValueError(f"Unknown temperature unit: {unit}")
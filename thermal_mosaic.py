@@ -0,0 +1,676 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Out-of-core store for stitched thermal mosaics larger than memory. The
+raw data is kept in square tiles of a memory-mapped .npy file, each
+tile with the metadata of the image it was taken from, and conversion,
+stats, and display read one tile at a time. Zoomed-out views read a
+precomputed display pyramid instead of the tiles.
+"""
+
+
+from typing import Self, Callable, Iterator, Optional, Sequence
+import argparse
+import json
+import sys
+import os
+
+import numpy as np
+
+from thermal_image import (ThermalImage, METADATA_KEYS, RANGE_16BIT,
+    RAW_DTYPES, parse_metadata, temperature_lut)
+from thermal_stats import ThermalStats
+from thermal_pyramid import (MODES, MEAN, MAX, COUNT, reduce_image,
+    reduce_level, max_level)
+from thermal_trace import stage, traced
+
+
+MOSAIC_FILE = "mosaic.json"
+RAW_FILE = "raw.npy"
+PYRAMID_FILE = "pyramid_{}.npy"
+DEFAULT_TILE_SIZE = 512
+# Tile index of tiles without data
+EMPTY = -1
+# Raw value reserved for pixels without data, which have no temperature
+NODATA = 0
+
+
+class ThermalMosaic:
+    """
+    A mosaic of raw thermal data in a directory: the raw tiles as one
+    uint16 .npy file of shape (rows, columns, tile size, tile size),
+    memory-mapped so that every tile is contiguous on disk, and
+    mosaic.json with the size, the distinct metadata, and the metadata
+    index of each tile (-1 for empty tiles). Levels of the display
+    pyramid in Celsius, if built, are kept as pyramid_<level>.npy.
+
+    The raw value 0 (NODATA) is reserved: pixels never written hold it
+    and, like empty tiles, have no temperature, so raw zeros of added
+    images are treated as missing data too. Camera sensors do not
+    output 0 for valid readings, which start well above it. Tiles
+    cannot mix metadata, so images with different metadata must not
+    share a tile, unless an image covers the whole tile.
+    """
+
+    def __init__(self: Self, directory: str, mode: str = "r") -> None:
+        """
+        Open the mosaic in the directory, read-only or, with mode "r+",
+        for writing.
+        """
+
+        if mode not in ("r", "r+"):
+            raise ValueError(f"Unknown mode: {mode}")
+
+        self.directory = directory
+        self.writable = mode == "r+"
+
+        with open(os.path.join(directory, MOSAIC_FILE),
+                encoding="utf-8") as file:
+            header = json.load(file)
+
+        self.width = int(header["width"])
+        self.height = int(header["height"])
+        self.tile_size = int(header["tile_size"])
+        self.metadata = [
+            {key: float(entry[key]) for key in METADATA_KEYS}
+            for entry in header["metadata"]
+        ]
+        self.index = np.array(header["tiles"], dtype=np.int32)
+        self.tiles = np.load(os.path.join(directory, RAW_FILE),
+            mmap_mode=mode)
+
+        if (self.tiles.ndim != 4 or self.tiles.dtype not in RAW_DTYPES
+                or self.tiles.shape[:2] != self.index.shape
+                or self.tiles.shape[2:] != (self.tile_size,)*2):
+            raise ValueError("Invalid mosaic raw data")
+
+        self.pyramid = [
+            np.load(os.path.join(directory, PYRAMID_FILE.format(level)),
+                mmap_mode="r")
+            for level in range(1, int(header.get("pyramid_levels", 0)) + 1)
+        ]
+
+        self._luts = {}
+
+    @classmethod
+    def create(cls: type[Self], directory: str, width: int, height: int,
+            tile_size: int = DEFAULT_TILE_SIZE) -> Self:
+        """
+        Create an empty mosaic of the size in pixels in the directory
+        and open it for writing. The raw file is allocated sparsely.
+        """
+
+        if width <= 0 or height <= 0 or tile_size <= 0:
+            raise ValueError("Mosaic and tile sizes must be positive")
+
+        rows, cols = -(-height // tile_size), -(-width // tile_size)
+
+        os.makedirs(name=directory, exist_ok=True)
+
+        # Refuse to overwrite an existing mosaic
+        with open(os.path.join(directory, MOSAIC_FILE), "x",
+                encoding="utf-8") as file:
+            json.dump({
+                "width": width, "height": height, "tile_size": tile_size,
+                "metadata": [], "tiles": np.full((rows, cols), EMPTY).tolist()
+            }, file)
+
+        tiles = np.lib.format.open_memmap(os.path.join(directory, RAW_FILE),
+            mode="w+", dtype=np.uint16,
+            shape=(rows, cols, tile_size, tile_size))
+        del tiles
+
+        return cls(directory, "r+")
+
+    @classmethod
+    def from_raw(cls: type[Self], directory: str, raw: np.ndarray,
+            metadata: dict[str, float],
+            tile_size: int = DEFAULT_TILE_SIZE) -> Self:
+        """
+        Create a mosaic from a stitched raw frame with one set of
+        metadata, copying it tile by tile so that a memory-mapped
+        frame is never read into memory at once.
+        """
+
+        mosaic = cls.create(directory, raw.shape[1], raw.shape[0],
+            tile_size)
+        mosaic.add(raw, metadata)
+        mosaic.flush()
+
+        return mosaic
+
+    @property
+    def shape(self: Self) -> tuple[int, int]:
+        """Return the mosaic height and width in pixels."""
+
+        return self.height, self.width
+
+    def add(self: Self, raw: np.ndarray, metadata: dict[str, float],
+            x: int = 0, y: int = 0) -> None:
+        """
+        Write raw uint16 data with its metadata (values of
+        METADATA_KEYS) with the top-left corner at (x, y), overwriting
+        the pixels below it.
+        """
+
+        if not self.writable:
+            raise ValueError("Mosaic is opened read-only")
+        if raw.dtype not in RAW_DTYPES:
+            raise ValueError("Mosaics store uint16 raw data")
+
+        x0, y0 = max(x, 0), max(y, 0)
+        x1, y1 = (min(x + raw.shape[1], self.width),
+            min(y + raw.shape[0], self.height))
+
+        if x1 <= x0 or y1 <= y0:
+            raise ValueError("Image lies outside the mosaic")
+
+        entry = {key: float(metadata[key]) for key in METADATA_KEYS}
+
+        index = (self.metadata.index(entry) if entry in self.metadata
+            else len(self.metadata))
+        blocks = list(self._blocks(x0, y0, x1, y1, 1))
+
+        # Check all tiles first, so that a rejected image writes nothing
+        for row, col, tile, _ in blocks:
+            # Edge tiles are covered once their part inside the mosaic is
+            extent = (min(self.tile_size, self.height - row*self.tile_size),
+                min(self.tile_size, self.width - col*self.tile_size))
+            covered = all(s.stop - s.start == n for s, n in zip(tile, extent))
+
+            if self.index[row, col] not in (EMPTY, index) and not covered:
+                raise ValueError(
+                    f"Tile ({row}, {col}) already holds other metadata"
+                )
+
+        if index == len(self.metadata):
+            self.metadata.append(entry)
+
+        # The display pyramid no longer matches the tiles
+        self.pyramid = []
+
+        for row, col, tile, (rows, cols) in blocks:
+            self.tiles[row, col][tile] = raw[
+                rows.start + y0 - y:rows.stop + y0 - y,
+                cols.start + x0 - x:cols.stop + x0 - x
+            ]
+            self.index[row, col] = index
+
+    def add_image(self: Self, data: ThermalImage, x: int = 0,
+            y: int = 0) -> None:
+        """
+        Write a thermal image with the top-left corner at (x, y).
+        Images with per-pixel parameter maps cannot be stored.
+        """
+
+        if data.mdata.per_pixel:
+            raise ValueError("Mosaic tiles cannot hold per-pixel parameters")
+
+        self.add(data.raw, data.metadata, x, y)
+
+    def flush(self: Self) -> None:
+        """Write the raw tiles and the tile metadata to disk."""
+
+        if not self.writable:
+            return
+
+        self.tiles.flush()
+
+        path = os.path.join(self.directory, MOSAIC_FILE)
+
+        # Replaced atomically, so readers never see a partial header
+        with open(path + ".tmp", "w", encoding="utf-8") as file:
+            json.dump({
+                "width": self.width, "height": self.height,
+                "tile_size": self.tile_size, "metadata": self.metadata,
+                "tiles": self.index.tolist(),
+                "pyramid_levels": len(self.pyramid)
+            }, file)
+
+        os.replace(path + ".tmp", path)
+
+    def close(self: Self) -> None:
+        """Flush a writable mosaic and release the memory map."""
+
+        self.flush()
+        self.tiles = None
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *_: object) -> None:
+        self.close()
+
+    def image(self: Self, row: int, col: int) -> Optional[ThermalImage]:
+        """
+        Return a tile as a thermal image with its metadata, or None for
+        an empty tile. Edge tiles are cropped to the mosaic.
+        """
+
+        index = self.index[row, col]
+
+        if index == EMPTY:
+            return None
+
+        raw = self.tiles[row, col,
+            :self.height - row*self.tile_size,
+            :self.width - col*self.tile_size]
+
+        return ThermalImage.from_raw(raw, self.metadata[index],
+            f"{self.directory}[{row},{col}]")
+
+    def lut(self: Self, index: int, unit: str = "celsius",
+            dtype: np.typing.DTypeLike = np.float64) -> np.ndarray:
+        """
+        Return the temperature lookup table of the metadata index in
+        the unit and dtype, without a temperature for NODATA.
+        """
+
+        key = (index, unit, np.dtype(dtype).name)
+
+        if (lut := self._luts.get(key)) is None:
+            lut = temperature_lut(parse_metadata(self.metadata[index]),
+                unit, dtype).copy()
+            lut[NODATA] = np.nan
+            lut.flags.writeable = False
+
+            self._luts[key] = lut
+
+        return lut
+
+    def read_raw(self: Self, region: Optional[Sequence[int]] = None,
+            step: int = 1) -> np.ndarray:
+        """
+        Return the raw data of a region (x0, y0, x1, y1) with exclusive
+        ends, the whole mosaic by default, sampling every step-th pixel.
+        Only the tiles intersecting the region are read.
+        """
+
+        return self._read(region, step, self.tiles.dtype, NODATA,
+            lambda raw, _: raw)
+
+    def temperature(self: Self, region: Optional[Sequence[int]] = None,
+            unit: str = "celsius", dtype: np.typing.DTypeLike = np.float32,
+            step: int = 1) -> np.ndarray:
+        """
+        Convert a region (x0, y0, x1, y1) with exclusive ends, the whole
+        mosaic by default, to temperatures in the unit and dtype,
+        sampling every step-th pixel. Each tile is converted through
+        the lookup table of its metadata.
+        """
+
+        with stage("convert", unit=unit):
+            return self._read(region, step, dtype, np.nan,
+                lambda raw, index: self.lut(index, unit, dtype)[raw])
+
+    def render(self: Self, palettes: dict[int, np.ndarray],
+            region: Optional[Sequence[int]] = None,
+            step: int = 1) -> np.ndarray:
+        """
+        Render a region as RGBA bytes through the packed palette table
+        of each metadata index (see thermal_render.palette_lut). Empty
+        tiles are transparent.
+        """
+
+        colors = self._read(region, step, np.uint32, 0,
+            lambda raw, index: np.take(palettes[index], raw))
+
+        return colors.view(np.uint8).reshape(*colors.shape, 4)
+
+    def convert(self: Self, path: str, unit: str = "celsius",
+            dtype: np.typing.DTypeLike = np.float32) -> np.ndarray:
+        """
+        Convert the whole mosaic to temperatures in the unit and dtype,
+        written tile by tile into a memory-mapped .npy file.
+        """
+
+        out = np.lib.format.open_memmap(path, mode="w+", dtype=dtype,
+            shape=self.shape)
+
+        for row, col, tile, window in self._blocks(0, 0, self.width,
+                self.height, 1):
+            index = self.index[row, col]
+
+            if index == EMPTY:
+                out[window] = np.nan
+                continue
+
+            with stage("convert", unit=unit):
+                out[window] = self.lut(index, unit, dtype)[
+                    self.tiles[row, col][tile]
+                ]
+
+        out.flush()
+
+        return out
+
+    @traced("build_pyramid")
+    def build_pyramid(self: Self) -> None:
+        """
+        Build the display pyramid in Celsius up to the coarsest level:
+        the first level from one tile at a time, each further level
+        from bands of the previous one. Requires an even tile size.
+        """
+
+        if not self.writable:
+            raise ValueError("Mosaic is opened read-only")
+        if self.tile_size % 2:
+            raise ValueError("Display pyramids require an even tile size")
+
+        half = self.tile_size // 2
+        level = self._create_level(1)
+
+        for (row, col), index in np.ndenumerate(self.index):
+            top, left = row*half, col*half
+            rows, cols = np.s_[top:top+half], np.s_[left:left+half]
+
+            if index == EMPTY:
+                level[MEAN:MAX+1, rows, cols] = np.nan
+                level[COUNT, rows, cols] = 0.0
+                continue
+
+            reduced = reduce_image(
+                self.lut(index, "celsius", np.float32)[self.tiles[row, col]]
+            )
+            level[:, rows, cols] = reduced[:, :level.shape[1]-top,
+                :level.shape[2]-left]
+
+        self.pyramid = [level]
+
+        for number in range(2, max_level(self.shape) + 1):
+            previous = level
+            level = self._create_level(number)
+
+            for top in range(0, previous.shape[1], self.tile_size):
+                band = reduce_level(previous[:, top:top+self.tile_size])
+                level[:, top//2:top//2 + band.shape[1]] = band
+
+            self.pyramid.append(level)
+
+        for level in self.pyramid:
+            level.flush()
+
+        self.flush()
+
+    def _create_level(self: Self, number: int) -> np.ndarray:
+        """Create the memory-mapped file of a pyramid level."""
+
+        scale = 1 << number
+
+        return np.lib.format.open_memmap(
+            os.path.join(self.directory, PYRAMID_FILE.format(number)),
+            mode="w+", dtype=np.float32,
+            shape=(4, -(-self.height // scale), -(-self.width // scale))
+        )
+
+    def overview(self: Self, level: int, region: Sequence[int],
+            step: int = 1, mode: str = "mean") -> tuple[np.ndarray,
+                tuple[float, float, float, float]]:
+        """
+        Return the Celsius temperatures of a pyramid level covering the
+        region (x0, y0, x1, y1) with exclusive ends, sampling every
+        step-th level pixel, in the mode ("mean", "min", or "max"), and
+        their extent in mosaic coordinates as imshow expects it (left,
+        right, bottom, top).
+        """
+
+        if not 1 <= level <= len(self.pyramid):
+            raise ValueError(f"Invalid pyramid level: {level}")
+        if mode not in MODES:
+            raise ValueError(f"Unknown display mode: {mode}")
+
+        x0, y0, x1, y1 = self._clip(region)
+        scale = 1 << level
+        lx0, ly0 = x0 // scale, y0 // scale
+        lx1, ly1 = -(-x1 // scale), -(-y1 // scale)
+        values = self.pyramid[level-1][MODES[mode], ly0:ly1:step,
+            lx0:lx1:step]
+        rows, cols = values.shape
+
+        return values, (lx0*scale-0.5, (lx0 + cols*step)*scale-0.5,
+            (ly0 + rows*step)*scale-0.5, ly0*scale-0.5)
+
+    def stats(self: Self) -> "MosaicStats":
+        """Return the temperature statistics of the mosaic."""
+
+        return MosaicStats(self)
+
+    def _read(self: Self, region: Optional[Sequence[int]], step: int,
+            dtype: np.typing.DTypeLike, fill: float,
+            convert: Callable[[np.ndarray, int], np.ndarray]) -> np.ndarray:
+        """
+        Return a sampled region of the mosaic with each intersecting
+        non-empty tile converted by the function of its raw data and
+        metadata index, and the fill value elsewhere.
+        """
+
+        if step < 1:
+            raise ValueError("Sampling step must be at least 1")
+
+        x0, y0, x1, y1 = self._clip(region)
+        out = np.full((-(-(y1 - y0) // step), -(-(x1 - x0) // step)), fill,
+            dtype=dtype)
+
+        for row, col, tile, window in self._blocks(x0, y0, x1, y1, step):
+            index = self.index[row, col]
+
+            if index != EMPTY:
+                out[window] = convert(self.tiles[row, col][tile], index)
+
+        return out
+
+    def _clip(self: Self,
+            region: Optional[Sequence[int]]) -> tuple[int, int, int, int]:
+        """Return the region clipped to the mosaic."""
+
+        if region is None:
+            return 0, 0, self.width, self.height
+
+        x0, y0, x1, y1 = (int(value) for value in region)
+        x0, x1 = np.clip((x0, x1), 0, self.width)
+        y0, y1 = np.clip((y0, y1), 0, self.height)
+
+        if x1 <= x0 or y1 <= y0:
+            raise ValueError("Region lies outside the mosaic")
+
+        return int(x0), int(y0), int(x1), int(y1)
+
+    def _blocks(self: Self, x0: int, y0: int, x1: int, y1: int,
+            step: int) -> Iterator[tuple[int, int, tuple[slice, slice],
+                tuple[slice, slice]]]:
+        """
+        Yield the tiles intersecting the region, sampled every step-th
+        pixel from (x0, y0): the tile row and column, the slices of the
+        sampled pixels within the tile, and the slices of the samples
+        in the region.
+        """
+
+        size = self.tile_size
+
+        for row in range(y0 // size, (y1 - 1) // size + 1):
+            rows = _sample(y0, y1, row*size, size, step)
+
+            if rows is None:
+                continue
+
+            for col in range(x0 // size, (x1 - 1) // size + 1):
+                cols = _sample(x0, x1, col*size, size, step)
+
+                if cols is None:
+                    continue
+
+                yield row, col, (rows[0], cols[0]), (rows[1], cols[1])
+
+
+class MosaicStats(ThermalStats):
+    """
+    Temperature statistics of a mosaic. The raw values of every tile
+    are counted per metadata, one tile at a time, and combined through
+    the lookup tables of the metadata, so memory does not grow with the
+    mosaic size.
+    """
+
+    @traced("histogram")
+    def __init__(self: Self, mosaic: ThermalMosaic) -> None:
+        """Initialize a MosaicStats instance by reading every tile."""
+
+        self.mosaic = mosaic
+        counts = np.zeros((len(mosaic.metadata), RANGE_16BIT),
+            dtype=np.int64)
+
+        for (row, col), index in np.ndenumerate(mosaic.index):
+            if index != EMPTY:
+                # Padding of edge tiles holds NODATA and is not counted
+                counts[index] += np.bincount(mosaic.tiles[row, col].ravel(),
+                    minlength=RANGE_16BIT)
+
+        # Distinct values are coded as metadata index and raw value
+        values, temperatures = [], []
+
+        for index, group in enumerate(counts):
+            raw = np.flatnonzero(group)
+            lut = mosaic.lut(index)[raw]
+            valid = ~np.isnan(lut)
+
+            values.append(index*RANGE_16BIT + raw[valid])
+            temperatures.append(lut[valid])
+
+        values = np.concatenate(values or [np.zeros(0, dtype=np.int64)])
+        temperatures = np.concatenate(temperatures or [np.zeros(0)])
+        order = np.argsort(temperatures, kind="stable")
+        values = values[order]
+
+        self._set_histogram(mosaic, values, temperatures[order],
+            counts.ravel()[values])
+
+    def _locate(self: Self, value: int) -> tuple[int, int]:
+        """
+        Return the (x, y) coordinates of the first pixel with the coded
+        value, searching the tiles of its metadata row by row.
+        """
+
+        index, raw = divmod(int(value), RANGE_16BIT)
+        mosaic = self.mosaic
+        size = mosaic.tile_size
+
+        for row in range(mosaic.index.shape[0]):
+            found = []
+
+            for col in np.flatnonzero(mosaic.index[row] == index):
+                ys, xs = np.nonzero(mosaic.tiles[row, col] == raw)
+
+                if ys.size:
+                    # The first match of a tile is its top-left one
+                    found.append((row*size + ys[0], col*size + xs[0]))
+
+            # The first tile row with a match holds the first pixel
+            if found:
+                y, x = min(found)
+                return int(x), int(y)
+
+        raise ValueError("Value not found in the mosaic")
+
+
+def is_mosaic(file_path: str) -> bool:
+    """Return whether the path is the header file of a mosaic."""
+
+    return os.path.basename(file_path) == MOSAIC_FILE
+
+
+def _sample(start: int, stop: int, offset: int, size: int,
+        step: int) -> Optional[tuple[slice, slice]]:
+    """
+    Return the slices of the pixels sampled every step-th pixel from
+    start to stop within the tile at the offset, in the tile and in
+    the samples, or None if the tile holds no sample.
+    """
+
+    first = max(start, offset)
+    first += (start - first) % step
+    last = min(stop, offset + size)
+
+    if first >= last:
+        return None
+
+    count = -(-(last - first) // step)
+    sample = (first - start) // step
+
+    return (slice(first - offset, last - offset, step),
+        slice(sample, sample + count))
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse the command-line arguments."""
+
+    parser = argparse.ArgumentParser(
+        description="Build a tiled thermal mosaic from placed images."
+    )
+    parser.add_argument(
+        "output", help="directory of the new mosaic"
+    )
+    parser.add_argument(
+        "-p", "--place", nargs=3, action="append", required=True,
+        metavar=("FILE", "X", "Y"),
+        help="thermal image and the position of its top-left corner "
+            "(repeatable)"
+    )
+    parser.add_argument(
+        "-s", "--size", nargs=2, type=int, metavar=("WIDTH", "HEIGHT"),
+        help="mosaic size in pixels (default: the extent of the images)"
+    )
+    parser.add_argument(
+        "-t", "--tile-size", type=int, default=DEFAULT_TILE_SIZE,
+        help="tile size in pixels; the display pyramid is built for even "
+            "sizes (default: 512)"
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+    placements = [(path, int(x), int(y)) for path, x, y in args.place]
+
+    if args.size is None:
+        # Images are read twice rather than kept in memory
+        width = height = 0
+
+        for path, x, y in placements:
+            rows, cols = ThermalImage(path).shape
+            width, height = max(width, x + cols), max(height, y + rows)
+    else:
+        width, height = args.size
+
+    with ThermalMosaic.create(args.output, width, height,
+            args.tile_size) as mosaic:
+        for path, x, y in placements:
+            try:
+                mosaic.add_image(ThermalImage(path), x, y)
+            except Exception as error:
+                print(f"{path}: {type(error).__name__}: {error}",
+                    file=sys.stderr)
+                return 1
+
+        if args.tile_size % 2 == 0:
+            mosaic.build_pyramid()
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,215 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Display pyramids of temperature images. Each level halves the previous
+one, keeping the mean, minimum, and maximum of the source pixels below
+every level pixel, so that a zoomed-out view neither aliases nor loses
+hotspots, and drawing costs depend on the screen size only.
+"""
+
+
+from typing import Self, Optional
+
+import numpy as np
+
+
+# Planes of a pyramid level: (4, height, width) float32 arrays
+MEAN, MIN, MAX, COUNT = range(4)
+MODES = {"mean": MEAN, "min": MIN, "max": MAX}
+# Source rows reduced at a time when building the first level (even)
+BAND_ROWS = 256
+
+
+class DisplayPyramid:
+    """
+    Pyramid of a temperature image, built lazily up to the coarsest
+    level requested. Level 0 is the image itself and level k holds one
+    pixel per 2**k by 2**k source pixels, ignoring NaNs.
+    """
+
+    def __init__(self: Self, image: np.ndarray,
+            lut: Optional[np.ndarray] = None) -> None:
+        """
+        Initialize a DisplayPyramid instance over the 2D image. With a
+        lookup table, the image holds raw values and the temperatures
+        are looked up a band of rows at a time, never for the whole
+        image at once.
+        """
+
+        self.image = image
+        self.lut = lut
+        self.shape = image.shape
+        self.levels = []
+
+    @property
+    def max_level(self: Self) -> int:
+        """Return the coarsest level, one pixel high or wide."""
+
+        return max_level(self.shape)
+
+    def level(self: Self, index: int) -> np.ndarray:
+        """Return the planes of a level above 0, building it if needed."""
+
+        if not 1 <= index <= self.max_level:
+            raise ValueError(f"Invalid pyramid level: {index}")
+
+        if not self.levels:
+            self.levels.append(self._reduce_image())
+
+        while len(self.levels) < index:
+            self.levels.append(reduce_level(self.levels[-1]))
+
+        return self.levels[index-1]
+
+    def _values(self: Self, window: tuple[slice, slice]) -> np.ndarray:
+        """Return the temperatures of a window of the image."""
+
+        if self.lut is None:
+            return self.image[window]
+
+        return self.lut[self.image[window]]
+
+    def _reduce_image(self: Self) -> np.ndarray:
+        """Build the first level one band of rows at a time."""
+
+        height, width = self.shape
+        level = np.empty((4, -(-height // 2), -(-width // 2)),
+            dtype=np.float32)
+
+        for top in range(0, height, BAND_ROWS):
+            band = reduce_image(self._values(np.s_[top:top+BAND_ROWS, :]))
+            level[:, top//2:top//2 + band.shape[1]] = band
+
+        return level
+
+    def region(self: Self, index: int, x0: int, y0: int, x1: int, y1: int,
+            mode: str = "mean") -> tuple[np.ndarray,
+                tuple[float, float, float, float]]:
+        """
+        Return the values of the level covering the source region
+        (x0, y0, x1, y1) with exclusive ends, in the mode ("mean",
+        "min", or "max"), and their extent in source coordinates as
+        imshow expects it (left, right, bottom, top).
+        """
+
+        if mode not in MODES:
+            raise ValueError(f"Unknown display mode: {mode}")
+
+        if index == 0:
+            return (self._values(np.s_[y0:y1, x0:x1]),
+                (x0-0.5, x1-0.5, y1-0.5, y0-0.5))
+
+        scale = 1 << index
+        lx0, ly0 = x0 // scale, y0 // scale
+        lx1, ly1 = -(-x1 // scale), -(-y1 // scale)
+        values = self.level(index)[MODES[mode], ly0:ly1, lx0:lx1]
+
+        return values, (lx0*scale-0.5, lx1*scale-0.5, ly1*scale-0.5,
+            ly0*scale-0.5)
+
+
+def max_level(shape: tuple[int, int]) -> int:
+    """Return the coarsest pyramid level of an image of the shape."""
+
+    return max(int(np.ceil(np.log2(max(min(shape), 1)))), 0)
+
+
+def level_for(scale: float, coarsest: int) -> int:
+    """
+    Return the coarsest level with at least one pixel per screen pixel
+    at the scale (source pixels per screen pixel).
+    """
+
+    if scale < 2.0:
+        return 0
+
+    return min(int(np.log2(scale)), coarsest)
+
+
+def reduce_image(image: np.ndarray) -> np.ndarray:
+    """Reduce a 2D image to the planes of the next pyramid level."""
+
+    quadrants = _quadrants(_pad_even(image.astype(np.float32, copy=False),
+        np.nan))
+    level = np.empty((4, *quadrants[0].shape), dtype=np.float32)
+
+    np.fmin(np.fmin(quadrants[0], quadrants[1]),
+        np.fmin(quadrants[2], quadrants[3]), out=level[MIN])
+    np.fmax(np.fmax(quadrants[0], quadrants[1]),
+        np.fmax(quadrants[2], quadrants[3]), out=level[MAX])
+
+    level[COUNT] = sum(~np.isnan(quadrant) for quadrant in quadrants)
+    level[MEAN] = sum(np.nan_to_num(quadrant) for quadrant in quadrants)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        level[MEAN] /= level[COUNT]
+
+    return level
+
+
+def reduce_level(level: np.ndarray) -> np.ndarray:
+    """
+    Reduce the planes of a pyramid level to the next level. Means are
+    weighted by their pixel counts, so they stay exact.
+    """
+
+    padded = _pad_even(level, np.nan)
+
+    # Padding pixels count as no source pixels
+    if padded is not level:
+        np.nan_to_num(padded[COUNT], copy=False)
+
+    quadrants = _quadrants(padded)
+    out = np.empty((4, *quadrants[0].shape[1:]), dtype=np.float32)
+
+    np.fmin(np.fmin(quadrants[0][MIN], quadrants[1][MIN]),
+        np.fmin(quadrants[2][MIN], quadrants[3][MIN]), out=out[MIN])
+    np.fmax(np.fmax(quadrants[0][MAX], quadrants[1][MAX]),
+        np.fmax(quadrants[2][MAX], quadrants[3][MAX]), out=out[MAX])
+
+    out[COUNT] = sum(quadrant[COUNT] for quadrant in quadrants)
+    out[MEAN] = sum(np.nan_to_num(quadrant[MEAN])*quadrant[COUNT]
+        for quadrant in quadrants)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        out[MEAN] /= out[COUNT]
+
+    return out
+
+
+def _pad_even(image: np.ndarray, fill: float) -> np.ndarray:
+    """Pad the last two dimensions of the image to even sizes."""
+
+    rows, cols = image.shape[-2] % 2, image.shape[-1] % 2
+
+    if not rows and not cols:
+        return image
+
+    width = [(0, 0)] * (image.ndim - 2) + [(0, rows), (0, cols)]
+
+    return np.pad(image, width, constant_values=fill)
+
+
+def _quadrants(image: np.ndarray) -> tuple[np.ndarray, ...]:
+    """
+    Return the top-left, top-right, bottom-left, and bottom-right
+    pixels of every 2 by 2 block of the last two dimensions.
+    """
+
+    return (image[..., 0::2, 0::2], image[..., 0::2, 1::2],
+        image[..., 1::2, 0::2], image[..., 1::2, 1::2])
@@ -0,0 +1,107 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Palette rendering of raw thermal data through a 16-bit RGBA lookup
+table, so that changing the palette or color limits only rebuilds the
+table instead of renormalizing and recoloring every pixel.
+"""
+
+
+from typing import Optional
+
+import numpy as np
+import matplotlib
+from matplotlib.colors import Colormap, Normalize
+
+from thermal_image import ThermalImage, RAW_DTYPES
+
+
+def get_colormap(cmap: str | Colormap) -> Colormap:
+    """Return the colormap with the name, or the colormap itself."""
+
+    if isinstance(cmap, Colormap):
+        return cmap
+
+    return matplotlib.colormaps[cmap]
+
+
+def colorize(celsius: np.ndarray, cmap: str | Colormap, vmin: float,
+        vmax: float) -> np.ndarray:
+    """
+    Map temperatures in Celsius to RGBA bytes, exactly as imshow does
+    with the colormap and color limits. NaN temperatures get the
+    colormap's bad color.
+    """
+
+    norm = Normalize(vmin=vmin, vmax=vmax)
+
+    return get_colormap(cmap)(norm(celsius), bytes=True)
+
+
+def palette_lut(calibration: np.ndarray, cmap: str | Colormap, vmin: float,
+        vmax: float) -> np.ndarray:
+    """
+    Return the RGBA colors of all 16-bit raw values for the Celsius
+    calibration curve, packed into one uint32 per value.
+    """
+
+    colors = colorize(calibration, cmap, vmin, vmax)
+
+    return np.ascontiguousarray(colors).view(np.uint32).ravel()
+
+
+def render_raw(raw: np.ndarray, lut: np.ndarray,
+        out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Map the raw uint16 data to an RGBA image with a single gather from
+    the packed palette table.
+    """
+
+    if raw.dtype not in RAW_DTYPES:
+        raise ValueError("Palette rendering requires uint16 raw data")
+
+    if out is None:
+        out = np.empty((*raw.shape, 4), dtype=np.uint8)
+
+    np.take(lut, raw, out=out.view(np.uint32).reshape(raw.shape))
+
+    return out
+
+
+def render(data: ThermalImage, cmap: str | Colormap, vmin: float,
+        vmax: float, out: Optional[np.ndarray] = None,
+        window: tuple[slice, slice] = np.s_[:, :]) -> np.ndarray:
+    """
+    Render the thermal image, or the window of it, as RGBA bytes with
+    the colormap and color limits in Celsius. Images with per-pixel
+    parameter maps have no single calibration curve and are colored
+    from their temperatures.
+    """
+
+    if data.mdata.per_pixel:
+        rgba = colorize(data.celsius[window], cmap, vmin, vmax)
+
+        if out is None:
+            return rgba
+
+        out[...] = rgba
+        return out
+
+    lut = palette_lut(data.calibration_data, cmap, vmin, vmax)
+
+    return render_raw(data.raw[window], lut, out)
@@ -0,0 +1,205 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Region-of-interest statistics backed by summed-area tables (integral
+images) for rectangles and by rasterized masks for polygons.
+"""
+
+
+from typing import Self, Sequence
+
+import numpy as np
+import numpy.typing
+
+
+ROI_FIELDS = ("count", "mean", "std", "min", "max")
+
+
+class IntegralImage:
+    """
+    Summed-area tables of the valid pixel count, the sum, and the sum
+    of squares of an image. Mean and standard deviation of any
+    rectangle cost four lookups per table. Values are stored relative
+    to the image mean to keep the variance numerically stable.
+    """
+
+    def __init__(self: Self, image: np.ndarray) -> None:
+        """
+        Initialize an IntegralImage instance. NaN pixels are excluded
+        from all statistics.
+        """
+
+        self.image = image
+        self.shape = image.shape
+
+        valid = ~np.isnan(image)
+        self.offset = 0.0
+
+        if valid.any():
+            self.offset = float(np.mean(image, where=valid))
+
+        values = np.where(valid, image - self.offset, 0.0)
+
+        self.count = _integral(valid.astype(np.int64))
+        self.sum = _integral(values)
+        self.sum_sq = _integral(values*values)
+
+    def clip(self: Self, rectangles: np.typing.ArrayLike) -> np.ndarray:
+        """
+        Return the rectangles, given as rows of (x0, y0, x1, y1) with
+        exclusive ends, as integers clipped to the image.
+        """
+
+        rectangles = np.asarray(rectangles, dtype=np.int64).reshape(-1, 4)
+        height, width = self.shape
+
+        return np.stack([
+            np.clip(rectangles[:, 0], 0, width),
+            np.clip(rectangles[:, 1], 0, height),
+            np.clip(rectangles[:, 2], 0, width),
+            np.clip(rectangles[:, 3], 0, height)
+        ], axis=1)
+
+    def rectangle_stats(self: Self, rectangles: np.typing.ArrayLike,
+            extrema: bool = False) -> dict[str, np.ndarray]:
+        """
+        Return the count, mean, and std of each rectangle, plus its min
+        and max with extrema. Corners may be given in either order.
+        Count, mean, and std are computed in one vectorized pass over
+        the tables, while min and max read the pixels inside each
+        rectangle, so they are left out unless extrema is set.
+        """
+
+        rectangles = self.clip(rectangles)
+        x0, y0, x1, y1 = rectangles.T
+        x0, x1 = np.minimum(x0, x1), np.maximum(x0, x1)
+        y0, y1 = np.minimum(y0, y1), np.maximum(y0, y1)
+
+        count = _box(self.count, x0, y0, x1, y1)
+        total = _box(self.sum, x0, y0, x1, y1)
+        total_sq = _box(self.sum_sq, x0, y0, x1, y1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = total / count
+            variance = np.maximum(total_sq/count - mean*mean, 0.0)
+
+        stats = {
+            "count": count,
+            "mean": mean + self.offset,
+            "std": np.sqrt(variance)
+        }
+
+        if extrema:
+            stats["min"] = np.full(len(rectangles), np.nan)
+            stats["max"] = np.full(len(rectangles), np.nan)
+
+            for index in np.flatnonzero(count):
+                region = self.image[y0[index]:y1[index],
+                    x0[index]:x1[index]]
+                stats["min"][index] = np.nanmin(region)
+                stats["max"][index] = np.nanmax(region)
+
+        return stats
+
+    def polygon_stats(self: Self,
+            polygons: Sequence[np.typing.ArrayLike]) -> dict[str, np.ndarray]:
+        """
+        Return the count, mean, std, min, and max of each polygon, given
+        as an array of (x, y) vertices. Each polygon is rasterized
+        within its bounding box, and the pixels of all polygons are
+        then reduced together by label, so overlapping polygons are
+        supported.
+        """
+
+        # OpenCV is imported on first use to keep the module light
+        import cv2
+
+        height, width = self.shape
+        indices = []
+        labels = []
+
+        for label, polygon in enumerate(polygons):
+            polygon = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+            x0, y0 = np.clip(np.floor(polygon.min(axis=0)).astype(int),
+                0, (width, height))
+            x1, y1 = np.clip(np.ceil(polygon.max(axis=0)).astype(int) + 1,
+                0, (width, height))
+
+            if x1 <= x0 or y1 <= y0:
+                continue
+
+            mask = np.zeros((y1-y0, x1-x0), dtype=np.uint8)
+            vertices = np.round(polygon - (x0, y0)).astype(np.int32)
+            cv2.fillPoly(img=mask, pts=[vertices], color=1)
+
+            rows, cols = np.nonzero(mask)
+            indices.append((rows + y0)*width + cols + x0)
+            labels.append(np.full(rows.size, label))
+
+        n = len(polygons)
+        index = np.concatenate(indices) if indices else np.zeros(0, int)
+        label = np.concatenate(labels) if labels else np.zeros(0, int)
+        values = self.image.reshape(-1)[index]
+
+        valid = ~np.isnan(values)
+        label, values = label[valid], values[valid] - self.offset
+
+        count = np.bincount(label, minlength=n)
+        total = np.bincount(label, values, minlength=n)
+        total_sq = np.bincount(label, values*values, minlength=n)
+        minimum = np.full(n, np.inf)
+        maximum = np.full(n, -np.inf)
+        np.minimum.at(minimum, label, values)
+        np.maximum.at(maximum, label, values)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = total / count
+            variance = np.maximum(total_sq/count - mean*mean, 0.0)
+
+        empty = count == 0
+        minimum[empty] = np.nan
+        maximum[empty] = np.nan
+
+        return {
+            "count": count.astype(np.int64),
+            "mean": mean + self.offset,
+            "std": np.sqrt(variance),
+            "min": minimum + self.offset,
+            "max": maximum + self.offset
+        }
+
+
+def _integral(array: np.ndarray) -> np.ndarray:
+    """
+    Return the summed-area table of the array, padded with a leading
+    row and column of zeros.
+    """
+
+    dtype = np.float64 if array.dtype.kind == "f" else np.int64
+    table = np.zeros((array.shape[0]+1, array.shape[1]+1), dtype=dtype)
+    np.cumsum(array, axis=0, out=table[1:, 1:])
+    np.cumsum(table[1:, 1:], axis=1, out=table[1:, 1:])
+
+    return table
+
+
+def _box(table: np.ndarray, x0: np.ndarray, y0: np.ndarray, x1: np.ndarray,
+        y1: np.ndarray) -> np.ndarray:
+    """Return the sums of the table over the rectangles."""
+
+    return table[y1, x1] - table[y0, x1] - table[y1, x0] + table[y0, x0]
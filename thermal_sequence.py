@@ -0,0 +1,170 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Streaming reader for multi-frame FLIR radiometric recordings (SEQ and
+CSQ), which store one FFF record per frame.
+"""
+
+
+from typing import Self, Iterator, Optional
+import struct
+import mmap
+
+import numpy as np
+
+from flir import FFFReader, FFF_SIGNATURE
+from thermal_image import ThermalImage, METADATA_KEYS
+from thermal_stats import ThermalStats
+
+
+SEQUENCE_EXTENSIONS = (".seq", ".csq")
+
+
+class ThermalSequence:
+    """
+    Memory-maps a FLIR sequence file and indexes the frame offsets
+    once. Frames are decoded lazily, one at a time, and converted
+    through the shared lookup table cache.
+    """
+
+    def __init__(self: Self, file_path: str,
+            dtype: np.typing.DTypeLike = np.float64) -> None:
+        """
+        Initialize a ThermalSequence instance and index its frames.
+        """
+
+        self.file_path = file_path
+        self.dtype = dtype
+
+        with open(file_path, "rb") as file:
+            self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.offsets = self._index()
+
+        if not self.offsets:
+            self.close()
+            raise ValueError("No frames found in the file")
+
+        # Frames first to last, sharing the metadata of the first one
+        self._run: Optional[tuple[int, int, dict[str, float]]] = None
+
+    def _index(self: Self) -> list[int]:
+        """Find the offset of every frame in the file."""
+
+        offsets = []
+        position = 0
+
+        while (position := self._map.find(FFF_SIGNATURE, position)) != -1:
+            try:
+                reader = FFFReader(memoryview(self._map)[position:])
+            except (ValueError, struct.error):
+                # Not a frame header, e.g. the signature inside pixel data
+                position += 1
+                continue
+
+            offsets.append(position)
+            position += max(reader.size, len(FFF_SIGNATURE))
+
+        return offsets
+
+    def __len__(self: Self) -> int:
+        return len(self.offsets)
+
+    def reader(self: Self, index: int) -> FFFReader:
+        """Return an FFF reader over the frame, without copying it."""
+
+        start = self.offsets[index]
+        end = (self.offsets[index+1] if index + 1 < len(self.offsets)
+            else len(self._map))
+
+        return FFFReader(memoryview(self._map)[start:end])
+
+    def raw(self: Self, index: int) -> np.ndarray:
+        """Return the raw uint16 data of the frame."""
+
+        return self.reader(index).raw_thermal_image()
+
+    def metadata(self: Self, index: int) -> dict[str, float]:
+        """
+        Return the metadata of the frame. Frames without a camera info
+        record inherit the metadata of the closest preceding frame.
+        Only the last run of frames sharing metadata is remembered, so
+        stepping through the sequence reads each record once.
+        """
+
+        if self._run is not None and self._run[0] <= index <= self._run[1]:
+            return self._run[2]
+
+        for current in range(index, -1, -1):
+            if (self._run is not None
+                    and self._run[0] <= current <= self._run[1]):
+                first, metadata = self._run[0], self._run[2]
+                break
+
+            try:
+                info = self.reader(current).camera_info()
+            except ValueError:
+                continue
+
+            first = current
+            metadata = {key: info[key] for key in METADATA_KEYS}
+            break
+        else:
+            raise ValueError("No camera info record in or before the frame")
+
+        self._run = (first, index, metadata)
+
+        return metadata
+
+    def image(self: Self, index: int) -> ThermalImage:
+        """Return the frame as a ThermalImage."""
+
+        return ThermalImage.from_raw(
+            raw=self.raw(index), metadata=self.metadata(index),
+            file_path=self.file_path, dtype=self.dtype
+        )
+
+    def __getitem__(self: Self, index: int) -> ThermalImage:
+        return self.image(range(len(self))[index])
+
+    def __iter__(self: Self) -> Iterator[ThermalImage]:
+        for index in range(len(self)):
+            yield self.image(index)
+
+    def iter_stats(self: Self) -> Iterator[tuple[int, ThermalStats]]:
+        """
+        Yield the index and stats of each frame. Only one frame is held
+        in memory at a time.
+        """
+
+        for index in range(len(self)):
+            raw = self.raw(index)
+            image = ThermalImage.from_raw(raw, self.metadata(index))
+
+            yield index, ThermalStats.from_image(image)
+
+    def close(self: Self) -> None:
+        """Release the memory map."""
+
+        self._map.close()
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *_: object) -> None:
+        self.close()
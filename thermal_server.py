@@ -0,0 +1,534 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Local HTTP analysis service. Uploaded images, or paths on this machine,
+are analyzed by a pool of warm worker processes that keep their
+ExifTool processes and lookup tables between requests, and the stats,
+ROI results, and optionally the float32 temperature array are returned.
+The server only listens on the loopback interface.
+"""
+
+
+from concurrent.futures import ProcessPoolExecutor, Future
+from concurrent.futures.process import BrokenProcessPool
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import (Self, BinaryIO, Callable, Iterator, Optional,
+    Sequence)
+from urllib.parse import urlsplit, parse_qs
+import argparse
+import tempfile
+import threading
+import json
+import math
+import sys
+import os
+
+import numpy as np
+
+from batch import image_stats
+from exiftool_pool import get_pool
+from thermal_image import ThermalImage, TEMPERATURE_UNITS
+from thermal_roi import ROI_FIELDS
+
+
+LOCALHOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+CHUNK_SIZE = 1 << 16
+MAX_UPLOAD_BYTES = 1 << 28
+# Requests admitted per worker; the bodies of later requests stay unread
+QUEUE_DEPTH = 2
+DEFAULT_SUFFIX = ".jpg"
+STATS_HEADER = "X-Thermal-Stats"
+
+
+class RequestError(Exception):
+    """A request the service rejects, with its HTTP status."""
+
+    def __init__(self: Self, status: int, message: str) -> None:
+        """Initialize a RequestError instance."""
+
+        super().__init__(message)
+        self.status = status
+
+
+class ThermalServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server on the loopback interface. Each connection is
+    handled on its own thread, while the analysis itself runs on a
+    fixed pool of worker processes started with the server and
+    replaced if a worker crashes.
+    """
+
+    daemon_threads = True
+
+    def __init__(self: Self, port: int = DEFAULT_PORT,
+            workers: Optional[int] = None) -> None:
+        """
+        Initialize a ThermalServer instance and warm up its workers.
+        Port 0 picks a free port.
+        """
+
+        self.workers = workers or os.cpu_count() or 1
+        self.executor: Optional[ProcessPoolExecutor] = None
+        self.executor_lock = threading.Lock()
+        self.temp: Optional[tempfile.TemporaryDirectory] = None
+
+        # Bind first, so a port in use fails before any worker starts
+        super().__init__((LOCALHOST, port), AnalysisHandler)
+
+        try:
+            self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                initializer=_warm_up)
+            self.slots = threading.BoundedSemaphore(
+                self.workers * QUEUE_DEPTH
+            )
+            self.temp = tempfile.TemporaryDirectory(prefix="thermimpro-")
+
+            # Start every worker now rather than on the first requests
+            futures = [self.executor.submit(os.getpid)
+                for _ in range(self.workers)]
+
+            for future in futures:
+                future.result()
+        except BaseException:
+            self.server_close()
+            raise
+
+    def submit(self: Self, fn: Callable, /, *args: object,
+            **kwargs: object) -> Future:
+        """
+        Submit a call to the worker pool. A pool broken by a crashed
+        worker is replaced first, so a crash fails only the requests
+        that were in flight.
+        """
+
+        with self.executor_lock:
+            try:
+                return self.executor.submit(fn, *args, **kwargs)
+            except BrokenProcessPool:
+                self.executor.shutdown(wait=False)
+                self.executor = ProcessPoolExecutor(
+                    max_workers=self.workers, initializer=_warm_up
+                )
+
+                return self.executor.submit(fn, *args, **kwargs)
+
+    def server_close(self: Self) -> None:
+        """Close the socket, stop the workers, and remove temp files."""
+
+        super().server_close()
+
+        if self.executor is not None:
+            self.executor.shutdown(cancel_futures=True)
+        if self.temp is not None:
+            self.temp.cleanup()
+
+
+class AnalysisHandler(BaseHTTPRequestHandler):
+    """
+    Handles GET /health and POST /analyze. Bodies are read and written
+    in chunks, and a request is admitted only when a worker slot is
+    free, so waiting clients are held back by TCP flow control instead
+    of being buffered.
+    """
+
+    server: ThermalServer
+    server_version = "ThermImPro"
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self: Self) -> None:
+        """Report the service status."""
+
+        if urlsplit(self.path).path != "/health":
+            self._send_json(404, {"error": "Not found"})
+            return
+
+        self._send_json(200, {"status": "ok", "workers": self.server.workers})
+
+    def do_POST(self: Self) -> None:
+        """Analyze an uploaded image or an image path."""
+
+        url = urlsplit(self.path)
+
+        try:
+            if url.path != "/analyze":
+                raise RequestError(404, "Not found")
+
+            query = parse_qs(url.query)
+
+            try:
+                options = _parse_options(query)
+            except ValueError as error:
+                raise RequestError(400, str(error))
+
+            with self.server.slots:
+                self._analyze(query, options)
+        except RequestError as error:
+            # The body may be left unread, so the connection is not reused
+            self.close_connection = True
+            self._send_json(error.status, {"error": str(error)})
+
+    def _analyze(self: Self, query: dict[str, list[str]],
+            options: dict) -> None:
+        """Run the analysis on a worker and send the results."""
+
+        temp_paths = []
+
+        try:
+            if "path" in query:
+                if self._has_body():
+                    raise RequestError(400, "Send either a path or a file")
+
+                file_path = os.path.abspath(query["path"][-1])
+                name = file_path
+
+                if not os.path.isfile(file_path):
+                    raise RequestError(404, f"No such file: {file_path}")
+            else:
+                name = os.path.basename(query.get("name", [""])[-1])
+                suffix = os.path.splitext(name)[1] or DEFAULT_SUFFIX
+                file_path = self._temp_path(suffix)
+                temp_paths.append(file_path)
+
+                with open(file_path, "wb") as file:
+                    self._copy_body(file)
+
+            array_path = None
+
+            if options.pop("temperatures"):
+                array_path = self._temp_path(".npy")
+                temp_paths.append(array_path)
+
+            future = self.server.submit(analyze_file, file_path,
+                array_path=array_path, **options)
+
+            try:
+                result = future.result()
+            except BrokenProcessPool:
+                raise RequestError(500, "The worker process crashed")
+            except Exception as error:
+                raise RequestError(422, f"{type(error).__name__}: {error}")
+
+            result["file"] = name
+
+            if array_path is None:
+                self._send_json(200, result)
+            else:
+                self._send_array(result, array_path)
+        finally:
+            for path in temp_paths:
+                os.remove(path)
+
+    def _temp_path(self: Self, suffix: str) -> str:
+        """Create an empty file in the server's temp directory."""
+
+        fd, path = tempfile.mkstemp(suffix=suffix, dir=self.server.temp.name)
+        os.close(fd)
+
+        return path
+
+    def _has_body(self: Self) -> bool:
+        """Whether the request has a body."""
+
+        return self._chunked() or self._content_length() > 0
+
+    def _content_length(self: Self) -> int:
+        """Return the declared body length."""
+
+        try:
+            return int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            raise RequestError(400, "Invalid Content-Length")
+
+    def _chunked(self: Self) -> bool:
+        """Whether the request body uses chunked transfer encoding."""
+
+        encoding = self.headers.get("Transfer-Encoding", "")
+
+        return encoding.lower() == "chunked"
+
+    def _copy_body(self: Self, file: BinaryIO) -> None:
+        """Copy the request body into the file, a chunk at a time."""
+
+        if self._chunked():
+            chunks = self._read_chunked()
+        else:
+            length = self._content_length()
+
+            if length > MAX_UPLOAD_BYTES:
+                raise RequestError(413, "Upload too large")
+
+            chunks = self._read_length(length)
+
+        size = 0
+
+        for chunk in chunks:
+            size += len(chunk)
+
+            if size > MAX_UPLOAD_BYTES:
+                raise RequestError(413, "Upload too large")
+
+            file.write(chunk)
+
+        if not size:
+            raise RequestError(400, "Send an image file or a path")
+
+    def _read_length(self: Self, length: int) -> Iterator[bytes]:
+        """Yield a body of known length in chunks."""
+
+        while length:
+            chunk = self.rfile.read(min(length, CHUNK_SIZE))
+
+            if not chunk:
+                raise RequestError(400, "Incomplete request body")
+
+            length -= len(chunk)
+            yield chunk
+
+    def _read_chunked(self: Self) -> Iterator[bytes]:
+        """Yield a body in chunked transfer encoding in chunks."""
+
+        while True:
+            line = self.rfile.readline(CHUNK_SIZE)
+
+            try:
+                length = int(line.split(b";")[0], 16)
+            except ValueError:
+                raise RequestError(400, "Invalid chunked encoding")
+
+            if not length:
+                break
+
+            yield from self._read_length(length)
+            self.rfile.readline(CHUNK_SIZE)
+
+        # Skip any trailers
+        while self.rfile.readline(CHUNK_SIZE).strip():
+            pass
+
+    def _send_json(self: Self, status: int, body: dict) -> None:
+        """Send a JSON response."""
+
+        data = _dumps(body).encode()
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_array(self: Self, result: dict, array_path: str) -> None:
+        """
+        Send the temperature array as a .npy file, a chunk at a time,
+        with the results in a JSON header.
+        """
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(os.path.getsize(array_path)))
+        self.send_header(STATS_HEADER, _dumps(result))
+        self.end_headers()
+
+        with open(array_path, "rb") as file:
+            while chunk := file.read(CHUNK_SIZE):
+                self.wfile.write(chunk)
+
+
+def analyze_file(file_path: str,
+        rectangles: Sequence[Sequence[int]] = (),
+        polygons: Sequence[Sequence[tuple[int, int]]] = (),
+        percentiles: Sequence[float] = (), unit: str = "celsius",
+        extrema: bool = False, array_path: Optional[str] = None) -> dict:
+    """
+    Compute the stats of an image and of its rectangle and polygon
+    ROIs, in the unit, and save its float32 temperatures in the unit
+    to the array path, if given. The min and max of rectangles read
+    their pixels and are only computed, and reported, with extrema.
+    """
+
+    data = ThermalImage(file_path)
+    result = image_stats(data, percentiles)
+    result["rois"] = []
+
+    if rectangles:
+        stats = data.rectangle_stats(rectangles, unit, extrema)
+        result["rois"] += _roi_results("rectangle", rectangles, stats)
+    if polygons:
+        stats = data.polygon_stats(polygons, unit)
+        result["rois"] += _roi_results("polygon", polygons, stats)
+
+    if array_path is not None:
+        np.save(array_path, data.temperature(unit, np.float32))
+
+    return result
+
+
+def _roi_results(kind: str, shapes: Sequence, stats: dict) -> list[dict]:
+    """Return the stats of each ROI as a dict."""
+
+    results = []
+
+    for index, shape in enumerate(shapes):
+        entry = {"type": kind, "shape": np.asarray(shape).tolist()}
+        entry.update(
+            (field, float(stats[field][index]))
+            for field in ROI_FIELDS if field in stats
+        )
+        entry["count"] = int(entry["count"])
+        results.append(entry)
+
+    return results
+
+
+def _parse_options(query: dict[str, list[str]]) -> dict:
+    """
+    Parse the analysis options of a query: rectangles as "x0,y0,x1,y1"
+    (roi, repeatable), polygons as "x,y,x,y,..." (polygon, repeatable),
+    percentiles as "q,q,...", the unit, and the flags extrema (min and
+    max of rectangles) and temperatures (return the temperature array).
+    """
+
+    rectangles = [_numbers(value, int) for value in query.get("roi", [])]
+    polygons = [_numbers(value, int) for value in query.get("polygon", [])]
+    percentiles = [
+        q for value in query.get("percentiles", [])
+        for q in _numbers(value, float)
+    ]
+    unit = query.get("unit", ["celsius"])[-1]
+    extrema = _flag(query, "extrema")
+    temperatures = _flag(query, "temperatures")
+
+    if any(len(rectangle) != 4 for rectangle in rectangles):
+        raise ValueError("Rectangles require x0,y0,x1,y1")
+    if any(len(polygon) < 6 or len(polygon) % 2 for polygon in polygons):
+        raise ValueError("Polygons require at least 3 x,y vertices")
+    if any(not 0 <= q <= 100 for q in percentiles):
+        raise ValueError("Percentiles must be between 0 and 100")
+    if unit not in TEMPERATURE_UNITS:
+        raise ValueError(f"Unknown temperature unit: {unit}")
+
+    return {
+        "rectangles": rectangles,
+        "polygons": [list(zip(p[0::2], p[1::2])) for p in polygons],
+        "percentiles": percentiles,
+        "unit": unit,
+        "extrema": extrema,
+        "temperatures": temperatures
+    }
+
+
+def _finite(value: object) -> object:
+    """Replace the non-finite numbers in a JSON value with None."""
+
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    if isinstance(value, (float, np.floating)) and not math.isfinite(value):
+        return None
+
+    return value
+
+
+def _dumps(body: dict) -> str:
+    """
+    Serialize a JSON body, with NaN and infinities (empty regions) as
+    null, since they are not valid JSON.
+    """
+
+    return json.dumps(_finite(body), allow_nan=False)
+
+
+def _flag(query: dict[str, list[str]], name: str) -> bool:
+    """Parse a flag of a query, 0 or 1 (false or true)."""
+
+    value = query.get(name, ["0"])[-1].lower()
+
+    if value not in ("0", "1", "false", "true"):
+        raise ValueError(f"{name} must be 0 or 1")
+
+    return value in ("1", "true")
+
+
+def _numbers(value: str, kind: type) -> list:
+    """Parse a comma-separated list of numbers."""
+
+    try:
+        return [kind(item) for item in value.split(",")]
+    except ValueError:
+        raise ValueError(f"Invalid number list: {value}")
+
+
+def _warm_up() -> None:
+    """
+    Start the ExifTool processes of a worker, so that the first file
+    needing ExifTool does not pay for the startup. Lookup tables stay
+    cached in the worker after the first image of each calibration.
+    """
+
+    for worker in get_pool().workers:
+        try:
+            worker.start()
+        except RuntimeError:
+            # Most files are read natively, without ExifTool
+            return
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse the command-line arguments."""
+
+    parser = argparse.ArgumentParser(
+        description="Serve thermal image analysis over HTTP on localhost."
+    )
+    parser.add_argument(
+        "-p", "--port", type=int, default=DEFAULT_PORT,
+        help=f"port to listen on (default: {DEFAULT_PORT})"
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="number of worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "-c", "--cache", metavar="DIR",
+        help="cache decoded data in this directory"
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+
+    # Worker processes inherit the environment
+    if args.cache:
+        os.environ["THERMIMPRO_CACHE_DIR"] = args.cache
+
+    with ThermalServer(args.port, args.workers) as server:
+        host, port = server.server_address
+        print(f"Serving on http://{host}:{port}", file=sys.stderr)
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
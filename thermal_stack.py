@@ -0,0 +1,327 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Stacks of aligned thermal frames of the same scene, e.g. periodic
+inspections of an asset, for per-pixel time-series and differential
+analysis in single passes over all frames.
+"""
+
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import cached_property
+from typing import Self, Iterable, Optional, Sequence
+
+import numpy as np
+
+from thermal_image import (ThermalImage, METADATA_KEYS, RAW_DTYPES,
+    calibration_key, parse_metadata, temperature_lut, from_celsius)
+from thermal_sequence import ThermalSequence
+from thermal_trace import stage, traced
+
+
+class ThermalStack:
+    """
+    N aligned frames as one contiguous (N, height, width) uint16 array
+    with the metadata of each frame. Frames with the same calibration
+    share a lookup table, and the temperatures of all frames are
+    converted once, on first use.
+    """
+
+    def __init__(self: Self, raw: np.ndarray,
+            metadata: Sequence[dict[str, float]],
+            labels: Optional[Sequence[str]] = None,
+            dtype: np.typing.DTypeLike = np.float64) -> None:
+        """
+        Initialize a ThermalStack instance from the raw uint16 frames
+        and the metadata (values of METADATA_KEYS) of each frame.
+        """
+
+        if raw.ndim != 3 or raw.dtype not in RAW_DTYPES:
+            raise ValueError("Stacks require (frames, height, width) "
+                "uint16 raw data")
+        if len(metadata) != len(raw):
+            raise ValueError("Stacks require the metadata of each frame")
+
+        self.raw = raw
+        self.dtype = np.dtype(dtype)
+        self.labels = (list(labels) if labels is not None
+            else [str(index) for index in range(len(raw))])
+        self.metadata = [
+            {key: float(entry[key]) for key in METADATA_KEYS}
+            for entry in metadata
+        ]
+
+        keys = [calibration_key(parse_metadata(entry))
+            for entry in self.metadata]
+        distinct = list(dict.fromkeys(keys))
+
+        # Index of the lookup table of each frame
+        self.lut_index = np.array([distinct.index(key) for key in keys])
+        self.luts = [
+            temperature_lut(parse_metadata(self.metadata[keys.index(key)]),
+                "celsius", self.dtype)
+            for key in distinct
+        ]
+
+    @classmethod
+    def from_images(cls: type[Self], images: Iterable[ThermalImage],
+            dtype: np.typing.DTypeLike = np.float64) -> Self:
+        """
+        Create a ThermalStack instance from thermal images of the same
+        shape. Images with per-pixel parameter maps cannot be stacked.
+        """
+
+        images = list(images)
+
+        if not images:
+            raise ValueError("Stacks require at least one frame")
+        if any(data.mdata.per_pixel for data in images):
+            raise ValueError("Stacks cannot hold per-pixel parameters")
+        if len({data.shape for data in images}) > 1:
+            raise ValueError("Stacked frames must have the same shape")
+
+        return cls(
+            raw=np.stack([data.raw for data in images]).astype(np.uint16,
+                copy=False),
+            metadata=[data.metadata for data in images],
+            labels=[data.file_path for data in images], dtype=dtype
+        )
+
+    @classmethod
+    def from_sequence(cls: type[Self], sequence: ThermalSequence,
+            dtype: np.typing.DTypeLike = np.float64) -> Self:
+        """Create a ThermalStack instance from the frames of a sequence."""
+
+        raw = None
+
+        for index in range(len(sequence)):
+            frame = sequence.raw(index)
+
+            if raw is None:
+                raw = np.empty((len(sequence), *frame.shape), np.uint16)
+
+            raw[index] = frame
+
+        return cls(
+            raw=raw,
+            metadata=[sequence.metadata(index)
+                for index in range(len(sequence))],
+            labels=[f"{sequence.file_path}[{index}]"
+                for index in range(len(sequence))],
+            dtype=dtype
+        )
+
+    @classmethod
+    @traced("load")
+    def load(cls: type[Self], file_paths: Sequence[str],
+            workers: Optional[int] = None,
+            dtype: np.typing.DTypeLike = np.float64) -> Self:
+        """
+        Load aligned image files into a stack, decoding them across a
+        process pool (or in this process for a single worker). Frames
+        are copied into the stack as they arrive, in file order.
+        """
+
+        if not file_paths:
+            raise ValueError("Stacks require at least one frame")
+
+        raw = None
+        metadata = []
+
+        executor = (ProcessPoolExecutor(max_workers=workers)
+            if workers != 1 else None)
+
+        try:
+            frames = (map(_load_frame, file_paths) if executor is None
+                else executor.map(_load_frame, file_paths))
+
+            for index, (frame, entry) in enumerate(frames):
+                if raw is None:
+                    raw = np.empty((len(file_paths), *frame.shape),
+                        dtype=np.uint16)
+                elif frame.shape != raw.shape[1:]:
+                    raise ValueError(
+                        f"{file_paths[index]}: stacked frames must have "
+                        "the same shape"
+                    )
+
+                raw[index] = frame
+                metadata.append(entry)
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
+
+        return cls(raw, metadata, file_paths, dtype)
+
+    def __len__(self: Self) -> int:
+        return len(self.raw)
+
+    @property
+    def shape(self: Self) -> tuple[int, int]:
+        """Return the frame height and width."""
+
+        return self.raw.shape[1:]
+
+    def image(self: Self, index: int) -> ThermalImage:
+        """Return a frame as a ThermalImage."""
+
+        return ThermalImage.from_raw(self.raw[index], self.metadata[index],
+            self.labels[index], self.dtype)
+
+    @cached_property
+    def celsius(self: Self) -> np.ndarray:
+        """Temperatures of all frames in Celsius."""
+
+        with stage("convert", frames=len(self)):
+            if len(self.luts) == 1:
+                return self.luts[0][self.raw]
+
+            out = np.empty(self.raw.shape, dtype=self.dtype)
+
+            for index, lut in enumerate(self.lut_index):
+                np.take(self.luts[lut], self.raw[index], out=out[index])
+
+            return out
+
+    def temperature(self: Self, unit: str = "celsius") -> np.ndarray:
+        """Return the temperatures of all frames in the unit."""
+
+        return from_celsius(self.celsius, unit)
+
+    def delta(self: Self, baseline: int | np.ndarray = 0,
+            unit: str = "celsius") -> np.ndarray:
+        """
+        Return the temperature difference of every frame from the
+        baseline, a frame index or a temperature map in Celsius, in
+        degrees of the unit.
+        """
+
+        if np.ndim(baseline) == 0:
+            baseline = self.celsius[baseline]
+        elif np.shape(baseline) != self.shape:
+            raise ValueError("Baseline maps must match the frame shape")
+
+        return _scale(self.celsius - baseline, unit)
+
+    def trend(self: Self, times: Optional[np.typing.ArrayLike] = None,
+            unit: str = "celsius") -> tuple[np.ndarray, np.ndarray]:
+        """
+        Return the per-pixel least-squares slope and intercept of the
+        temperature over time. Times default to the frame indices and
+        may be datetime64, giving slopes per day from the first frame.
+        Frames without a valid temperature are skipped per pixel, and
+        pixels with fewer than two valid frames have no trend.
+        """
+
+        times = np.arange(len(self)) if times is None else np.asarray(times)
+
+        if times.shape != (len(self),):
+            raise ValueError("Stacks require one time per frame")
+        if np.issubdtype(times.dtype, np.datetime64):
+            times = (times - times[0]) / np.timedelta64(1, "D")
+
+        # Centered times keep the sums well conditioned
+        origin = times.mean(dtype=np.float64)
+        x = times - origin
+
+        valid = ~np.isnan(self.celsius)
+        y = np.where(valid, self.celsius, 0.0)
+
+        n = valid.sum(axis=0)
+        sx = np.tensordot(x, valid, axes=1)
+        sxx = np.tensordot(x*x, valid, axes=1)
+        sy = y.sum(axis=0)
+        sxy = np.tensordot(x, y, axes=1)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            slope = (n*sxy - sx*sy) / (n*sxx - sx*sx)
+            intercept = (sy - slope*sx) / n - slope*origin
+
+        slope[n < 2] = np.nan
+        intercept[n < 2] = np.nan
+
+        return _scale(slope, unit), from_celsius(intercept, unit)
+
+    def rolling_max(self: Self, window: int,
+            unit: str = "celsius") -> np.ndarray:
+        """
+        Return the per-pixel maximum temperature over each run of
+        window consecutive frames, ignoring frames without a valid
+        temperature: N - window + 1 maps.
+        """
+
+        if not 1 <= window <= len(self):
+            raise ValueError("Window must be between 1 and the frame count")
+
+        count = len(self) - window + 1
+        out = self.celsius[:count].copy()
+
+        for offset in range(1, window):
+            np.fmax(out, self.celsius[offset:offset+count], out=out)
+
+        return from_celsius(out, unit)
+
+    def zscore(self: Self) -> np.ndarray:
+        """
+        Return the per-pixel standard score of every frame: its
+        deviation from the pixel's mean over all frames in standard
+        deviations. Pixels without variation score 0.
+        """
+
+        valid = ~np.isnan(self.celsius)
+        n = valid.sum(axis=0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = np.where(valid, self.celsius, 0.0).sum(axis=0) / n
+            deviation = self.celsius - mean
+            std = np.sqrt(
+                np.where(valid, deviation*deviation, 0.0).sum(axis=0) / n
+            )
+
+        return np.divide(deviation, std, out=np.zeros_like(deviation),
+            where=(std > 0.0) | ~valid)
+
+    def anomalies(self: Self, threshold: float = 3.0) -> np.ndarray:
+        """
+        Return the anomaly maps of all frames: pixels deviating from
+        their mean over all frames by more than threshold standard
+        deviations.
+        """
+
+        return np.abs(self.zscore()) > threshold
+
+
+def _load_frame(file_path: str) -> tuple[np.ndarray, dict[str, float]]:
+    """Load the raw data and metadata of an image file."""
+
+    data = ThermalImage(file_path)
+
+    return np.asarray(data.raw), data.metadata
+
+
+def _scale(difference: np.ndarray, unit: str) -> np.ndarray:
+    """
+    Convert a temperature difference in Celsius to degrees of the unit.
+    """
+
+    if unit in ("celsius", "kelvin"):
+        return difference
+    if unit == "fahrenheit":
+        return difference * 9.0/5.0
+
+    raise ValueError(f"Unknown temperature unit: {unit}")
@@ -0,0 +1,204 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Temperature statistics computed from a histogram of the raw 16-bit
+data instead of the full-size temperature arrays.
+"""
+
+
+from typing import Self, Optional, Sequence
+
+import numpy as np
+
+from thermal_image import (ThermalImage, RANGE_16BIT, RAW_DTYPES,
+    from_celsius)
+from thermal_trace import traced
+
+
+class ThermalStats:
+    """
+    NaN-safe temperature statistics of a raw thermal frame.
+
+    A single bincount over the raw values is combined with the Celsius
+    lookup table, so min, max, mean, percentiles, and histograms cost
+    at most 65536 operations regardless of the frame size. Pixels
+    without a valid temperature are ignored.
+    """
+
+    @traced("histogram")
+    def __init__(self: Self, raw: np.ndarray, lut: np.ndarray) -> None:
+        """
+        Initialize a ThermalStats instance from the raw uint16 data and
+        its Celsius lookup table.
+        """
+
+        if raw.dtype not in RAW_DTYPES:
+            raise ValueError("Statistics require uint16 raw data")
+
+        counts = np.bincount(raw.ravel(), minlength=RANGE_16BIT)
+        values = np.flatnonzero(counts)
+        temperatures = lut[values]
+
+        valid = ~np.isnan(temperatures)
+        values, temperatures = values[valid], temperatures[valid]
+        order = np.argsort(temperatures, kind="stable")
+        values = values[order]
+
+        self._set_histogram(raw, values, temperatures[order], counts[values])
+
+    @classmethod
+    def from_image(cls: type[Self], data: ThermalImage) -> Self:
+        """
+        Create a ThermalStats instance for a thermal image. Images with
+        per-pixel parameter maps have no single lookup table and are
+        summarized from their Celsius temperatures instead.
+        """
+
+        if data.mdata.per_pixel:
+            return cls.from_temperatures(data.temperature("celsius"))
+
+        return cls(data.raw, data.calibration_data)
+
+    @classmethod
+    @traced("histogram")
+    def from_temperatures(cls: type[Self], celsius: np.ndarray) -> Self:
+        """
+        Create a ThermalStats instance from an array of temperatures in
+        Celsius. This sorts the valid temperatures once.
+        """
+
+        stats = cls.__new__(cls)
+        valid = celsius[~np.isnan(celsius)]
+        temperatures, counts = np.unique(valid, return_counts=True)
+
+        stats._set_histogram(celsius, temperatures, temperatures, counts)
+
+        return stats
+
+    def _set_histogram(self: Self, source: np.ndarray, values: np.ndarray,
+            temperatures: np.ndarray, counts: np.ndarray) -> None:
+        """
+        Set the distinct source values (raw values or temperatures)
+        sorted by temperature, with their temperatures and pixel counts.
+        """
+
+        self.source = source
+        self.shape = source.shape
+
+        self.values = values
+        self.temperatures = temperatures
+        self.counts = counts
+        self.cumulative = np.cumsum(self.counts)
+
+        self.count = int(self.cumulative[-1]) if self.cumulative.size else 0
+
+    def max(self: Self, unit: str = "celsius") -> float:
+        """Return the maximum temperature in the unit."""
+
+        if not self.count:
+            return np.nan
+
+        return from_celsius(self.temperatures[-1], unit)
+
+    def min(self: Self, unit: str = "celsius") -> float:
+        """Return the minimum temperature in the unit."""
+
+        if not self.count:
+            return np.nan
+
+        return from_celsius(self.temperatures[0], unit)
+
+    def mean(self: Self, unit: str = "celsius") -> float:
+        """Return the average temperature in the unit."""
+
+        if not self.count:
+            return np.nan
+
+        mean = np.dot(self.counts, self.temperatures) / self.count
+
+        return from_celsius(mean, unit)
+
+    @traced("percentile")
+    def percentile(self: Self, q: float | Sequence[float],
+            unit: str = "celsius") -> float | np.ndarray:
+        """
+        Return the temperature percentiles in the unit, interpolated
+        linearly like np.percentile.
+        """
+
+        q = np.asarray(q, dtype=np.float64)
+
+        if not self.count:
+            return np.full(q.shape, np.nan)[()]
+
+        rank = (self.count-1) * q/100.0
+        lower, upper = np.floor(rank), np.ceil(rank)
+
+        below = self.temperatures[
+            np.searchsorted(self.cumulative, lower, side="right")
+        ]
+        above = self.temperatures[
+            np.searchsorted(self.cumulative, upper, side="right")
+        ]
+
+        return from_celsius(below + (rank-lower)*(above-below), unit)
+
+    def histogram(self: Self, bins: int | Sequence[float] = 256,
+            unit: str = "celsius") -> tuple[np.ndarray, np.ndarray]:
+        """Return the temperature histogram (counts and bin edges)."""
+
+        return np.histogram(
+            a=from_celsius(self.temperatures, unit), bins=bins,
+            weights=self.counts
+        )
+
+    @property
+    def hotspot(self: Self) -> Optional[tuple[int, int]]:
+        """
+        Return the (x, y) coordinates of the hottest pixel, or None if
+        no pixel has a valid temperature.
+        """
+
+        if not self.count:
+            return None
+
+        return self._locate(self.values[-1])
+
+    @property
+    def coldspot(self: Self) -> Optional[tuple[int, int]]:
+        """
+        Return the (x, y) coordinates of the coldest pixel, or None if
+        no pixel has a valid temperature.
+        """
+
+        if not self.count:
+            return None
+
+        return self._locate(self.values[0])
+
+    def _locate(self: Self, value: int) -> tuple[int, int]:
+        """
+        Return the (x, y) coordinates of the first pixel with the source
+        value.
+        """
+
+        index = np.argmax(self.source.ravel() == value)
+        y, x = np.unravel_index(indices=index, shape=self.shape)
+
+        return int(x), int(y)
+
@@ -0,0 +1,275 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Per-stage timing and memory instrumentation. Stages are recorded only
+while tracing is enabled, by the THERMIMPRO_TRACE environment variable
+or by enable(), and can be exported as JSON log records or as a Chrome
+trace (chrome://tracing, Perfetto).
+"""
+
+
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from typing import Callable, Iterator, Optional, TextIO, ContextManager
+import multiprocessing.util
+import multiprocessing
+import tracemalloc
+import threading
+import logging
+import atexit
+import time
+import json
+import os
+
+
+MAX_EVENTS = 100000
+LOGGER = logging.getLogger("thermimpro.trace")
+
+_enabled = False
+_memory = False
+_events = deque(maxlen=MAX_EVENTS)
+_hooks = []
+_local = threading.local()
+_origin = time.perf_counter()
+_null = nullcontext()
+
+
+def enable(memory: bool = False, log: bool = False) -> None:
+    """
+    Start recording stages. With memory set, the peak memory allocated
+    by each stage is traced as well, which slows everything down. With
+    log set, every stage is also logged as JSON.
+    """
+
+    global _enabled, _memory
+
+    _memory = memory
+
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if log and log_hook not in _hooks:
+        if not LOGGER.handlers:
+            LOGGER.addHandler(logging.StreamHandler())
+            LOGGER.setLevel(logging.INFO)
+
+        add_hook(log_hook)
+
+    _enabled = True
+
+
+def disable() -> None:
+    """Stop recording stages and memory tracing."""
+
+    global _enabled, _memory
+
+    _enabled = False
+
+    if _memory and tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+    _memory = False
+
+
+def is_enabled() -> bool:
+    """Return whether stages are recorded."""
+
+    return _enabled
+
+
+def add_hook(hook: Callable[[dict], None]) -> None:
+    """
+    Register a function called with each recorded stage event: a dict
+    with the name, start and duration in seconds, thread and process
+    ids, arguments, and peak memory in bytes (None unless traced).
+    """
+
+    _hooks.append(hook)
+
+
+def remove_hook(hook: Callable[[dict], None]) -> None:
+    """Unregister a hook."""
+
+    _hooks.remove(hook)
+
+
+def log_hook(event: dict) -> None:
+    """Log a stage event as a JSON record."""
+
+    LOGGER.info(json.dumps(event, default=str))
+
+
+def stage(name: str, **args: object) -> ContextManager[None]:
+    """
+    Return a context manager recording the enclosed code as a stage
+    with the arguments, or a shared no-op one while tracing is off.
+    """
+
+    if not _enabled:
+        return _null
+
+    return _record(name, args)
+
+
+@contextmanager
+def _record(name: str, args: dict) -> Iterator[None]:
+    """Record a stage."""
+
+    stack = getattr(_local, "stack", None)
+
+    if stack is None:
+        stack = _local.stack = []
+
+    memory = _memory and tracemalloc.is_tracing()
+
+    if memory:
+        current, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        # Entry: memory at the start, and the highest peak of the
+        # finished child stages
+        stack.append([current, current])
+
+    start = time.perf_counter()
+
+    try:
+        yield
+    finally:
+        end = time.perf_counter()
+        peak = None
+
+        if memory:
+            base, child_peak = stack.pop()
+            peak = max(tracemalloc.get_traced_memory()[1], child_peak)
+
+            # Peaks are reset per stage, so the parent keeps the maximum
+            if stack:
+                stack[-1][1] = max(stack[-1][1], peak)
+
+            tracemalloc.reset_peak()
+            peak -= base
+
+        event = {
+            "name": name,
+            "start": start - _origin,
+            "duration": end - start,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+            "args": args,
+            "peak_bytes": peak
+        }
+        _events.append(event)
+
+        for hook in tuple(_hooks):
+            hook(event)
+
+
+def traced(name: str) -> Callable[[Callable], Callable]:
+    """Return a decorator recording each call as a stage."""
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            if not _enabled:
+                return func(*args, **kwargs)
+
+            with _record(name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def events() -> list[dict]:
+    """Return the recorded stage events, oldest first."""
+
+    return list(_events)
+
+
+def clear() -> None:
+    """Remove the recorded stage events."""
+
+    _events.clear()
+
+
+def write_log(stream: TextIO) -> None:
+    """Write the recorded stage events as JSON Lines."""
+
+    for event in events():
+        stream.write(json.dumps(event, default=str) + "\n")
+
+
+def write_chrome_trace(path: str) -> None:
+    """
+    Write the recorded stage events in the Chrome trace event format,
+    as complete events with microsecond timestamps.
+    """
+
+    trace = []
+
+    for event in events():
+        args = dict(event["args"])
+
+        if event["peak_bytes"] is not None:
+            args["peak_bytes"] = event["peak_bytes"]
+
+        trace.append({
+            "name": event["name"], "cat": "thermimpro", "ph": "X",
+            "ts": event["start"] * 1e6, "dur": event["duration"] * 1e6,
+            "pid": event["pid"], "tid": event["tid"], "args": args
+        })
+
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump({"traceEvents": trace}, file, default=str)
+
+
+def enable_from_environment() -> Optional[str]:
+    """
+    Enable tracing as configured by the THERMIMPRO_TRACE environment
+    variable: a comma-separated list of "log" (JSON log records),
+    "memory" (peak memory per stage), and a file path ending in .json,
+    to which a Chrome trace is written at exit (with the process id
+    inserted in worker processes). Any other non-empty value only
+    records the events. Return the trace file path, if any.
+    """
+
+    value = os.environ.get("THERMIMPRO_TRACE", "")
+    options = {option.strip() for option in value.split(",")} - {""}
+
+    if not options:
+        return None
+
+    enable(memory="memory" in options, log="log" in options)
+    path = next((option for option in options if option.endswith(".json")),
+        None)
+
+    if path is None:
+        return None
+
+    if multiprocessing.parent_process() is None:
+        atexit.register(write_chrome_trace, path)
+    else:
+        # Worker processes skip atexit but run multiprocessing finalizers
+        path = f"{path[:-len('.json')]}.{os.getpid()}.json"
+        multiprocessing.util.Finalize(None, write_chrome_trace,
+            args=(path,), exitpriority=0)
+
+    return path
+
+
+enable_from_environment()
@@ -0,0 +1,418 @@
+# ThermImPro - Thermal Image Processing
+# Copyright (C) 2026 Mykola Melnyk
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Watch-folder ingestion. Directories are polled for new or changed
+images, which are processed as in batch mode once they stop changing,
+on a process pool with a bounded number of files in flight. Processed
+files are recorded in a ledger, so a restarted watcher resumes where
+it stopped.
+"""
+
+
+from concurrent.futures import (ProcessPoolExecutor, Future, wait,
+    FIRST_COMPLETED)
+from concurrent.futures.process import BrokenProcessPool
+from typing import Self, Iterator, Optional, Sequence
+import argparse
+import json
+import time
+import sys
+import os
+
+from batch import (IMAGE_EXTENSIONS, PERCENTILES, QUEUE_DEPTH,
+    process_file, write_results)
+from thermal_export import EXPORT_FORMATS
+
+
+LEDGER_FILE = "ledger.jsonl"
+# Seconds a file must keep its size and modification time
+DEFAULT_SETTLE = 2.0
+DEFAULT_INTERVAL = 1.0
+
+# File size and modification time in nanoseconds
+Signature = tuple[int, int]
+
+
+class Ledger:
+    """
+    Append-only JSON Lines record of the processed files and their
+    signatures. A file is processed again only if it changes.
+    """
+
+    def __init__(self: Self, path: str) -> None:
+        """
+        Initialize a Ledger instance, loading the existing records. A
+        line cut short by a crash is ignored.
+        """
+
+        self.path = path
+        self.entries: dict[str, Signature] = {}
+
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                        self.entries[entry["file"]] = (entry["size"],
+                            entry["mtime_ns"])
+                    except (ValueError, KeyError, TypeError):
+                        continue
+
+        self._file = open(path, "a", encoding="utf-8")
+
+    def __contains__(self: Self, item: tuple[str, Signature]) -> bool:
+        path, signature = item
+
+        return self.entries.get(path) == signature
+
+    def record(self: Self, path: str, signature: Signature,
+            error: Optional[str] = None) -> None:
+        """Record a processed file, flushing the record to disk."""
+
+        entry = {"file": path, "size": signature[0],
+            "mtime_ns": signature[1]}
+
+        if error is not None:
+            entry["error"] = error
+
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+        self.entries[path] = signature
+
+    def close(self: Self) -> None:
+        """Close the ledger file."""
+
+        self._file.close()
+
+    def __enter__(self: Self) -> Self:
+        return self
+
+    def __exit__(self: Self, *_: object) -> None:
+        self.close()
+
+
+class FolderWatcher:
+    """
+    Polls directories for images that are not in the ledger. A file is
+    ready once its signature is unchanged for the settle time, so files
+    still being uploaded are left alone.
+    """
+
+    def __init__(self: Self, directories: Sequence[str], ledger: Ledger,
+            settle: float = DEFAULT_SETTLE, recursive: bool = False,
+            exclude: Sequence[str] = ()) -> None:
+        """
+        Initialize a FolderWatcher instance. Excluded directories, such
+        as the export directory, are not descended into.
+        """
+
+        self.directories = [os.path.abspath(path) for path in directories]
+        self.ledger = ledger
+        self.settle = settle
+        self.recursive = recursive
+        self.exclude = {os.path.abspath(path) for path in exclude}
+
+        # Unsettled files, with the signature and time they were seen
+        self.pending: dict[str, tuple[Signature, float]] = {}
+        # Settled files, oldest first
+        self.ready: dict[str, Signature] = {}
+        # Files handed out and not yet finished
+        self.active: set[str] = set()
+
+    def _files(self: Self) -> Iterator[tuple[str, Signature]]:
+        """Yield the images in the directories with their signatures."""
+
+        stack = list(self.directories)
+
+        while stack:
+            try:
+                entries = list(os.scandir(stack.pop()))
+            except OSError:
+                # Unmounted shares and removed folders are retried later
+                continue
+
+            for entry in entries:
+                try:
+                    if entry.is_dir():
+                        if self.recursive and entry.path not in self.exclude:
+                            stack.append(entry.path)
+                    elif entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                        stat = entry.stat()
+                        yield entry.path, (stat.st_size, stat.st_mtime_ns)
+                except OSError:
+                    continue
+
+    def scan(self: Self) -> None:
+        """
+        Scan the directories, moving the files that stayed unchanged
+        for the settle time to the ready files.
+        """
+
+        now = time.monotonic()
+        seen = set()
+        settled = []
+
+        for path, signature in self._files():
+            seen.add(path)
+
+            if path in self.active or (path, signature) in self.ledger:
+                continue
+            if self.ready.get(path, signature) != signature:
+                del self.ready[path]
+            elif path in self.ready:
+                continue
+
+            previous = self.pending.get(path)
+
+            if previous is None or previous[0] != signature:
+                self.pending[path] = (signature, now)
+            elif now - previous[1] >= self.settle:
+                settled.append((path, signature))
+
+        # Forget files that were removed before they were processed
+        for files in (self.pending, self.ready):
+            for path in files.keys() - seen:
+                del files[path]
+
+        for path, signature in sorted(settled, key=lambda item: item[1][1]):
+            del self.pending[path]
+            self.ready[path] = signature
+
+    def take(self: Self, limit: int) -> list[tuple[str, Signature]]:
+        """
+        Return up to limit ready files, oldest first. They are not
+        returned again until finished.
+        """
+
+        taken = []
+
+        for path in list(self.ready)[:limit]:
+            taken.append((path, self.ready.pop(path)))
+            self.active.add(path)
+
+        return taken
+
+    def finish(self: Self, path: str) -> None:
+        """Mark a file returned by take as finished."""
+
+        self.active.discard(path)
+
+    @property
+    def idle(self: Self) -> bool:
+        """Whether no file is waiting to settle or to be taken."""
+
+        return not self.pending and not self.ready
+
+
+def watch(watcher: FolderWatcher, workers: Optional[int] = None,
+        interval: float = DEFAULT_INTERVAL, once: bool = False,
+        percentiles: Sequence[float] = PERCENTILES,
+        dtype: str = "float64", export: Optional[str] = None,
+        export_formats: Sequence[str] = ("png",)) -> Iterator[dict]:
+    """
+    Process the files of the watcher as they become ready, yielding
+    results in completion order and recording each file in the ledger.
+    The directories are scanned once per interval, and at most
+    QUEUE_DEPTH files per worker are in flight, so memory use does not
+    grow with a backlog. A crashed worker process is replaced; the files
+    in flight are then retried one at a time, and one that crashes a
+    worker on its own is recorded as failed. With once, stop when no
+    file is left to do.
+    """
+
+    workers = workers or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(max_workers=workers)
+    capacity = workers * QUEUE_DEPTH
+    running: dict[Future, tuple[str, Signature]] = {}
+    # Files in flight when a worker crashed, retried one at a time
+    suspects: list[tuple[str, Signature]] = []
+    scanned = -interval
+
+    try:
+        while True:
+            # Completions hand out ready files without rescanning
+            if time.monotonic() - scanned >= interval:
+                watcher.scan()
+                scanned = time.monotonic()
+
+            if suspects:
+                files = [] if running else [suspects.pop(0)]
+            else:
+                files = watcher.take(capacity - len(running))
+
+            for path, signature in files:
+                future = executor.submit(process_file, path, percentiles,
+                    dtype, export, export_formats)
+                running[future] = (path, signature)
+
+            if once and not running and not suspects and watcher.idle:
+                return
+
+            timeout = max(scanned + interval - time.monotonic(), 0.0)
+
+            if running:
+                done, _ = wait(running, timeout=timeout,
+                    return_when=FIRST_COMPLETED)
+            else:
+                done = ()
+                time.sleep(timeout)
+
+            crashed = []
+
+            if any(isinstance(future.exception(), BrokenProcessPool)
+                    for future in done):
+                # Every file in flight fails with the pool
+                executor.shutdown(wait=False)
+                executor = ProcessPoolExecutor(max_workers=workers)
+                done, _ = wait(running)
+
+            for future in done:
+                path, signature = running.pop(future)
+
+                if isinstance(future.exception(), BrokenProcessPool):
+                    crashed.append((path, signature))
+                    continue
+
+                result = future.result()
+
+                watcher.ledger.record(path, signature, result.get("error"))
+                watcher.finish(path)
+
+                yield result
+
+            # A file that crashed a worker on its own is recorded as
+            # failed, so it is not retried on every restart
+            if len(crashed) == 1:
+                path, signature = crashed[0]
+                error = "BrokenProcessPool: the worker process crashed"
+
+                watcher.ledger.record(path, signature, error)
+                watcher.finish(path)
+
+                yield {"file": path, "error": error}
+            else:
+                suspects += crashed
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse the command-line arguments."""
+
+    parser = argparse.ArgumentParser(
+        description="Watch directories and compute temperature stats for "
+            "new radiometric thermal images."
+    )
+    parser.add_argument(
+        "directories", nargs="+", help="directories to watch"
+    )
+    parser.add_argument(
+        "-l", "--ledger", default=LEDGER_FILE,
+        help=f"processed-file ledger (default: {LEDGER_FILE})"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-",
+        help="output file, appended to (default: standard output)"
+    )
+    parser.add_argument(
+        "-r", "--recursive", action="store_true",
+        help="watch subdirectories as well"
+    )
+    parser.add_argument(
+        "-s", "--settle", type=float, default=DEFAULT_SETTLE,
+        help="seconds a file must stay unchanged before it is processed "
+            f"(default: {DEFAULT_SETTLE:g})"
+    )
+    parser.add_argument(
+        "-i", "--interval", type=float, default=DEFAULT_INTERVAL,
+        help=f"seconds between scans (default: {DEFAULT_INTERVAL:g})"
+    )
+    parser.add_argument(
+        "--once", action="store_true",
+        help="exit once the current files are processed"
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None,
+        help="number of worker processes (default: CPU count)"
+    )
+    parser.add_argument(
+        "-p", "--percentiles", type=float, nargs="*", default=PERCENTILES,
+        help="Celsius percentiles to report (default: 0 to 100)"
+    )
+    parser.add_argument(
+        "-c", "--cache", metavar="DIR",
+        help="cache decoded data in this directory"
+    )
+    parser.add_argument(
+        "-d", "--dtype", choices=("float64", "float32", "float16"),
+        default="float64",
+        help="temperature array dtype (default: float64)"
+    )
+    parser.add_argument(
+        "-e", "--export", metavar="DIR",
+        help="also export each image into this directory, which is not "
+            "watched"
+    )
+    parser.add_argument(
+        "--export-formats", nargs="+", choices=tuple(EXPORT_FORMATS),
+        default=("png",),
+        help="export formats (default: png)"
+    )
+
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = parse_args(argv)
+
+    # Worker processes inherit the environment
+    if args.cache:
+        os.environ["THERMIMPRO_CACHE_DIR"] = args.cache
+
+    exclude = [args.export] if args.export else []
+
+    # Exports into a watched directory would be processed and exported
+    # again without end
+    if args.export and os.path.abspath(args.export) in (
+            os.path.abspath(path) for path in args.directories):
+        print("The export directory must not be a watched directory",
+            file=sys.stderr)
+        return 1
+
+    with Ledger(args.ledger) as ledger:
+        watcher = FolderWatcher(args.directories, ledger, args.settle,
+            args.recursive, exclude)
+        results = watch(watcher, args.workers, args.interval, args.once,
+            args.percentiles, args.dtype, args.export, args.export_formats)
+
+        try:
+            if args.output == "-":
+                failures = write_results(results, sys.stdout, "jsonl")
+            else:
+                with open(args.output, "a", encoding="utf-8") as stream:
+                    failures = write_results(results, stream, "jsonl")
+        except KeyboardInterrupt:
+            return 0
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())